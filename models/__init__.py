@@ -4,6 +4,14 @@ Models package for Synth Analog Experiments.
 This package contains both baseline forecasting models and analog-inspired approaches.
 """
 
+from .base import PathModel
+from .result import SimulationResult, format_paths
+from .rng import make_rng, spawn_rngs
+from .timegrid import TimeGrid, time_grid
+from .registry import ModelRegistry
+from .calibration import CalibrationScheduler, CalibrationSnapshot, CalibrationStore
+from .pregeneration import PregenerationService
+from .weight_optimizer import ComponentPathCache, optimize_weights
 from .baseline import *
 from .analog import *
 
@@ -5,13 +5,14 @@ These models explore continuous, fluid-like mathematical relationships
 inspired by analog computing principles.
 """
 
+from .fluid_dynamics import FluidDynamicsModel
+
 # TODO: Import analog models as they are implemented
-# from .fluid_dynamics import FluidDynamicsModel
 # from .wave_propagation import WavePropagationModel
 # from .resonance import ResonanceModel
 
 __all__ = [
-    # "FluidDynamicsModel",
+    "FluidDynamicsModel",
     # "WavePropagationModel", 
     # "ResonanceModel"
 ]
@@ -6,11 +6,13 @@ like a liquid responding to pressure gradients and turbulence.
 """
 
 import numpy as np
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Dict, Any
 
+from ..base import PathModel
+from ..rng import SeedLike
 
-class FluidDynamicsModel:
+
+class FluidDynamicsModel(PathModel):
     """
     Fluid dynamics-inspired model for price prediction.
     
@@ -21,10 +23,16 @@ class FluidDynamicsModel:
     - Volume acts like fluid density
     """
     
+    INTEGRATORS = ("euler", "rk2", "rk4")
+    
     def __init__(self, 
                  viscosity: float = 0.1,
                  pressure_gradient: float = 0.0,
-                 turbulence_strength: float = 0.05):
+                 turbulence_strength: float = 0.05,
+                 integrator: str = "euler",
+                 substeps: int = 1,
+                 rng: SeedLike = None,
+                 dtype=np.float64):
         """
         Initialize the fluid dynamics model.
         
@@ -32,30 +40,47 @@ class FluidDynamicsModel:
             viscosity: How "thick" the market fluid is (affects price momentum)
             pressure_gradient: Market sentiment pressure (positive = bullish, negative = bearish)
             turbulence_strength: Random market noise strength
+            integrator: "euler" (fixed-step), "rk2" or "rk4"
+            substeps: Number of integrator sub-steps per time increment
+            rng: Seed or numpy Generator for the model's random stream
+            dtype: Path dtype, np.float64 (default) or np.float32
         """
+        if integrator not in self.INTEGRATORS:
+            raise ValueError(f"Unknown integrator '{integrator}', expected one of {self.INTEGRATORS}")
+        if substeps < 1:
+            raise ValueError("substeps must be at least 1")
+        
         self.viscosity = viscosity
         self.pressure_gradient = pressure_gradient
         self.turbulence_strength = turbulence_strength
+        self.integrator = integrator
+        self.substeps = substeps
+        self.rng = rng
+        self.dtype = dtype
         self.name = "Fluid Dynamics Analog"
         
-    def predict(self, 
-                start_price: float,
-                start_time: datetime,
-                time_increment: int = 300,  # 5 minutes in seconds
-                time_horizon: int = 86400,  # 24 hours in seconds
-                num_simulations: int = 100) -> List[List[Dict[str, Any]]]:
+    def simulate(self,
+                 start_price: float,
+                 n_steps: int,
+                 n_sims: int,
+                 rng=None,
+                 time_increment: int = 300) -> np.ndarray:
         """
-        Generate price predictions using fluid dynamics principles.
+        Integrate the (price, velocity) state of all simulations together.
+        
+        Turbulence is drawn once per time increment and held constant across
+        the integrator sub-steps, so the cost per step is independent of the
+        number of paths in Python terms.
         
         Args:
             start_price: Starting price of the asset
-            start_time: When predictions should start
-            time_increment: Time between predictions in seconds
-            time_horizon: Total prediction horizon in seconds
-            num_simulations: Number of simulation paths to generate
+            n_steps: Number of time steps after the start
+            n_sims: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+            time_increment: Time between steps in seconds
             
         Returns:
-            List of simulation paths, each containing price predictions
+            Array of shape (n_sims, n_steps + 1); column 0 is the start price
         """
         # TODO: Implement full fluid dynamics model:
         # - Navier-Stokes equations for price flow
@@ -70,45 +95,75 @@ class FluidDynamicsModel:
         # - How does information flow create pressure gradients?
         # - Can we use computational fluid dynamics (CFD) techniques?
         
-        # Placeholder implementation - replace with actual fluid dynamics
-        num_steps = int(time_horizon / time_increment)
-        predictions = []
+        shocks = self._standard_normal(rng, (n_sims, n_steps))
+        
+        dt = time_increment / 3600  # Time step in hours
+        h = dt / self.substeps
+        step_fn = getattr(self, f"_{self.integrator}_step")
         
-        for sim in range(num_simulations):
-            path = []
-            current_price = start_price
-            velocity = 0.0  # Price velocity (momentum)
+        paths = np.empty((n_sims, n_steps + 1), dtype=self.dtype)
+        paths[:, 0] = start_price
+        price = paths[:, 0].copy()
+        velocity = np.zeros(n_sims, dtype=self.dtype)  # Price velocity (momentum)
+        
+        for step in range(n_steps):
+            # Turbulence (random market noise), scaled by the current price
+            turbulence = float(self.turbulence_strength) * price * shocks[:, step]
             
-            for step in range(num_steps + 1):
-                current_time = start_time + timedelta(seconds=step * time_increment)
-                
-                # TODO: Replace with actual fluid dynamics equations
-                # For now, using a simplified momentum-based approach
-                
-                # Pressure force (market sentiment)
-                pressure_force = self.pressure_gradient * current_price
-                
-                # Viscous drag (momentum decay)
-                viscous_drag = -self.viscosity * velocity
-                
-                # Turbulence (random market noise)
-                turbulence = np.random.normal(0, self.turbulence_strength * current_price)
-                
-                # Update velocity (momentum)
-                velocity += (pressure_force + viscous_drag + turbulence) * time_increment / 3600
-                
-                # Update price
-                current_price += velocity * time_increment / 3600
-                current_price = max(current_price, 0.01)
-                
-                path.append({
-                    "time": current_time.isoformat(),
-                    "price": current_price
-                })
+            for _ in range(self.substeps):
+                price, velocity = step_fn(price, velocity, turbulence, h)
             
-            predictions.append(path)
+            price = np.maximum(price, 0.01)
+            paths[:, step + 1] = price
+        
+        return paths
+    
+    def _acceleration(self, price: np.ndarray, velocity: np.ndarray,
+                      turbulence: np.ndarray) -> np.ndarray:
+        """
+        Net force acting on the price fluid.
+        
+        TODO: Replace with actual fluid dynamics equations
+        For now, using a simplified momentum-based approach
+        """
+        # Pressure force (market sentiment)
+        pressure_force = float(self.pressure_gradient) * price
+        
+        # Viscous drag (momentum decay)
+        viscous_drag = -float(self.viscosity) * velocity
+        
+        return pressure_force + viscous_drag + turbulence
+    
+    def _euler_step(self, price, velocity, turbulence, h):
+        """Semi-implicit Euler: update velocity, then price with the new velocity."""
+        velocity = velocity + self._acceleration(price, velocity, turbulence) * h
+        return price + velocity * h, velocity
+    
+    def _rk2_step(self, price, velocity, turbulence, h):
+        """Midpoint (second-order Runge-Kutta) step."""
+        a1 = self._acceleration(price, velocity, turbulence)
+        mid_price = price + 0.5 * h * velocity
+        mid_velocity = velocity + 0.5 * h * a1
+        a2 = self._acceleration(mid_price, mid_velocity, turbulence)
+        return price + h * mid_velocity, velocity + h * a2
+    
+    def _rk4_step(self, price, velocity, turbulence, h):
+        """Classic fourth-order Runge-Kutta step."""
+        k1_p = velocity
+        k1_v = self._acceleration(price, velocity, turbulence)
+        
+        k2_p = velocity + 0.5 * h * k1_v
+        k2_v = self._acceleration(price + 0.5 * h * k1_p, k2_p, turbulence)
+        
+        k3_p = velocity + 0.5 * h * k2_v
+        k3_v = self._acceleration(price + 0.5 * h * k2_p, k3_p, turbulence)
+        
+        k4_p = velocity + h * k3_v
+        k4_v = self._acceleration(price + h * k3_p, k4_p, turbulence)
         
-        return predictions
+        new_price = price + h / 6 * (k1_p + 2 * k2_p + 2 * k3_p + k4_p)
+        new_velocity = velocity + h / 6 * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+        return new_price, new_velocity
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the model."""
@@ -118,6 +173,8 @@ class FluidDynamicsModel:
             "viscosity": self.viscosity,
             "pressure_gradient": self.pressure_gradient,
             "turbulence_strength": self.turbulence_strength,
+            "integrator": self.integrator,
+            "substeps": self.substeps,
             "description": "Fluid dynamics-inspired price modeling (placeholder)"
         }
 
@@ -0,0 +1,146 @@
+"""
+Common interface for path-simulating forecasting models.
+
+Every model produces its simulation paths as a (num_simulations, num_steps + 1)
+price array. The Synth list-of-dicts format is only built at the edge, by
+SimulationResult / format_paths, so ensembles and CRPS scoring can work on arrays end to end.
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+from datetime import datetime
+
+from .result import SimulationResult
+from .rng import make_rng, SeedLike
+from .sampling import SAMPLING_METHODS, standard_normals, resolve_dtype
+
+
+class PathModel(ABC):
+    """
+    Base class for models that simulate price paths.
+
+    Subclasses implement simulate(); simulate_array() and predict() are shared.
+    Each model owns a numpy Generator (self.rng) used whenever no rng is
+    passed explicitly, a sampling method for its normal shocks, and the
+    floating point dtype of its paths.
+    """
+
+    name = "Path Model"
+    _sampling = "plain"
+    _dtype = np.dtype(np.float64)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating point dtype of simulated paths (float64 or float32)."""
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        self._dtype = resolve_dtype(dtype)
+
+    @property
+    def sampling(self) -> str:
+        """Shock sampling method, one of models.sampling.SAMPLING_METHODS."""
+        return self._sampling
+
+    @sampling.setter
+    def sampling(self, method: str):
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method '{method}', expected one of {SAMPLING_METHODS}")
+        self._sampling = method
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """The model's default random Generator (PCG64)."""
+        if getattr(self, "_rng", None) is None:
+            self._rng = make_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, seed: SeedLike):
+        self._rng = make_rng(seed)
+
+    @abstractmethod
+    def simulate(self,
+                 start_price: float,
+                 n_steps: int,
+                 n_sims: int,
+                 rng=None,
+                 time_increment: int = 300) -> np.ndarray:
+        """
+        Simulate price paths.
+
+        Args:
+            start_price: Starting price of the asset
+            n_steps: Number of time steps after the start
+            n_sims: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+            time_increment: Time between steps in seconds
+
+        Returns:
+            Array of shape (n_sims, n_steps + 1); column 0 is the start price
+        """
+
+    def simulate_array(self,
+                       start_price: float,
+                       time_increment: int = 300,  # 5 minutes in seconds
+                       time_horizon: int = 86400,  # 24 hours in seconds
+                       num_simulations: int = 100,
+                       rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Simulate paths over a time horizon.
+
+        Returns:
+            Array of shape (num_simulations, num_steps + 1); column 0 is the start price
+        """
+        num_steps = int(time_horizon / time_increment)
+        return self.simulate(start_price, num_steps, num_simulations,
+                             rng=rng, time_increment=time_increment)
+
+    def predict(self,
+                start_price: float,
+                start_time: datetime,
+                time_increment: int = 300,  # 5 minutes in seconds
+                time_horizon: int = 86400,  # 24 hours in seconds
+                num_simulations: int = 100,
+                rng: np.random.Generator = None) -> List[List[Dict[str, Any]]]:
+        """
+        Generate price predictions in Synth subnet format.
+
+        Args:
+            start_price: Starting price of the asset
+            start_time: When predictions should start
+            time_increment: Time between predictions in seconds
+            time_horizon: Total prediction horizon in seconds
+            num_simulations: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+
+        Returns:
+            List of simulation paths, each containing price predictions
+        """
+        return self.simulate_result(start_price, start_time, time_increment,
+                                    time_horizon, num_simulations, rng).to_list()
+
+    def simulate_result(self,
+                        start_price: float,
+                        start_time: datetime,
+                        time_increment: int = 300,  # 5 minutes in seconds
+                        time_horizon: int = 86400,  # 24 hours in seconds
+                        num_simulations: int = 100,
+                        rng: np.random.Generator = None) -> SimulationResult:
+        """
+        Simulate paths and wrap them with their time grid.
+
+        Returns:
+            SimulationResult that formats to the Synth structure on demand
+        """
+        paths = self.simulate_array(start_price, time_increment, time_horizon,
+                                    num_simulations, rng)
+        return SimulationResult(paths, start_time, time_increment)
+
+    def _standard_normal(self, rng, size) -> np.ndarray:
+        """Draw standard normal shocks from rng, or the model's own Generator."""
+        if rng is None:
+            rng = self.rng
+        return standard_normals(rng, size, self.sampling, self.dtype)
@@ -8,9 +8,11 @@ to compare against our analog-inspired models.
 from .random_walk import RandomWalkModel
 from .geometric_brownian import GeometricBrownianModel
 from .mean_reversion import MeanReversionModel
+from .multi_asset import MultiAssetGBMModel
 
 __all__ = [
     "RandomWalkModel",
     "GeometricBrownianModel", 
-    "MeanReversionModel"
+    "MeanReversionModel",
+    "MultiAssetGBMModel"
 ]
@@ -0,0 +1,157 @@
+"""
+Incremental local store of OHLC bars per ticker.
+
+Calibration used to re-download the whole 2-day window of 5-minute bars on
+every refresh. The store keeps bars on disk (one columnar .npz file per
+ticker), fetches only bars from the last cached timestamp onwards, merges and
+deduplicates them, and serves any period from disk.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+_PERIOD_UNITS = {"m": "minutes", "h": "hours", "d": "days", "wk": "weeks"}
+
+
+def period_to_timedelta(period: str) -> timedelta:
+    """Convert a yfinance-style period ('90m', '12h', '2d', '1wk') to a timedelta."""
+    match = re.fullmatch(r"(\d+)(m|h|d|wk)", period)
+    if match is None:
+        raise ValueError(f"Unsupported period '{period}', expected e.g. '90m', '12h', '2d' or '1wk'")
+    return timedelta(**{_PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+
+
+class BarStore:
+    """
+    On-disk OHLC bars per ticker, time-indexed (UTC) and deduplicated.
+
+    fetch(ticker, start, period) must return a DataFrame with a DatetimeIndex
+    and Open/High/Low/Close/Volume columns: bars from start onwards, or the
+    last period of bars when start is None.
+    """
+
+    def __init__(self,
+                 root: str,
+                 fetch: Callable[[str, Optional[pd.Timestamp], Optional[str]], pd.DataFrame],
+                 interval: str = "5m",
+                 retention: str = "7d"):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for the .npz files (created on first save)
+            fetch: Bar download function, see class docstring
+            interval: Bar interval, part of the file name
+            retention: Bars older than this (relative to the newest bar) are dropped
+        """
+        self.root = root
+        self.fetch = fetch
+        self.interval = interval
+        self.retention = period_to_timedelta(retention)
+        self._bars: Dict[str, pd.DataFrame] = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def path(self, ticker: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_-]", "_", ticker)
+        return os.path.join(self.root, f"{safe}_{self.interval}.npz")
+
+    def load(self, ticker: str) -> pd.DataFrame:
+        """Cached bars for a ticker (empty DataFrame if none)."""
+        if ticker not in self._bars:
+            self._bars[ticker] = self._read(ticker)
+        return self._bars[ticker]
+
+    def merge(self, ticker: str, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge new bars into the store and persist them.
+
+        Later rows win for duplicate timestamps, so a bar that was still
+        forming at the last fetch is replaced by its final values.
+        """
+        with self._lock(ticker):
+            merged = self._merge(self.load(ticker), bars)
+            self._bars[ticker] = merged
+            self._write(ticker, merged)
+            return merged
+
+    def update(self, ticker: str, period: str = "2d") -> pd.DataFrame:
+        """
+        Fetch the bars missing since the last cached one (or period of bars
+        for an empty store) and merge them.
+
+        Returns:
+            All stored bars for the ticker
+        """
+        with self._lock(ticker):
+            cached = self.load(ticker)
+            newest = cached.index[-1] if len(cached) else None
+            stale = newest is None or newest < pd.Timestamp.now(tz="UTC") - period_to_timedelta(period)
+            bars = self.fetch(ticker, None if stale else newest, period if stale else None)
+            if bars is None or bars.empty:
+                return cached
+            return self.merge(ticker, bars)
+
+    def get(self, ticker: str, period: str = "2d", refresh: bool = True) -> pd.DataFrame:
+        """
+        Bars covering the last period, served from disk.
+
+        Args:
+            ticker: Ticker symbol
+            period: Window to return, relative to the newest bar
+            refresh: Fetch new bars first
+        """
+        bars = self.update(ticker, period) if refresh else self.load(ticker)
+        if bars.empty:
+            return bars
+        return bars[bars.index > bars.index[-1] - period_to_timedelta(period)]
+
+    def _merge(self, cached: pd.DataFrame, bars: pd.DataFrame) -> pd.DataFrame:
+        bars = bars[list(COLUMNS)].astype(np.float64)
+        bars.index = pd.DatetimeIndex(bars.index).tz_convert("UTC") if bars.index.tz else \
+            pd.DatetimeIndex(bars.index).tz_localize("UTC")
+        merged = pd.concat([cached, bars]) if len(cached) else bars
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        return merged[merged.index >= merged.index[-1] - self.retention]
+
+    def _read(self, ticker: str) -> pd.DataFrame:
+        path = self.path(ticker)
+        if not os.path.exists(path):
+            return self._empty()
+        try:
+            with np.load(path) as data:
+                index = pd.to_datetime(data["time"], unit="ns", utc=True)
+                return pd.DataFrame({column: data[column] for column in COLUMNS}, index=index)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: could not read bar store {path}: {e}")
+            return self._empty()
+
+    def _write(self, ticker: str, bars: pd.DataFrame):
+        os.makedirs(self.root, exist_ok=True)
+        arrays = {column: bars[column].to_numpy() for column in COLUMNS}
+        arrays["time"] = bars.index.as_unit("ns").asi8
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self.path(ticker))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def _lock(self, ticker: str):
+        with self._locks_lock:
+            return self._locks.setdefault(ticker, threading.RLock())
+
+    @staticmethod
+    def _empty() -> pd.DataFrame:
+        return pd.DataFrame({column: pd.Series(dtype=np.float64) for column in COLUMNS},
+                            index=pd.DatetimeIndex([], tz="UTC"))
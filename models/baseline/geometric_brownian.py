@@ -6,11 +6,13 @@ which is more realistic than absolute price changes for financial assets.
 """
 
 import numpy as np
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Dict, Any
 
+from ..base import PathModel
+from ..rng import SeedLike
 
-class GeometricBrownianModel:
+
+class GeometricBrownianModel(PathModel):
     """
     Geometric Brownian Motion model for price prediction.
     
@@ -18,13 +20,21 @@ class GeometricBrownianModel:
     which means percentage changes are normally distributed.
     """
     
-    def __init__(self, drift: float = None, volatility: float = None):
+    def __init__(self,
+                 drift: float = None,
+                 volatility: float = None,
+                 rng: SeedLike = None,
+                 sampling: str = "plain",
+                 dtype=np.float64):
         """
         Initialize the GBM model.
         
         Args:
-            drift: Expected annual return rate (default: 0 = no trend)
-            volatility: Annual volatility (standard deviation of returns)
+            drift: Expected return per 5-minute interval (default: 0 = no trend)
+            volatility: Standard deviation of returns per 5-minute interval
+            rng: Seed or numpy Generator for the model's random stream
+            sampling: Shock sampling method ("plain", "antithetic", "sobol", "lhs")
+            dtype: Path dtype, np.float64 (default) or np.float32
         """
         if drift is None:
             self.drift = 0.0
@@ -34,26 +44,33 @@ class GeometricBrownianModel:
             self.volatility = 0.02
         else:
             self.volatility = volatility
+        self.rng = rng
+        self.sampling = sampling
+        self.dtype = dtype
         self.name = "Geometric Brownian Motion Baseline"
         
-    def predict(self, 
-                start_price: float,
-                start_time: datetime,
-                time_increment: int = 300,  # 5 minutes in seconds
-                time_horizon: int = 86400,  # 24 hours in seconds
-                num_simulations: int = 100) -> List[List[Dict[str, Any]]]:
+    def simulate(self,
+                 start_price: float,
+                 n_steps: int,
+                 n_sims: int,
+                 rng=None,
+                 time_increment: int = 300) -> np.ndarray:
         """
-        Generate price predictions using GBM.
+        Generate exact GBM paths for all simulations at once.
+        
+        Log-returns are drawn as one (n_sims, n_steps) matrix, so the paths
+        are a single cumsum and exp with no discretization error and no
+        positivity clamp.
         
         Args:
             start_price: Starting price of the asset
-            start_time: When predictions should start
-            time_increment: Time between predictions in seconds
-            time_horizon: Total prediction horizon in seconds
-            num_simulations: Number of simulation paths to generate
+            n_steps: Number of time steps after the start
+            n_sims: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+            time_increment: Time between steps in seconds (unused)
             
         Returns:
-            List of simulation paths, each containing price predictions
+            Array of shape (n_sims, n_steps + 1); column 0 is the start price
         """
         # TODO: Enhance GBM model with:
         # - Time-varying volatility (stochastic volatility)
@@ -61,48 +78,30 @@ class GeometricBrownianModel:
         # - Correlation with other assets
         # - Fat-tailed distributions (student-t, etc.)
         
-        num_steps = int(time_horizon / time_increment)
-        predictions = []
-        
         # Use direct 5-minute volatility (no time scaling needed)
         # For 5-minute predictions, volatility should be per-5-minute interval
-        mu = self.drift  # Drift per 5-minute interval
-        sigma = self.volatility  # Volatility per 5-minute interval
+        # (Python floats so float32 paths are not upcast)
+        mu = float(self.drift)  # Drift per 5-minute interval
+        sigma = float(self.volatility)  # Volatility per 5-minute interval
         
-        for sim in range(num_simulations):
-            path = []
-            current_price = start_price
-            
-            for step in range(num_steps + 1):  # +1 to include start time
-                # Calculate time for this step
-                current_time = start_time + timedelta(seconds=step * time_increment)
-                
-                # GBM formula: dS = S * (μ*dt + σ*dW)
-                # where dW is a random normal variable
-                random_shock = np.random.normal(0, 1)
-                price_change = current_price * (mu + sigma * random_shock)
-                current_price += price_change
-                
-                # Ensure price stays positive
-                current_price = max(current_price, 0.01)
-                
-                path.append({
-                    "time": current_time.isoformat(),
-                    "price": current_price
-                })
-            
-            predictions.append(path)
+        # Exact solution of dS = S * (μ*dt + σ*dW):
+        # log(S_t+1 / S_t) = (μ - σ²/2) + σ * Z
+        log_returns = (mu - 0.5 * sigma ** 2) + sigma * self._standard_normal(rng, (n_sims, n_steps))
+        
+        log_paths = np.zeros((n_sims, n_steps + 1), dtype=self.dtype)
+        np.cumsum(log_returns, axis=1, out=log_paths[:, 1:])
         
-        return predictions
+        return float(start_price) * np.exp(log_paths)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the model."""
         return {
             "name": self.name,
             "type": "baseline",
+            "sampling": self.sampling,
             "drift": self.drift,
             "volatility": self.volatility,
-            "description": "GBM with constant drift and volatility"
+            "description": "Exact log-space GBM with constant drift and volatility"
         }
 
 
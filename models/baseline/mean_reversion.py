@@ -6,11 +6,14 @@ which is common in many financial markets and commodities.
 """
 
 import numpy as np
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from scipy.signal import lfilter
+from typing import Dict, Any
 
+from ..base import PathModel
+from ..rng import SeedLike
 
-class MeanReversionModel:
+
+class MeanReversionModel(PathModel):
     """
     Mean reversion model for price prediction.
     
@@ -21,7 +24,11 @@ class MeanReversionModel:
     def __init__(self, 
                  mean_price: float = None,
                  reversion_strength: float = None,
-                 volatility: float = None):
+                 volatility: float = None,
+                 scheme: str = "euler",
+                 rng: SeedLike = None,
+                 sampling: str = "plain",
+                 dtype=np.float64):
         """
         Initialize the mean reversion model.
         
@@ -29,7 +36,14 @@ class MeanReversionModel:
             mean_price: Long-term average price to revert to
             reversion_strength: How strongly prices are pulled toward the mean (0-1)
             volatility: Random noise in the process
+            scheme: "euler" for the price-proportional noise recurrence, or
+                    "exact" for an exactly discretized Ornstein-Uhlenbeck process
+            rng: Seed or numpy Generator for the model's random stream
+            sampling: Shock sampling method ("plain", "antithetic", "sobol", "lhs")
+            dtype: Path dtype, np.float64 (default) or np.float32
         """
+        if scheme not in ("euler", "exact"):
+            raise ValueError(f"Unknown scheme '{scheme}', expected 'euler' or 'exact'")
         if mean_price is None:
             self.mean_price = 100000
         else:
@@ -42,26 +56,30 @@ class MeanReversionModel:
             self.volatility = 0.02
         else:
             self.volatility = volatility
+        self.scheme = scheme
+        self.rng = rng
+        self.sampling = sampling
+        self.dtype = dtype
         self.name = "Mean Reversion Baseline"
         
-    def predict(self, 
-                start_price: float,
-                start_time: datetime,
-                time_increment: int = 300,  # 5 minutes in seconds
-                time_horizon: int = 86400,  # 24 hours in seconds
-                num_simulations: int = 100) -> List[List[Dict[str, Any]]]:
+    def simulate(self,
+                 start_price: float,
+                 n_steps: int,
+                 n_sims: int,
+                 rng=None,
+                 time_increment: int = 300) -> np.ndarray:
         """
-        Generate price predictions using mean reversion.
+        Generate mean-reverting paths for all simulations at once.
         
         Args:
             start_price: Starting price of the asset
-            start_time: When predictions should start
-            time_increment: Time between predictions in seconds
-            time_horizon: Total prediction horizon in seconds
-            num_simulations: Number of simulation paths to generate
+            n_steps: Number of time steps after the start
+            n_sims: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+            time_increment: Time between steps in seconds (unused)
             
         Returns:
-            List of simulation paths, each containing price predictions
+            Array of shape (n_sims, n_steps + 1); column 0 is the start price
         """
         # TODO: Enhance mean reversion model with:
         # - Time-varying mean (trending mean reversion)
@@ -69,51 +87,85 @@ class MeanReversionModel:
         # - Asymmetric reversion (different speeds up vs down)
         # - Volatility clustering during mean reversion
         
-        num_steps = int(time_horizon / time_increment)
-        predictions = []
+        shocks = self._standard_normal(rng, (n_sims, n_steps))
+        
+        if self.scheme == "exact":
+            paths = self._simulate_exact(start_price, shocks)
+        else:
+            paths = self._simulate_euler(start_price, shocks)
+        
+        # Ensure prices stay positive
+        return np.maximum(paths, 0.01)
+    
+    def _simulate_euler(self, start_price: float, shocks: np.ndarray) -> np.ndarray:
+        """
+        Advance all simulations together, one time step at a time.
+        
+        The noise scales with the current price, so each step depends on the
+        previous one and the recurrence can't be collapsed into a cumsum.
+        """
+        num_simulations, num_steps = shocks.shape
+        paths = np.empty((num_simulations, num_steps + 1), dtype=shocks.dtype)
+        paths[:, 0] = start_price
+        
+        # Python floats so float32 paths are not upcast
+        alpha = float(self.reversion_strength)
+        mean_price = float(self.mean_price)
+        volatility = float(self.volatility)
         
-        for sim in range(num_simulations):
-            path = []
-            current_price = start_price
+        for step in range(num_steps):
+            current_price = paths[:, step]
             
-            for step in range(num_steps + 1):  # +1 to include start time
-                # Calculate time for this step
-                current_time = start_time + timedelta(seconds=step * time_increment)
-                
-                # Mean reversion formula: 
-                # dP = α * (μ - P) * dt + σ * dW
-                # where α is reversion strength, μ is mean price
-                
-                # Calculate mean reversion force
-                reversion_force = self.reversion_strength * (self.mean_price - current_price)
-                
-                # Add random noise (using direct 5-minute volatility)
-                random_shock = np.random.normal(0, self.volatility * current_price)
-                
-                # Update price
-                price_change = reversion_force + random_shock
-                current_price += price_change
-                
-                # Ensure price stays positive
-                current_price = max(current_price, 0.01)
-                
-                path.append({
-                    "time": current_time.isoformat(),
-                    "price": current_price
-                })
+            # Mean reversion formula: 
+            # dP = α * (μ - P) * dt + σ * P * dW
+            # where α is reversion strength, μ is mean price
+            reversion_force = alpha * (mean_price - current_price)
+            random_shock = volatility * current_price * shocks[:, step]
             
-            predictions.append(path)
+            paths[:, step + 1] = np.maximum(current_price + reversion_force + random_shock, 0.01)
+        
+        return paths
+    
+    def _simulate_exact(self, start_price: float, shocks: np.ndarray) -> np.ndarray:
+        """
+        Exact Ornstein-Uhlenbeck discretization as a linear filter over all shocks.
+        
+        The deviation from the mean follows the AR(1) recurrence
+        d[t+1] = φ * d[t] + ε[t] with φ = 1 - α, so the whole shock matrix is
+        filtered in one call. The noise level is fixed at volatility * mean_price.
+        """
+        if not 0 <= self.reversion_strength < 1:
+            raise ValueError("Exact scheme requires 0 <= reversion_strength < 1")
+        
+        phi = 1.0 - float(self.reversion_strength)
+        mean_price = float(self.mean_price)
+        sigma = float(self.volatility) * mean_price
+        if self.reversion_strength > 0:
+            # Stationary step variance of the OU process with θ = -ln(φ)
+            theta = -np.log(phi)
+            sigma *= float(np.sqrt((1.0 - phi ** 2) / (2.0 * theta)))
+        
+        num_simulations, num_steps = shocks.shape
+        dtype = shocks.dtype
+        initial_deviation = np.full((num_simulations, 1), phi * (start_price - mean_price), dtype=dtype)
+        deviations, _ = lfilter(np.array([1.0], dtype=dtype), np.array([1.0, -phi], dtype=dtype),
+                                sigma * shocks, axis=1, zi=initial_deviation)
         
-        return predictions
+        paths = np.empty((num_simulations, num_steps + 1), dtype=dtype)
+        paths[:, 0] = start_price
+        paths[:, 1:] = mean_price + deviations
+        return paths
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the model."""
         return {
             "name": self.name,
             "type": "baseline",
+            "sampling": self.sampling,
             "mean_price": self.mean_price,
             "reversion_strength": self.reversion_strength,
             "volatility": self.volatility,
+            "scheme": self.scheme,
             "description": "Mean reversion with constant parameters"
         }
 
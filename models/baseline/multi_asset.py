@@ -0,0 +1,221 @@
+"""
+Multi-Asset Correlated GBM Model
+
+Simulates every Synth asset in one (assets, sims, steps + 1) tensor with
+correlated shocks, and caches the result per prompt window so prompts for the
+other assets over the same window are answered without re-simulating.
+
+This is an offline engine for research and backtests; the live miner
+(synth_integration) still serves each asset from its own ensemble.
+"""
+
+import threading
+import numpy as np
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Sequence, Tuple
+
+from ..result import SimulationResult
+from ..rng import make_rng, SeedLike
+from ..sampling import resolve_dtype
+from .volatility_calculator import ASSET_TICKERS
+
+
+def nearest_correlation(matrix: np.ndarray) -> np.ndarray:
+    """
+    Project a symmetric matrix onto a valid correlation matrix.
+
+    Pairwise-estimated correlations (e.g. crypto vs gold futures with different
+    trading hours) are not always positive definite; negative eigenvalues are
+    clipped and the diagonal is rescaled back to one.
+    """
+    matrix = (matrix + matrix.T) / 2
+    eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+    eigenvalues = np.clip(eigenvalues, 1e-8, None)
+    projected = (eigenvectors * eigenvalues) @ eigenvectors.T
+    scale = np.sqrt(np.diag(projected))
+    return projected / np.outer(scale, scale)
+
+
+class MultiAssetGBMModel:
+    """
+    Correlated GBM across all Synth assets.
+
+    Each asset follows exact log-space GBM with its own per-5-minute drift and
+    volatility; independent shocks are mixed with the Cholesky factor of the
+    asset correlation matrix.
+    """
+
+    def __init__(self,
+                 assets: Sequence[str] = tuple(ASSET_TICKERS),
+                 drifts: Dict[str, float] = None,
+                 volatilities: Dict[str, float] = None,
+                 correlation: np.ndarray = None,
+                 rng: SeedLike = None,
+                 dtype=np.float64,
+                 cache_size: int = 16):
+        """
+        Initialize the multi-asset model.
+
+        Args:
+            assets: Asset symbols, in tensor order
+            drifts: Per-5-minute drift per asset (default: 0)
+            volatilities: Per-5-minute volatility per asset (default: 0.02)
+            correlation: Asset correlation matrix (default: identity)
+            rng: Seed or numpy Generator for the model's random stream
+            dtype: Path dtype, np.float64 (default) or np.float32
+            cache_size: Number of simulated windows to keep
+        """
+        self.assets = list(assets)
+        self.drifts = {asset: 0.0 for asset in self.assets}
+        self.volatilities = {asset: 0.02 for asset in self.assets}
+        self.drifts.update(drifts or {})
+        self.volatilities.update(volatilities or {})
+        self.set_correlation(np.eye(len(self.assets)) if correlation is None else correlation)
+
+        self.rng = make_rng(rng)
+        self.dtype = resolve_dtype(dtype)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.name = "Multi-Asset Correlated GBM"
+
+    def set_correlation(self, correlation: np.ndarray):
+        """Set the asset correlation matrix and its Cholesky factor."""
+        correlation = np.asarray(correlation, dtype=np.float64)
+        n = len(self.assets)
+        if correlation.shape != (n, n):
+            raise ValueError(f"correlation must be {n}x{n} for assets {self.assets}")
+        self.correlation = nearest_correlation(correlation)
+        self.cholesky = np.linalg.cholesky(self.correlation)
+
+    def calibrate(self, returns) -> Dict[str, Any]:
+        """
+        Calibrate drift, volatility and correlation from historical returns.
+
+        Args:
+            returns: pandas DataFrame of 5-minute returns, one column per asset
+                     (see volatility_calculator.get_all_returns)
+
+        Returns:
+            Dict with the fitted drifts, volatilities and correlation
+        """
+        returns = returns[[asset for asset in self.assets if asset in returns.columns]]
+        for asset in returns.columns:
+            series = returns[asset].dropna()
+            if len(series) > 1:
+                self.drifts[asset] = float(series.mean())
+                self.volatilities[asset] = float(series.std())
+
+        # Pairwise-complete correlation; assets without data stay uncorrelated
+        correlation = np.eye(len(self.assets))
+        pairwise = returns.corr().to_numpy()
+        index = [self.assets.index(asset) for asset in returns.columns]
+        correlation[np.ix_(index, index)] = np.nan_to_num(pairwise, nan=0.0)
+        np.fill_diagonal(correlation, 1.0)
+        self.set_correlation(correlation)
+        self.invalidate_cache()
+
+        return {
+            "drifts": dict(self.drifts),
+            "volatilities": dict(self.volatilities),
+            "correlation": self.correlation.tolist()
+        }
+
+    def simulate_relative(self,
+                          n_steps: int,
+                          n_sims: int,
+                          rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Simulate correlated paths for all assets, normalized to start at 1.0.
+
+        Returns:
+            Array of shape (num_assets, n_sims, n_steps + 1)
+        """
+        if rng is None:
+            rng = self.rng
+
+        shocks = rng.standard_normal((len(self.assets), n_sims, n_steps), dtype=self.dtype)
+        # Mix independent shocks across the asset axis
+        shocks = np.einsum("ij,jsk->isk", self.cholesky.astype(self.dtype), shocks)
+
+        mu = np.array([self.drifts[a] for a in self.assets], dtype=self.dtype)[:, None, None]
+        sigma = np.array([self.volatilities[a] for a in self.assets], dtype=self.dtype)[:, None, None]
+
+        log_paths = np.zeros((len(self.assets), n_sims, n_steps + 1), dtype=self.dtype)
+        np.cumsum((mu - 0.5 * sigma ** 2) + sigma * shocks, axis=2, out=log_paths[:, :, 1:])
+        return np.exp(log_paths)
+
+    def simulate(self,
+                 start_prices: Dict[str, float],
+                 n_steps: int,
+                 n_sims: int,
+                 rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Simulate correlated price paths for all assets.
+
+        Returns:
+            Array of shape (num_assets, n_sims, n_steps + 1); [:, :, 0] are the start prices
+        """
+        starts = np.array([start_prices[a] for a in self.assets], dtype=self.dtype)
+        return starts[:, None, None] * self.simulate_relative(n_steps, n_sims, rng)
+
+    def _params_key(self) -> Tuple:
+        """Current drifts, volatilities and correlation, as part of a cache key."""
+        return (tuple(float(self.drifts[a]) for a in self.assets),
+                tuple(float(self.volatilities[a]) for a in self.assets),
+                self.correlation.tobytes())
+
+    def _cached_window(self, key: Tuple) -> np.ndarray:
+        """Return the relative tensor for a window, simulating it on a miss."""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+            _, time_increment, time_horizon, num_simulations, _ = key
+            tensor = self.simulate_relative(int(time_horizon / time_increment), num_simulations)
+            self._cache[key] = tensor
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return tensor
+
+    def predict_asset(self,
+                      asset: str,
+                      start_price: float,
+                      start_time: datetime,
+                      time_increment: int = 300,  # 5 minutes in seconds
+                      time_horizon: int = 86400,  # 24 hours in seconds
+                      num_simulations: int = 100) -> SimulationResult:
+        """
+        Paths for one asset, served from the shared per-window tensor.
+
+        The first prompt for a window simulates every asset at once; prompts for
+        the other assets over the same window reuse the cached tensor, scaled
+        by their own start price. Changing the drifts, volatilities or
+        correlation starts a new tensor.
+        """
+        if asset not in self.assets:
+            raise ValueError(f"Unknown asset '{asset}', expected one of {self.assets}")
+
+        key = (start_time, time_increment, time_horizon, num_simulations, self._params_key())
+        tensor = self._cached_window(key)
+        paths = float(start_price) * tensor[self.assets.index(asset)]
+        return SimulationResult(paths, start_time, time_increment)
+
+    def invalidate_cache(self):
+        """Drop all cached windows (e.g. after recalibration)."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """Get information about the model."""
+        return {
+            "name": self.name,
+            "type": "baseline",
+            "assets": self.assets,
+            "drifts": self.drifts,
+            "volatilities": self.volatilities,
+            "correlation": self.correlation.tolist(),
+            "description": "Correlated exact GBM across assets with per-window caching"
+        }
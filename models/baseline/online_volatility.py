@@ -0,0 +1,142 @@
+"""
+Streaming volatility and drift estimation.
+
+Instead of recomputing pct_change().std() over the whole bar frame on every
+calibration, an OnlineVolatilityEstimator is updated in O(1) per new bar and
+exposes the current per-bar volatility and drift at any time.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+METHODS = ("welford", "ewma")
+
+
+class OnlineVolatilityEstimator:
+    """
+    Running mean and standard deviation of simple returns.
+
+    - "welford": exact sample mean/std over all returns, or over the last
+      `window` returns (kept in a ring buffer) if a window is given
+    - "ewma": exponentially weighted mean/std with the given halflife (in bars)
+    """
+
+    def __init__(self, method: str = "welford", window: int = None, halflife: float = 288):
+        """
+        Initialize the estimator.
+
+        Args:
+            method: "welford" or "ewma"
+            window: Rolling window in returns for "welford" (None = expanding)
+            halflife: Halflife in returns for "ewma"
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {METHODS}")
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2 returns")
+        self.method = method
+        self.window = window
+        self.alpha = 1 - 0.5 ** (1 / halflife)
+
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Welford: sum of squared deviations; EWMA: variance
+        self._buffer = np.empty(window) if window else None
+        self._head = 0
+        self.last_price: Optional[float] = None
+        self.last_time = None
+
+    @property
+    def drift(self) -> Optional[float]:
+        """Mean return per bar (None until there is a return)."""
+        return self._mean if self.count else None
+
+    @property
+    def volatility(self) -> Optional[float]:
+        """Standard deviation of returns per bar (None until there are 2 returns)."""
+        if self.count < 2:
+            return None
+        variance = self._m2 / (self.count - 1) if self.method == "welford" else self._m2
+        return math.sqrt(max(variance, 0.0))
+
+    def update(self, price: float, time=None) -> bool:
+        """
+        Add a new price; the return from the previous price is recorded.
+
+        Prices that are not finite and positive are ignored.
+
+        Returns:
+            True if the price was used
+        """
+        price = float(price)
+        if not math.isfinite(price) or price <= 0:
+            return False
+        if self.last_price is not None:
+            self.update_return(price / self.last_price - 1.0)
+        self.last_price = price
+        if time is not None:
+            self.last_time = time
+        return True
+
+    def update_return(self, r: float):
+        """Add one return."""
+        r = float(r)
+        if self.method == "ewma":
+            self._update_ewma(r)
+            return
+
+        if self.window is not None and self.count == self.window:
+            self._remove(self._buffer[self._head])
+        self._add(r)
+        if self.window is not None:
+            self._buffer[self._head] = r
+            self._head = (self._head + 1) % self.window
+
+    def ingest_bars(self, bars: pd.DataFrame, column: str = "Close", closed_only: bool = True) -> int:
+        """
+        Feed the bars newer than the last one seen.
+
+        Args:
+            bars: Time-indexed DataFrame of bars
+            column: Price column to use
+            closed_only: Leave out the last bar, which is still forming in a
+                         live frame; it is consumed once a newer bar follows,
+                         with its final close
+
+        Returns:
+            Number of new bars consumed (invalid prices are skipped)
+        """
+        if closed_only:
+            bars = bars.iloc[:-1]
+        if self.last_time is not None:
+            bars = bars[bars.index > self.last_time]
+        consumed = 0
+        for time, price in zip(bars.index, bars[column].to_numpy()):
+            consumed += self.update(price, time)
+        return consumed
+
+    def _add(self, r: float):
+        self.count += 1
+        delta = r - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (r - self._mean)
+
+    def _remove(self, r: float):
+        self.count -= 1
+        if self.count == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta = r - self._mean
+        self._mean -= delta / self.count
+        self._m2 -= delta * (r - self._mean)
+
+    def _update_ewma(self, r: float):
+        self.count += 1
+        if self.count == 1:
+            self._mean = r
+            return
+        delta = r - self._mean
+        self._mean += self.alpha * delta
+        self._m2 = (1 - self.alpha) * (self._m2 + self.alpha * delta ** 2)
@@ -0,0 +1,270 @@
+"""
+Pluggable price sources for calibration bars and live start prices.
+
+- YFinancePriceSource: Yahoo Finance bars (the original calibration feed)
+- SynthPriceSource: Pyth prices, live via the Synth miner helper and bars
+  via the Pyth benchmarks (TradingView shim) API
+- ReplayPriceSource: historical bars from local CSV/Parquet files, with a
+  replay clock, for backtests, benchmarks and CI without network access
+
+Symbols may be given as Synth assets ("BTC") or Yahoo tickers ("BTC-USD").
+Every source returns bars as a DataFrame with a UTC DatetimeIndex and
+Open/High/Low/Close/Volume columns.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Iterator, Mapping, Optional, Tuple, Union
+
+from .bar_store import COLUMNS, period_to_timedelta
+
+try:
+    import yfinance as yf
+except ImportError:  # only YFinancePriceSource needs it
+    yf = None
+
+ASSET_TICKERS = {
+    "BTC": "BTC-USD",
+    "ETH": "ETH-USD",
+    "SOL": "SOL-USD",
+    "XAU": "GC=F"
+}
+
+TimeLike = Union[str, datetime, pd.Timestamp]
+
+
+def asset_for(symbol: str) -> str:
+    """Synth asset for an asset or Yahoo ticker symbol (unknown symbols pass through)."""
+    for asset, ticker in ASSET_TICKERS.items():
+        if symbol == ticker:
+            return asset
+    return symbol
+
+
+def _utc(time: TimeLike) -> pd.Timestamp:
+    time = pd.Timestamp(time)
+    return time.tz_convert("UTC") if time.tzinfo else time.tz_localize("UTC")
+
+
+def normalize_bars(bars: pd.DataFrame) -> pd.DataFrame:
+    """Standard OHLCV columns, float64, sorted unique UTC index."""
+    renamed = {column: column.capitalize() for column in bars.columns}
+    bars = bars.rename(columns=renamed)
+    if "Close" not in bars.columns:
+        raise ValueError("Bars need at least a Close column")
+    for column in ("Open", "High", "Low"):
+        if column not in bars.columns:
+            bars[column] = bars["Close"]
+    if "Volume" not in bars.columns:
+        bars["Volume"] = 0.0
+    bars = bars[list(COLUMNS)].astype(np.float64)
+
+    index = pd.DatetimeIndex(pd.to_datetime(bars.index, utc=True))
+    bars.index = index
+    return bars[~bars.index.duplicated(keep="last")].sort_index()
+
+
+class PriceSource(ABC):
+    """Interface for bar and live price feeds."""
+
+    name = "price source"
+
+    @abstractmethod
+    def get_bars(self,
+                 symbol: str,
+                 start: Optional[TimeLike] = None,
+                 period: Optional[str] = None,
+                 interval: str = "5m") -> pd.DataFrame:
+        """
+        Fetch OHLCV bars.
+
+        Args:
+            symbol: Synth asset or Yahoo ticker
+            start: Bars from this time onwards (takes precedence over period)
+            period: Most recent period of bars (e.g. "2d") when start is None
+            interval: Bar interval
+
+        Returns:
+            DataFrame with a UTC DatetimeIndex and Open/High/Low/Close/Volume
+        """
+        pass
+
+    @abstractmethod
+    def get_price(self, symbol: str) -> Optional[float]:
+        """Current price, or None if unavailable."""
+        pass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class YFinancePriceSource(PriceSource):
+    """Yahoo Finance bars via yfinance."""
+
+    name = "yfinance"
+
+    def get_bars(self, symbol, start=None, period=None, interval="5m"):
+        if yf is None:
+            raise ImportError("yfinance is not installed")
+        ticker = yf.Ticker(ASSET_TICKERS.get(symbol, symbol))
+        if start is not None:
+            bars = ticker.history(start=start, interval=interval)
+        else:
+            bars = ticker.history(period=period or "2d", interval=interval)
+        # yfinance indexes by exchange time and adds Dividends/Stock Splits
+        return normalize_bars(bars)
+
+    def get_price(self, symbol):
+        bars = self.get_bars(symbol, period="1d", interval="1m")
+        return None if bars.empty else float(bars["Close"].iloc[-1])
+
+
+class SynthPriceSource(PriceSource):
+    """
+    Pyth prices: the live price through the Synth miner's get_asset_price
+    (the price validators score against) and bars from Pyth benchmarks.
+    """
+
+    name = "synth"
+
+    BENCHMARKS_URL = "https://benchmarks.pyth.network/v1/shims/tradingview/history"
+    PYTH_SYMBOLS = {
+        "BTC": "Crypto.BTC/USD",
+        "ETH": "Crypto.ETH/USD",
+        "SOL": "Crypto.SOL/USD",
+        "XAU": "Metal.XAU/USD"
+    }
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+
+    def get_bars(self, symbol, start=None, period=None, interval="5m"):
+        import requests
+
+        resolution = int(period_to_timedelta(interval).total_seconds() // 60)
+        end = pd.Timestamp.now(tz="UTC")
+        begin = _utc(start) if start is not None else end - period_to_timedelta(period or "2d")
+        response = requests.get(self.BENCHMARKS_URL, timeout=self.timeout, params={
+            "symbol": self.PYTH_SYMBOLS[asset_for(symbol)],
+            "resolution": resolution,
+            "from": int(begin.timestamp()),
+            "to": int(end.timestamp())
+        })
+        response.raise_for_status()
+        data = response.json()
+        if data.get("s") not in (None, "ok") or not data.get("t"):
+            return normalize_bars(pd.DataFrame({"Close": []}, index=pd.DatetimeIndex([])))
+
+        index = pd.to_datetime(data["t"], unit="s", utc=True)
+        return normalize_bars(pd.DataFrame({
+            "Open": data.get("o", data["c"]),
+            "High": data.get("h", data["c"]),
+            "Low": data.get("l", data["c"]),
+            "Close": data["c"],
+            "Volume": data.get("v", [0.0] * len(data["c"]))
+        }, index=index))
+
+    def get_price(self, symbol):
+        from synth.miner.price_simulation import get_asset_price  # type: ignore
+        return get_asset_price(asset_for(symbol))
+
+
+class ReplayPriceSource(PriceSource):
+    """
+    Historical bars from local files, served as of a replay clock.
+
+    Only bars at or before `now` are visible, so a backtest sees exactly the
+    data it would have had live. With now=None every bar is visible.
+    """
+
+    name = "replay"
+
+    def __init__(self, data: Mapping[str, Union[str, pd.DataFrame]], now: Optional[TimeLike] = None):
+        """
+        Initialize the replay source.
+
+        Args:
+            data: Asset -> bars DataFrame or path to a .csv/.parquet file
+                  (first column or index = bar time)
+            now: Initial replay time
+        """
+        self.bars = {asset_for(symbol): normalize_bars(self._read(source))
+                     for symbol, source in data.items()}
+        self.now = None
+        self.set_time(now)
+
+    @classmethod
+    def from_directory(cls, directory: str, now: Optional[TimeLike] = None) -> "ReplayPriceSource":
+        """Load every <ASSET>.csv / <ASSET>.parquet file in a directory."""
+        files = {}
+        for filename in sorted(os.listdir(directory)):
+            stem, ext = os.path.splitext(filename)
+            if ext in (".csv", ".parquet"):
+                files[stem] = os.path.join(directory, filename)
+        if not files:
+            raise ValueError(f"No .csv or .parquet bar files in {directory}")
+        return cls(files, now)
+
+    def set_time(self, now: Optional[TimeLike]):
+        """Move the replay clock (None = show all bars)."""
+        self.now = None if now is None else _utc(now)
+
+    def advance(self, seconds: float):
+        """Move the replay clock forward."""
+        if self.now is None:
+            raise ValueError("Replay clock is not set")
+        self.now = self.now + timedelta(seconds=seconds)
+
+    def visible(self, symbol: str) -> pd.DataFrame:
+        """All bars for symbol up to the replay time."""
+        bars = self.bars[asset_for(symbol)]
+        return bars if self.now is None else bars[bars.index <= self.now]
+
+    def get_bars(self, symbol, start=None, period=None, interval="5m"):
+        bars = self.visible(symbol)
+        if bars.empty:
+            return bars
+        if start is not None:
+            return bars[bars.index >= _utc(start)]
+        if period is not None:
+            return bars[bars.index > bars.index[-1] - period_to_timedelta(period)]
+        return bars
+
+    def get_price(self, symbol):
+        bars = self.visible(symbol)
+        return None if bars.empty else float(bars["Close"].iloc[-1])
+
+    def stream(self, symbol: str, start: Optional[TimeLike] = None) -> Iterator[Tuple[pd.Timestamp, pd.Series]]:
+        """
+        Replay bars one at a time, advancing the clock to each bar.
+
+        Yields:
+            (bar time, bar row)
+        """
+        bars = self.bars[asset_for(symbol)]
+        if start is not None:
+            bars = bars[bars.index >= _utc(start)]
+        for time, row in bars.iterrows():
+            self.now = time
+            yield time, row
+
+    @staticmethod
+    def _read(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
+        if isinstance(source, pd.DataFrame):
+            return source
+        if source.endswith(".parquet"):
+            bars = pd.read_parquet(source)
+            if isinstance(bars.index, pd.RangeIndex):
+                # Time stored as a regular column rather than the index
+                bars = bars.set_index(bars.columns[0])
+        else:
+            bars = pd.read_csv(source, index_col=0)
+        if not isinstance(bars.index, pd.DatetimeIndex):
+            bars.index = pd.to_datetime(bars.index, utc=True)
+        return bars
+
+    def __repr__(self) -> str:
+        return f"ReplayPriceSource(assets={sorted(self.bars)}, now={self.now})"
@@ -6,11 +6,13 @@ It generates price predictions by adding random noise to the current price.
 """
 
 import numpy as np
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Dict, Any
 
+from ..base import PathModel
+from ..rng import SeedLike
 
-class RandomWalkModel:
+
+class RandomWalkModel(PathModel):
     """
     Simple random walk model for price prediction.
     
@@ -18,75 +20,80 @@ class RandomWalkModel:
     It's included as a baseline to compare against more sophisticated approaches.
     """
     
-    def __init__(self, volatility: float = None):
+    def __init__(self,
+                 volatility: float = None,
+                 rng: SeedLike = None,
+                 sampling: str = "plain",
+                 dtype=np.float64):
         """
         Initialize the random walk model.
         
         Args:
             volatility: Standard deviation of price changes (as a fraction)
+            rng: Seed or numpy Generator for the model's random stream
+            sampling: Shock sampling method ("plain", "antithetic", "sobol", "lhs")
+            dtype: Path dtype, np.float64 (default) or np.float32
         """
         if volatility is None:
             self.volatility = 0.02 # fallback
         else:
             self.volatility = volatility
+        self.rng = rng
+        self.sampling = sampling
+        self.dtype = dtype
         self.name = "Random Walk Baseline"
         
-    def predict(self, 
-                start_price: float,
-                start_time: datetime,
-                time_increment: int = 300,  # 5 minutes in seconds
-                time_horizon: int = 86400,  # 24 hours in seconds
-                num_simulations: int = 100) -> List[List[Dict[str, Any]]]:
+    def simulate(self,
+                 start_price: float,
+                 n_steps: int,
+                 n_sims: int,
+                 rng=None,
+                 time_increment: int = 300) -> np.ndarray:
         """
-        Generate price predictions using random walk.
+        Generate all simulation paths at once as a price array.
+        
+        Each step multiplies the price by (1 + volatility * z), so the whole
+        path is one cumulative product over a batch of normal shocks.
         
         Args:
             start_price: Starting price of the asset
-            start_time: When predictions should start
-            time_increment: Time between predictions in seconds
-            time_horizon: Total prediction horizon in seconds
-            num_simulations: Number of simulation paths to generate
+            n_steps: Number of time steps after the start
+            n_sims: Number of simulation paths to generate
+            rng: numpy Generator to draw from (default: self.rng)
+            time_increment: Time between steps in seconds (unused)
             
         Returns:
-            List of simulation paths, each containing price predictions
+            Array of shape (n_sims, n_steps + 1); column 0 is the start price
         """
         # TODO: Add more sophisticated random walk variants
         # - Consider adding drift terms
         # - Implement different noise distributions (normal, student-t, etc.)
         # - Add mean reversion components
         
-        num_steps = int(time_horizon / time_increment)
-        predictions = []
+        # Price change is normal with std volatility * current price,
+        # i.e. a multiplicative (1 + volatility * z) factor per step
+        # (parameters as Python floats so float32 paths are not upcast)
+        shocks = float(self.volatility) * self._standard_normal(rng, (n_sims, n_steps))
         
-        for sim in range(num_simulations):
-            path = []
-            current_price = start_price
-            
-            for step in range(num_steps + 1):  # +1 to include start time
-                # Calculate time for this step
-                current_time = start_time + timedelta(seconds=step * time_increment)
-                
-                # Generate random price change
-                price_change = np.random.normal(0, self.volatility * current_price)
-                current_price += price_change
-                
-                # Ensure price stays positive
-                current_price = max(current_price, 0.01)
-                
-                path.append({
-                    "time": current_time.isoformat(),
-                    "price": current_price
-                })
-            
-            predictions.append(path)
+        # A factor below zero would flip the sign of the running product and
+        # let the path "recover", so factors are clipped at zero
+        factors = np.maximum(1.0 + shocks, 0.0)
+        
+        paths = np.empty((n_sims, n_steps + 1), dtype=self.dtype)
+        paths[:, 0] = start_price
+        paths[:, 1:] = float(start_price) * np.cumprod(factors, axis=1)
         
-        return predictions
+        # Ensure prices stay positive; once a path reaches the floor it stays there
+        floored = np.logical_or.accumulate(paths[:, 1:] <= 0.01, axis=1)
+        paths[:, 1:][floored] = 0.01
+        return np.maximum(paths, 0.01)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the model."""
         return {
             "name": self.name,
             "type": "baseline",
+            "sampling": self.sampling,
             "volatility": self.volatility,
             "description": "Simple random walk with normal noise"
         }
@@ -1,4 +1,116 @@
-import yfinance as yf
+import time
+import threading
+import pandas as pd
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+from .online_volatility import OnlineVolatilityEstimator
+from .range_volatility import RANGE_ESTIMATORS, range_volatility
+from .price_sources import PriceSource, YFinancePriceSource, ASSET_TICKERS
+
+# Optional BarStore; when set, bars are fetched incrementally and served from disk
+_bar_store = None
+
+def set_bar_store(store):
+    """Serve calibration bars from a BarStore (None to always download the full period)."""
+    global _bar_store
+    _bar_store = store
+
+# Where calibration bars come from (Yahoo Finance unless replaced)
+_price_source: PriceSource = YFinancePriceSource()
+
+def set_price_source(source: PriceSource):
+    """Fetch calibration bars from another PriceSource (e.g. a file replay)."""
+    global _price_source
+    _price_source = source
+
+def get_price_source() -> PriceSource:
+    return _price_source
+
+def download_bars(ticker, start=None, period=None, interval="5m"):
+    """
+    Download OHLC bars from the current price source.
+    
+    Args:
+        ticker: Yahoo Finance ticker symbol or Synth asset
+        start: Fetch bars from this time onwards (takes precedence over period)
+        period: Period string (e.g., "2d") when start is None
+        interval: Bar interval
+        
+    Returns:
+        pandas DataFrame with Open/High/Low/Close/Volume columns
+    """
+    return _price_source.get_bars(ticker, start=start, period=period, interval=interval)
+
+def get_history(time, ticker):
+    """
+    OHLC 5-minute bars for one ticker over a period.
+    
+    Returns:
+        pandas DataFrame of bars, or None on failure
+    """
+    try:
+        if _bar_store is not None:
+            hist = _bar_store.get(ticker, time)
+        else:
+            hist = download_bars(ticker, period=time)
+    except Exception as e:
+        print(f"Error fetching {ticker}: {e}")
+        return None
+    if hist is None or hist.empty:
+        return None
+    return hist
+
+def get_returns(time, ticker):
+    """
+    Fetch 5-minute close-to-close returns for one ticker.
+    
+    Args:
+        time: Period string (e.g., "1d", "2d")
+        ticker: Yahoo Finance ticker symbol
+        
+    Returns:
+        pandas Series of returns indexed by bar time, or None on failure
+    """
+    hist = get_history(time, ticker)
+    if hist is None:
+        return None
+    return hist['Close'].pct_change().dropna()
+
+# Optional streaming estimators per ticker; when enabled, get_volatility only
+# consumes the bars it hasn't seen yet instead of recomputing over the frame
+_online_estimators = None
+_online_settings = {}
+_online_lock = threading.Lock()
+
+def set_online_estimation(enabled=True, **settings):
+    """
+    Switch get_volatility to streaming estimation.
+    
+    Args:
+        enabled: False returns to full-frame pandas estimates
+        settings: OnlineVolatilityEstimator arguments (method, window, halflife)
+    """
+    global _online_estimators, _online_settings
+    with _online_lock:
+        _online_estimators = {} if enabled else None
+        _online_settings = settings
+
+# "close" (close-to-close returns) or one of RANGE_ESTIMATORS
+_volatility_estimator = "close"
+
+def set_volatility_estimator(method="close"):
+    """
+    Choose how get_volatility estimates volatility.
+    
+    Range estimators (e.g. "yang_zhang") use the bars' Open/High/Low and
+    need far fewer bars than close-to-close for the same precision, so they
+    pair well with a shorter period. Drift is always the mean close-to-close return.
+    """
+    global _volatility_estimator
+    if method != "close" and method not in RANGE_ESTIMATORS:
+        raise ValueError(f"Unknown estimator '{method}', expected 'close' or one of {tuple(RANGE_ESTIMATORS)}")
+    _volatility_estimator = method
 
 def get_volatility(time, ticker):
     """
@@ -9,35 +121,96 @@ def get_volatility(time, ticker):
         ticker: Yahoo Finance ticker symbol
         
     Returns:
-        float: Standard deviation of returns (per 5-min interval)
+        (volatility, drift): Standard deviation and mean of returns (per 5-min interval)
     """
-    try:
-        asset = yf.Ticker(ticker)
-        hist = asset.history(period=time, interval="5m")
-        if hist.empty:
+    if _volatility_estimator != "close":
+        hist = get_history(time, ticker)
+        if hist is None or len(hist) < 2:
             return None
-        returns = hist['Close'].pct_change().dropna()
-        vol = returns.std()
-        drift = returns.mean()
-        return (vol, drift)
-    except Exception as e:
-        print(f"Error fetching {ticker}: {e}")
+        drift = hist['Close'].pct_change().mean()
+        return (range_volatility(hist, _volatility_estimator), drift)
+    
+    if _online_estimators is not None:
+        hist = get_history(time, ticker)
+        if hist is None:
+            return None
+        with _online_lock:
+            estimator = _online_estimators.get(ticker)
+            if estimator is None:
+                estimator = _online_estimators[ticker] = OnlineVolatilityEstimator(**_online_settings)
+            estimator.ingest_bars(hist)
+            if estimator.volatility is None:
+                return None
+            return (estimator.volatility, estimator.drift)
+    
+    returns = get_returns(time, ticker)
+    if returns is None:
         return None
+    vol = returns.std()
+    drift = returns.mean()
+    return (vol, drift)
 
-# Asset ticker mapping
-ASSET_TICKERS = {
-    "BTC": "BTC-USD",
-    "ETH": "ETH-USD", 
-    "SOL": "SOL-USD",
-    "XAU": "GC=F"
-}
+# Last good volatility/drift per asset and when it was fetched, used when a
+# ticker fails to fetch
+_last_volatilities = {}
+_last_volatilities_lock = threading.Lock()
 
-def get_all_volatilities(period="2d"):
-    """Get volatilities for all Synth subnet assets."""
-    vols = {}
-    for asset, ticker in ASSET_TICKERS.items():
-        result = get_volatility(period,ticker)
+def _fetch_all(fetch, period, timeout, max_workers):
+    """
+    Run fetch(period, ticker) for every asset concurrently.
+    
+    Returns:
+        Dict of asset -> result for the tickers that finished within timeout
+        seconds with a non-None result
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(ASSET_TICKERS),
+                                  thread_name_prefix="ticker-fetch")
+    futures = {asset: executor.submit(fetch, period, ticker) for asset, ticker in ASSET_TICKERS.items()}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    
+    results = {}
+    for asset, future in futures.items():
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            result = future.result(timeout=remaining)
+        except FuturesTimeoutError:
+            print(f"Error fetching {ASSET_TICKERS[asset]}: timed out after {timeout}s")
+            continue
+        except Exception as e:
+            print(f"Error fetching {ASSET_TICKERS[asset]}: {e}")
+            continue
         if result is not None:
-            vol, drift = result
-            vols[asset] = {"volatility": vol, "drift": drift}
-    return vols
\ No newline at end of file
+            results[asset] = result
+    
+    # Don't wait for slow tickers; their threads finish in the background
+    executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+def get_all_volatilities(period="2d", timeout=20.0, max_workers=None):
+    """
+    Get volatilities for all Synth subnet assets.
+    
+    Tickers are fetched concurrently, each bounded by timeout seconds. A
+    ticker that fails or times out falls back to its last good values, tagged
+    with the time they were fetched under "calibrated_at"; it is only missing
+    from the result if it never succeeded.
+    """
+    fetched = _fetch_all(get_volatility, period, timeout, max_workers)
+    fetched_at = datetime.now()
+    vols = {}
+    with _last_volatilities_lock:
+        for asset, (vol, drift) in fetched.items():
+            _last_volatilities[asset] = ({"volatility": vol, "drift": drift}, fetched_at)
+        for asset in ASSET_TICKERS:
+            if asset in fetched:
+                vols[asset] = dict(_last_volatilities[asset][0])
+            elif asset in _last_volatilities:
+                params, calibrated_at = _last_volatilities[asset]
+                print(f"Warning: using previous volatility for {asset} from {calibrated_at.isoformat()}")
+                vols[asset] = dict(params, calibrated_at=calibrated_at)
+    return vols
+
+def get_all_returns(period="2d", timeout=20.0, max_workers=None):
+    """Get time-aligned returns for all Synth subnet assets, one column per asset."""
+    series = _fetch_all(get_returns, period, timeout, max_workers)
+    return pd.DataFrame({asset: series[asset] for asset in ASSET_TICKERS if asset in series})
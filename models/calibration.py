@@ -0,0 +1,347 @@
+"""
+Background calibration of per-asset volatility and drift.
+
+A CalibrationScheduler refreshes parameters on its own thread and publishes
+immutable CalibrationSnapshots by swapping a single reference, so request
+handlers read a ready snapshot and never wait on the network. A
+CalibrationStore persists snapshots so a restarted process starts warm.
+"""
+
+import os
+import json
+import random
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Mapping, Optional, Union
+
+from .baseline.volatility_calculator import get_all_volatilities, ASSET_TICKERS
+
+Params = Dict[str, float]
+
+
+def _local_naive(time: datetime) -> datetime:
+    """Timezone-aware times as naive local time, matching datetime.now()."""
+    return time.astimezone().replace(tzinfo=None) if time.tzinfo is not None else time
+
+
+class CalibrationSnapshot:
+    """
+    Immutable set of calibrated parameters.
+
+    Attributes:
+        params: Asset -> {'volatility': float, 'drift': float}
+        calibrated_at: Asset -> time its parameters were fetched
+        created_at: Time the snapshot was published
+    """
+
+    __slots__ = ("params", "calibrated_at", "created_at")
+
+    def __init__(self,
+                 params: Mapping[str, Params],
+                 calibrated_at: Mapping[str, datetime],
+                 created_at: datetime = None):
+        self.params = {asset: dict(p) for asset, p in params.items()}
+        self.calibrated_at = {asset: _local_naive(t) for asset, t in calibrated_at.items()}
+        self.created_at = _local_naive(created_at) if created_at else datetime.now()
+
+    def get(self, asset: str) -> Optional[Params]:
+        """Parameters for an asset, or None if it has never been calibrated."""
+        return self.params.get(asset)
+
+    def age(self, asset: str, now: datetime = None) -> Optional[float]:
+        """Seconds since an asset was calibrated, or None if it never was."""
+        if asset not in self.calibrated_at:
+            return None
+        return ((now or datetime.now()) - self.calibrated_at[asset]).total_seconds()
+
+    def merged(self, params: Mapping[str, Params],
+               calibrated_at: Union[datetime, Mapping[str, datetime]],
+               created_at: datetime = None) -> "CalibrationSnapshot":
+        """
+        New snapshot with params overriding this one; other assets are kept.
+
+        calibrated_at is either one time for every asset in params or a
+        per-asset mapping; created_at defaults to the single time, or now.
+        """
+        per_asset = isinstance(calibrated_at, Mapping)
+        merged_params = dict(self.params)
+        merged_times = dict(self.calibrated_at)
+        for asset, p in params.items():
+            merged_params[asset] = p
+            merged_times[asset] = calibrated_at[asset] if per_asset else calibrated_at
+        return CalibrationSnapshot(merged_params, merged_times,
+                                   created_at or (None if per_asset else calibrated_at))
+
+    def __repr__(self) -> str:
+        return f"CalibrationSnapshot(assets={sorted(self.params)}, created_at={self.created_at.isoformat()})"
+
+
+EMPTY_SNAPSHOT = CalibrationSnapshot({}, {})
+
+
+class CalibrationStore:
+    """
+    JSON file store for calibration snapshots.
+
+    Staleness policy on load: parameters younger than ttl are fresh and used
+    as-is; parameters up to max_age old are used but trigger an immediate
+    refresh; anything older is discarded.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: str, ttl: float = 6 * 3600, max_age: float = 72 * 3600):
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file path (parent directories are created on save)
+            ttl: Seconds a stored calibration counts as fresh
+            max_age: Seconds after which a stored calibration is discarded
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+
+    def save(self, snapshot: CalibrationSnapshot):
+        """Write a snapshot atomically (temp file + rename)."""
+        payload = {
+            "schema_version": self.SCHEMA_VERSION,
+            "saved_at": snapshot.created_at.isoformat(),
+            "assets": {
+                asset: {
+                    "volatility": float(params["volatility"]),
+                    "drift": float(params["drift"]),
+                    "calibrated_at": snapshot.calibrated_at[asset].isoformat()
+                }
+                for asset, params in snapshot.params.items()
+            }
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, now: datetime = None) -> Optional[CalibrationSnapshot]:
+        """
+        Load the stored snapshot, dropping assets older than max_age.
+
+        Returns:
+            CalibrationSnapshot, or None if the file is missing, unreadable,
+            from another schema version, or entirely expired
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                payload = json.load(f)
+            if payload.get("schema_version") != self.SCHEMA_VERSION:
+                print(f"Warning: ignoring calibration store {self.path} with "
+                      f"schema version {payload.get('schema_version')}")
+                return None
+
+            now = _local_naive(now or datetime.now())
+            saved_at = _local_naive(datetime.fromisoformat(payload["saved_at"]))
+            params, calibrated_at = {}, {}
+            for asset, entry in payload["assets"].items():
+                fetched = _local_naive(datetime.fromisoformat(entry["calibrated_at"]))
+                if (now - fetched).total_seconds() > self.max_age:
+                    continue
+                params[asset] = {"volatility": float(entry["volatility"]), "drift": float(entry["drift"])}
+                calibrated_at[asset] = fetched
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Warning: could not read calibration store {self.path}: {e}")
+            return None
+
+        if not params:
+            return None
+        return CalibrationSnapshot(params, calibrated_at, saved_at)
+
+    def seconds_until_stale(self, snapshot: CalibrationSnapshot, assets, now: datetime = None) -> float:
+        """Seconds until the oldest of assets passes ttl (0 if any is stale or missing)."""
+        now = now or datetime.now()
+        if any(asset not in snapshot.calibrated_at for asset in assets):
+            return 0.0
+        oldest = min(snapshot.calibrated_at[asset] for asset in assets)
+        return max(0.0, (oldest + timedelta(seconds=self.ttl) - now).total_seconds())
+
+
+class CalibrationScheduler:
+    """
+    Periodically refresh volatility/drift for every asset on a daemon thread.
+
+    Successful refreshes are rescheduled after interval seconds (+/- jitter);
+    failed or partial refreshes retry with exponential backoff, keeping the
+    last good parameters for the assets that failed.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[], Mapping[str, Params]] = get_all_volatilities,
+                 assets=tuple(ASSET_TICKERS),
+                 interval: float = 6 * 3600,
+                 jitter: float = 0.1,
+                 retry_delay: float = 60.0,
+                 max_retry_delay: float = 3600.0,
+                 store: CalibrationStore = None,
+                 seed=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            fetch: Callable returning {asset: {'volatility', 'drift'}}; assets
+                   that failed are simply missing
+            assets: Assets a refresh is expected to cover
+            interval: Seconds between successful refreshes
+            jitter: Relative jitter applied to interval (0.1 = +/-10%)
+            retry_delay: First retry delay in seconds after a failed refresh
+            max_retry_delay: Cap on the backoff delay
+            store: Optional CalibrationStore; loaded by load_store() and
+                   written after every refresh
+            seed: Seed for the jitter
+        """
+        self.fetch = fetch
+        self.assets = list(assets)
+        self.interval = interval
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.store = store
+
+        self._snapshot = EMPTY_SNAPSHOT
+        self._random = random.Random(seed)
+        self._failures = 0
+        self._refresh_lock = threading.Lock()
+        self._last_refresh_ok = False
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> CalibrationSnapshot:
+        """Latest published snapshot (never blocks)."""
+        return self._snapshot
+
+    def publish(self, snapshot: CalibrationSnapshot):
+        """Atomically replace the current snapshot."""
+        self._snapshot = snapshot
+        if snapshot.params:
+            self._ready.set()
+
+    def load_store(self) -> float:
+        """
+        Publish the stored snapshot, if any.
+
+        Returns:
+            Seconds until the loaded parameters go stale (0 = refresh now)
+        """
+        if self.store is None:
+            return 0.0
+        snapshot = self.store.load()
+        if snapshot is None:
+            return 0.0
+        self.publish(snapshot)
+        return self.store.seconds_until_stale(snapshot, self.assets)
+
+    def refresh(self, timeout: float = None) -> bool:
+        """
+        Fetch parameters once and publish them.
+
+        Refreshes are serialized (the scheduler thread and request handlers
+        may both call this): if one is already in flight, wait for it, up to
+        timeout seconds, and return its outcome instead of fetching again.
+
+        Returns:
+            True if every asset was refreshed
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            if not self._refresh_lock.acquire(timeout=-1 if timeout is None else timeout):
+                return False
+            self._refresh_lock.release()
+            return self._last_refresh_ok
+        try:
+            self._last_refresh_ok = self._refresh()
+            return self._last_refresh_ok
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> bool:
+        try:
+            params = self.fetch() or {}
+        except Exception as e:
+            print(f"Warning: calibration fetch failed: {e}")
+            params = {}
+
+        now = datetime.now()
+        params = {asset: p for asset, p in params.items() if asset in self.assets}
+        # Fallback values carry the time they were really fetched; they only
+        # count as calibrated, and replace the snapshot, if newer than it
+        times = {asset: _local_naive(p.get("calibrated_at", now)) for asset, p in params.items()}
+        fresh = [asset for asset in params if "calibrated_at" not in params[asset]]
+        updates = {asset: {k: v for k, v in p.items() if k != "calibrated_at"}
+                   for asset, p in params.items()
+                   if asset not in self._snapshot.calibrated_at
+                   or times[asset] > self._snapshot.calibrated_at[asset]}
+        if updates:
+            self.publish(self._snapshot.merged(updates, times, now))
+            if self.store is not None:
+                try:
+                    self.store.save(self._snapshot)
+                except OSError as e:
+                    print(f"Warning: could not save calibration store: {e}")
+
+        missing = [asset for asset in self.assets if asset not in fresh]
+        if missing:
+            print(f"Warning: calibration missing for {missing}, keeping previous parameters")
+        return not missing
+
+    def next_delay(self, success: bool) -> float:
+        """Seconds until the next refresh."""
+        if success:
+            self._failures = 0
+            return self.interval * (1 + self._random.uniform(-self.jitter, self.jitter))
+        self._failures += 1
+        return min(self.retry_delay * 2 ** (self._failures - 1), self.max_retry_delay)
+
+    def start(self, delay: float = None):
+        """
+        Start the refresh thread (no-op if already running).
+
+        By default the stored snapshot is loaded first and the first refresh
+        waits until it goes stale (at most one interval); pass delay to override.
+        """
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            stale_in = self.load_store() if not self._ready.is_set() else 0.0
+            if delay is None:
+                delay = min(stale_in, self.interval)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(delay,),
+                                            name="calibration-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """Block until a snapshot with parameters is available (for startup and tests)."""
+        return self._ready.wait(timeout)
+
+    def _run(self, delay: float):
+        while not self._stop.wait(delay):
+            delay = self.next_delay(self.refresh())
@@ -8,10 +8,16 @@ CRPS measures how well our probability distributions match actual outcomes.
 Lower CRPS = better forecasts = more TAO rewards.
 """
 
+import copy
+import time
 import numpy as np
-from typing import List, Dict, Any, Union, Tuple
+from typing import List, Dict, Any, Union, Tuple, Sequence
 from datetime import datetime
 
+from .result import SimulationResult
+from .rng import make_rng, spawn_rngs, SeedLike
+from .sampling import SAMPLING_METHODS, resolve_dtype
+
 
 class CRPSCalculator:
     """
@@ -21,12 +27,20 @@ class CRPSCalculator:
     It's particularly useful for evaluating ensemble forecasts and probabilistic predictions.
     """
     
-    def __init__(self):
-        """Initialize the CRPS calculator."""
+    def __init__(self, rng: SeedLike = None, dtype=np.float64):
+        """
+        Initialize the CRPS calculator.
+        
+        Args:
+            rng: Seed or numpy Generator used for pair sampling
+            dtype: Working dtype for price arrays, np.float64 (default) or np.float32
+        """
         self.name = "CRPS Calculator"
+        self.rng = make_rng(rng)
+        self.dtype = resolve_dtype(dtype)
     
     def calculate_crps(self, 
-                      predictions: List[List[Dict[str, Any]]], 
+                      predictions: Union[np.ndarray, SimulationResult, List[List[Dict[str, Any]]]], 
                       actual_prices: List[float],
                       actual_times: List[datetime]) -> float:
         """
@@ -35,6 +49,7 @@ class CRPSCalculator:
         Args:
             predictions: List of simulation paths, each containing price predictions
                         Format: [[{'time': '2023-01-01T00:00:00', 'price': 100.0}, ...], ...]
+                        or a (num_simulations, num_time_points) price array or SimulationResult
             actual_prices: List of actual observed prices
             actual_times: List of actual observation times (must match prediction times)
             
@@ -44,7 +59,7 @@ class CRPSCalculator:
         Raises:
             ValueError: If inputs are invalid or don't match
         """
-        if not predictions or not actual_prices or not actual_times:
+        if len(predictions) == 0 or not actual_prices or not actual_times:
             raise ValueError("All inputs must be non-empty")
         
         if len(actual_prices) != len(actual_times):
@@ -54,12 +69,13 @@ class CRPSCalculator:
         if len(predictions[0]) != len(actual_times):
             raise ValueError(f"Number of predictions ({len(predictions[0])}) must match number of actual times ({len(actual_times)})")
         
+        price_matrix = self._to_price_matrix(predictions)
         total_crps = 0.0
         
         # Calculate CRPS for each time point
         for time_idx in range(len(actual_times)):
-            # Extract all predicted prices for this time point across simulations
-            predicted_prices = [simulation[time_idx]['price'] for simulation in predictions]
+            # All predicted prices for this time point across simulations
+            predicted_prices = price_matrix[:, time_idx]
             actual_price = actual_prices[time_idx]
             
             # Calculate CRPS for this time point
@@ -69,7 +85,125 @@ class CRPSCalculator:
         # Return average CRPS across all time points
         return total_crps / len(actual_times)
     
-    def _calculate_point_crps(self, predicted_prices: List[float], actual_price: float) -> float:
+    def calculate_crps_array(self,
+                             paths: np.ndarray,
+                             actual_prices: Sequence[float]) -> float:
+        """
+        Exact CRPS for a price array, vectorized over all time points.
+        
+        Uses E|X - x| - 0.5 * E|X - X'| over all pairs of simulations, with the
+        pair term computed from sorted prices instead of sampling.
+        
+        Args:
+            paths: Array of shape (num_simulations, num_time_points)
+            actual_prices: Observed price at each time point
+            
+        Returns:
+            float: Average CRPS across all time points (lower is better)
+        """
+        if isinstance(paths, SimulationResult):
+            paths = paths.prices
+        paths = np.asarray(paths, dtype=self.dtype)
+        actual = np.asarray(actual_prices, dtype=self.dtype)
+        if paths.ndim != 2 or paths.shape[0] == 0:
+            raise ValueError("paths must be a non-empty (num_simulations, num_time_points) array")
+        if paths.shape[1] != actual.shape[0]:
+            raise ValueError(f"Number of predictions ({paths.shape[1]}) must match number of actual prices ({actual.shape[0]})")
+        
+        return float(self.calculate_crps_batch(paths[np.newaxis], actual)[0])
+    
+    def calculate_crps_batch(self,
+                             paths: np.ndarray,
+                             actual_prices: Sequence[float]) -> np.ndarray:
+        """
+        Exact CRPS for a batch of candidate path arrays against one outcome.
+        
+        Args:
+            paths: Array of shape (num_candidates, num_simulations, num_time_points),
+                   or a sequence of SimulationResults with the same shape
+            actual_prices: Observed price at each time point
+            
+        Returns:
+            Array of shape (num_candidates,) with each candidate's average CRPS
+        """
+        if not isinstance(paths, np.ndarray):
+            paths = [p.prices if isinstance(p, SimulationResult) else p for p in paths]
+        paths = np.asarray(paths, dtype=self.dtype)
+        actual = np.asarray(actual_prices, dtype=self.dtype)
+        n = paths.shape[1]
+        first_term = np.abs(paths - actual).mean(axis=1)
+        
+        # sum_ij |x_i - x_j| = 2 * sum_i (2i - n - 1) * x_(i) for sorted x
+        ranks = 2 * np.arange(1, n + 1, dtype=paths.dtype) - n - 1
+        pair_term = 2 * np.einsum("s,ksp->kp", ranks, np.sort(paths, axis=1)) / n ** 2
+        
+        return np.mean(first_term - 0.5 * pair_term, axis=1)
+    
+    def compare_sampling_methods(self,
+                                 model,
+                                 start_price: float,
+                                 actual_prices: Sequence[float],
+                                 time_increment: int = 300,
+                                 num_simulations: int = 100,
+                                 methods: Sequence[str] = SAMPLING_METHODS,
+                                 repeats: int = 20,
+                                 seed: Union[None, int, np.random.SeedSequence] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Measure CRPS and compute cost of each shock sampling method.
+        
+        The model is re-run `repeats` times per method with independent streams;
+        a lower crps_std at the same path budget is the variance reduction.
+        
+        Args:
+            model: PathModel with a `sampling` attribute
+            start_price: Starting price of the asset
+            actual_prices: Observed prices, including the start point
+            time_increment: Time between predictions in seconds
+            num_simulations: Path budget per run
+            methods: Sampling methods to compare
+            repeats: Independent runs per method
+            seed: Seed for reproducible comparisons
+            
+        Returns:
+            Dict mapping method to crps_mean, crps_std and seconds_per_run
+        """
+        num_steps = len(actual_prices) - 1
+        rngs = spawn_rngs(seed, len(methods) * repeats)
+        results = {}
+        
+        for m, method in enumerate(methods):
+            candidate = copy.copy(model)
+            candidate.sampling = method
+            
+            scores = []
+            elapsed = 0.0
+            for r in range(repeats):
+                rng = rngs[m * repeats + r]
+                t0 = time.perf_counter()
+                paths = candidate.simulate(start_price, num_steps, num_simulations,
+                                           rng=rng, time_increment=time_increment)
+                elapsed += time.perf_counter() - t0
+                scores.append(self.calculate_crps_array(paths, actual_prices))
+            
+            results[method] = {
+                'crps_mean': float(np.mean(scores)),
+                'crps_std': float(np.std(scores)),
+                'seconds_per_run': elapsed / repeats
+            }
+        
+        return results
+    
+    def _to_price_matrix(self, predictions: Union[np.ndarray, SimulationResult, List[List[Dict[str, Any]]]]) -> np.ndarray:
+        """Return predictions as a (num_simulations, num_time_points) price array."""
+        if isinstance(predictions, SimulationResult):
+            # Use the array directly instead of materializing the Synth dicts
+            predictions = predictions.prices
+        if isinstance(predictions, np.ndarray):
+            return predictions.astype(self.dtype, copy=False)
+        return np.array([[point['price'] for point in simulation] for simulation in predictions],
+                        dtype=self.dtype)
+    
+    def _calculate_point_crps(self, predicted_prices: Union[np.ndarray, List[float]], actual_price: float) -> float:
         """
         Calculate CRPS for a single time point.
         
@@ -80,11 +214,11 @@ class CRPSCalculator:
         Returns:
             float: CRPS for this time point
         """
-        if not predicted_prices:
+        if len(predicted_prices) == 0:
             raise ValueError("predicted_prices cannot be empty")
         
         # Convert to numpy array for efficient computation
-        pred_array = np.array(predicted_prices)
+        pred_array = np.asarray(predicted_prices, dtype=self.dtype)
         actual = float(actual_price)
         
         # CRPS formula: E|X - x| - 0.5 * E|X - X'|
@@ -105,7 +239,7 @@ class CRPSCalculator:
             
             for _ in range(n_pairs):
                 # Randomly sample two different predictions
-                idx1, idx2 = np.random.choice(n_preds, size=2, replace=False)
+                idx1, idx2 = self.rng.choice(n_preds, size=2, replace=False)
                 pair_diffs.append(abs(pred_array[idx1] - pred_array[idx2]))
             
             second_term = 0.5 * np.mean(pair_diffs)
@@ -113,7 +247,7 @@ class CRPSCalculator:
             second_term = 0.0
         
         crps = first_term - second_term
-        return max(0.0, crps)  # CRPS should be non-negative
+        return max(0.0, float(crps))  # CRPS should be non-negative
     
     def calculate_crps_for_synth(self, 
                                 predictions: List[List[Dict[str, Any]]], 
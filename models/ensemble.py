@@ -0,0 +1,99 @@
+"""
+Array-level helpers for combining component model paths.
+
+Component models each return a (num_simulations, num_steps + 1) price array;
+the ensemble combines them with one weighted tensor reduction instead of
+walking simulations and steps in Python.
+"""
+
+import numpy as np
+from typing import Dict, Mapping
+
+
+def renormalize_weights(weights: Mapping[str, float], available) -> Dict[str, float]:
+    """
+    Restrict weights to the available components and rescale them to sum to 1.
+
+    Args:
+        weights: Mapping of component name to weight
+        available: Names of the components that produced paths
+
+    Returns:
+        Dict of renormalized weights for the available components
+
+    Raises:
+        ValueError: If none of the available components has positive weight
+    """
+    kept = {name: float(weights[name]) for name in available if weights.get(name, 0) > 0}
+    total = sum(kept.values())
+    if total <= 0:
+        raise ValueError("No available component has a positive weight")
+    return {name: w / total for name, w in kept.items()}
+
+
+def weighted_combination(component_paths: Mapping[str, np.ndarray],
+                         weights: Mapping[str, float]) -> np.ndarray:
+    """
+    Point-wise weighted average of component path arrays.
+
+    Weights are renormalized over the components present in component_paths,
+    so a failed component does not shrink the combined prices.
+
+    Args:
+        component_paths: Mapping of component name to (num_simulations, num_points) array
+        weights: Mapping of component name to weight
+
+    Returns:
+        Combined (num_simulations, num_points) price array
+    """
+    used = renormalize_weights(weights, component_paths)
+    names = list(used)
+    stack = np.stack([component_paths[name] for name in names])
+    w = np.array([used[name] for name in names], dtype=stack.dtype)
+    return np.tensordot(w, stack, axes=1)
+
+
+def allocate_paths(weights: Mapping[str, float], num_paths: int) -> Dict[str, int]:
+    """
+    Split a path budget across components in proportion to their weights.
+
+    Uses largest-remainder rounding so the counts always sum to num_paths.
+
+    Args:
+        weights: Mapping of component name to weight
+        num_paths: Total number of paths to allocate
+
+    Returns:
+        Dict of component name to number of paths (components with 0 omitted)
+    """
+    normalized = renormalize_weights(weights, weights)
+    quotas = {name: w * num_paths for name, w in normalized.items()}
+    counts = {name: int(np.floor(q + 1e-9)) for name, q in quotas.items()}
+
+    shortfall = num_paths - sum(counts.values())
+    by_remainder = sorted(quotas, key=lambda name: quotas[name] - counts[name], reverse=True)
+    for name in by_remainder[:shortfall]:
+        counts[name] += 1
+
+    return {name: n for name, n in counts.items() if n > 0}
+
+
+def mixture_combination(component_paths: Mapping[str, np.ndarray],
+                        rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Pool component paths into one mixture sample.
+
+    Unlike weighted_combination, each output path is a path from a single
+    component, so the mixture keeps every component's full spread.
+
+    Args:
+        component_paths: Mapping of component name to (n_i, num_points) array
+        rng: If given, shuffle the pooled paths so rows aren't grouped by component
+
+    Returns:
+        (sum n_i, num_points) price array
+    """
+    pooled = np.concatenate(list(component_paths.values()))
+    if rng is not None:
+        pooled = pooled[rng.permutation(len(pooled))]
+    return pooled
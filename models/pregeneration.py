@@ -0,0 +1,198 @@
+"""
+Speculative pre-generation of prompt responses.
+
+Synth prompts arrive for fixed assets and windows on a regular cadence, so
+paths for the next slots can be simulated before the request arrives. Paths
+are generated at the latest known price and rescaled to the live start
+price when served, which keeps the models' absolute price floors meaningful;
+the time strings come from the shared time grid, which is built
+during pre-generation as well.
+"""
+
+import threading
+import numpy as np
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Hashable, List, Optional, Sequence
+
+from .result import SimulationResult
+from .timegrid import time_grid
+
+
+class PregenerationService:
+    """
+    Bounded cache of paths for upcoming prompt slots.
+
+    A slot is (asset, start_time, time_increment, time_horizon, num_simulations).
+    Entries are tagged with the version returned by version_fn (e.g. the
+    calibration snapshot time) and ignored once it changes.
+    """
+
+    def __init__(self,
+                 generate: Callable[..., SimulationResult],
+                 assets: Sequence[str],
+                 time_increment: int = 300,
+                 time_horizon: int = 86400,
+                 num_simulations: int = 100,
+                 cadence: float = 300.0,
+                 lead_time: float = 300.0,
+                 prompt_lead: float = 120.0,
+                 poll_interval: float = 10.0,
+                 cache_size: int = 64,
+                 version_fn: Callable[[], Hashable] = None,
+                 price_fn: Callable[[str], Optional[float]] = None):
+        """
+        Initialize the service.
+
+        Args:
+            generate: generate(asset, start_price, start_time, time_increment,
+                      time_horizon, num_simulations) -> SimulationResult; it runs
+                      on the background thread, so it should not share state with
+                      live requests and should finish by start_time
+            assets: Assets to pre-generate for
+            time_increment: Expected prompt time increment in seconds
+            time_horizon: Expected prompt horizon in seconds
+            num_simulations: Expected number of paths per prompt
+            cadence: Prompt start times are assumed to fall on multiples of
+                     this many seconds (UTC); every slot costs one run per
+                     asset, so keep it no finer than the actual prompt cadence
+            lead_time: How far ahead (seconds) to pre-generate slots; must
+                       exceed prompt_lead + poll_interval + the generate()
+                       runtime, or paths are ready only after the request
+            prompt_lead: Prompts arrive at least this many seconds before
+                         their start_time, so closer slots are skipped
+            poll_interval: Seconds between background passes
+            cache_size: Maximum number of cached slots
+            version_fn: Optional callable; entries generated under another
+                        version are treated as misses
+            price_fn: Optional callable returning the latest price of an asset
+                      (None if unknown); paths are generated at that price.
+                      Without it they are generated at a unit price
+        """
+        self.generate = generate
+        self.assets = list(assets)
+        self.time_increment = time_increment
+        self.time_horizon = time_horizon
+        self.num_simulations = num_simulations
+        self.cadence = cadence
+        self.lead_time = lead_time
+        self.prompt_lead = prompt_lead
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self.version_fn = version_fn or (lambda: None)
+        self.price_fn = price_fn or (lambda asset: 1.0)
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+
+    def upcoming_slots(self, now: datetime = None) -> List[datetime]:
+        """Cadence-aligned UTC start times in (now + prompt_lead, now + lead_time]."""
+        now = now or datetime.now(timezone.utc)
+        epoch = now.timestamp()
+        first = (int((epoch + self.prompt_lead) // self.cadence) + 1) * self.cadence
+        slots = []
+        t = first
+        while t <= epoch + self.lead_time:
+            slots.append(datetime.fromtimestamp(t, timezone.utc))
+            t += self.cadence
+        return slots
+
+    def pregenerate(self, asset: str, start_time: datetime,
+                    time_increment: int = None, time_horizon: int = None,
+                    num_simulations: int = None) -> bool:
+        """
+        Simulate and cache paths for one slot at the latest known price
+        (no-op if cached).
+
+        Returns:
+            True if new paths were generated; False if the slot was cached
+            or no price is known for the asset
+        """
+        key = self._key(asset, start_time, time_increment, time_horizon, num_simulations)
+        version = self.version_fn()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                return False
+
+        price = self.price_fn(asset)
+        if price is None or not np.isfinite(price) or price <= 0:
+            return False
+
+        _, _, increment, horizon, n_sims = key
+        result = self.generate(asset, float(price), start_time, increment, horizon, n_sims)
+        time_grid(start_time, increment, horizon)
+
+        with self._lock:
+            self._cache[key] = (version, result.prices, float(price))
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return True
+
+    def get(self, asset: str, start_price: float, start_time: datetime,
+            time_increment: int = None, time_horizon: int = None,
+            num_simulations: int = None) -> Optional[SimulationResult]:
+        """
+        Serve a cached slot scaled to start_price, or None on a miss.
+
+        Each slot is served once; the entry is removed on a hit.
+        """
+        key = self._key(asset, start_time, time_increment, time_horizon, num_simulations)
+        version = self.version_fn()
+        with self._lock:
+            cached = self._cache.pop(key, None)
+            if cached is None or cached[0] != version:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        prices = (float(start_price) / cached[2]) * cached[1]
+        np.maximum(prices, 0.01, out=prices)
+        return SimulationResult(prices, start_time, key[2])
+
+    def run_once(self, now: datetime = None) -> int:
+        """Pre-generate every upcoming slot for every asset; returns the number generated."""
+        generated = 0
+        for start_time in self.upcoming_slots(now):
+            for asset in self.assets:
+                try:
+                    generated += self.pregenerate(asset, start_time)
+                except Exception as e:
+                    print(f"Warning: pre-generation failed for {asset} at {start_time.isoformat()}: {e}")
+        return generated
+
+    def start(self):
+        """Start the background pre-generation thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pregeneration", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def _key(self, asset, start_time, time_increment, time_horizon, num_simulations):
+        # Slots are tz-aware UTC; a naive request time is local, like datetime.now()
+        return (asset, start_time.astimezone(timezone.utc),
+                self.time_increment if time_increment is None else time_increment,
+                self.time_horizon if time_horizon is None else time_horizon,
+                self.num_simulations if num_simulations is None else num_simulations)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.poll_interval)
@@ -0,0 +1,60 @@
+"""
+Process-wide registry of long-lived model instances.
+
+Building a model per request throws away everything it has cached
+(calibration, per-window paths). The registry keeps one warm instance per
+key (e.g. per asset) and hands the same instance to every request.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+
+class ModelRegistry:
+    """
+    Thread-safe, lazily populated mapping of key -> model instance.
+
+    Instances are built by factory(key) on first use and live until they are
+    invalidated.
+    """
+
+    def __init__(self, factory: Callable[[Hashable], Any]):
+        """
+        Initialize the registry.
+
+        Args:
+            factory: Callable building the model for a key
+        """
+        self.factory = factory
+        self._models: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the instance for key, building it on first use."""
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self.factory(key)
+                self._models[key] = model
+            return model
+
+    def invalidate(self, key: Hashable = None):
+        """Drop the instance for key (or every instance); the next get() rebuilds it."""
+        with self._lock:
+            if key is None:
+                self._models.clear()
+            else:
+                self._models.pop(key, None)
+
+    def keys(self) -> List[Hashable]:
+        """Keys with a live instance."""
+        with self._lock:
+            return list(self._models)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._models
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
@@ -0,0 +1,104 @@
+"""
+Lazy container for simulated price paths.
+
+SimulationResult keeps the price array and the time grid parameters, and
+only builds the Synth [[{"time", "price"}]] structure when a path is indexed
+or the whole result is serialized.
+"""
+
+import json
+import numpy as np
+from typing import List, Dict, Any, Iterator, Union
+from datetime import datetime
+
+from .timegrid import time_grid
+
+
+def format_paths(paths: np.ndarray,
+                 start_time: datetime,
+                 time_increment: int = 300) -> List[List[Dict[str, Any]]]:
+    """
+    Convert a price array into the Synth subnet prediction format.
+
+    Args:
+        paths: Array of shape (num_simulations, num_steps + 1)
+        start_time: Time of the first column
+        time_increment: Time between columns in seconds
+
+    Returns:
+        List of simulation paths: [[{'time': iso_string, 'price': float}, ...], ...]
+    """
+    times = time_grid(start_time, time_increment, (paths.shape[1] - 1) * time_increment).iso
+    return [
+        [{"time": t, "price": price} for t, price in zip(times, path)]
+        for path in paths.tolist()
+    ]
+
+
+class SimulationResult:
+    """
+    Simulated price paths with deferred Synth formatting.
+
+    Behaves like the list returned by predict() for len(), indexing and
+    iteration, while internal consumers read the prices array directly.
+    """
+
+    def __init__(self,
+                 prices: np.ndarray,
+                 start_time: datetime,
+                 time_increment: int = 300):
+        """
+        Initialize the result.
+
+        Args:
+            prices: Array of shape (num_simulations, num_steps + 1)
+            start_time: Time of the first column
+            time_increment: Time between columns in seconds
+        """
+        self.prices = prices
+        self.start_time = start_time
+        self.time_increment = time_increment
+        self._formatted = None
+
+    @property
+    def num_simulations(self) -> int:
+        return self.prices.shape[0]
+
+    @property
+    def num_points(self) -> int:
+        return self.prices.shape[1]
+
+    @property
+    def timestamps(self):
+        """Shared TimeGrid for the columns (epoch seconds and ISO strings)."""
+        return time_grid(self.start_time, self.time_increment,
+                         (self.num_points - 1) * self.time_increment)
+
+    def __len__(self) -> int:
+        return self.num_simulations
+
+    def __getitem__(self, index: Union[int, slice]):
+        if self._formatted is not None:
+            return self._formatted[index]
+        if isinstance(index, slice):
+            return format_paths(self.prices[index], self.start_time, self.time_increment)
+        path = self.prices[index]
+        return format_paths(path[np.newaxis, :], self.start_time, self.time_increment)[0]
+
+    def __iter__(self) -> Iterator[List[Dict[str, Any]]]:
+        return iter(self.to_list())
+
+    def to_list(self) -> List[List[Dict[str, Any]]]:
+        """Materialize (once) and return the Synth list-of-dicts format."""
+        if self._formatted is None:
+            self._formatted = format_paths(self.prices, self.start_time, self.time_increment)
+        return self._formatted
+
+    def to_json(self) -> str:
+        """Serialize to the Synth JSON format."""
+        return json.dumps(self.to_list())
+
+    def __repr__(self) -> str:
+        return (f"SimulationResult(num_simulations={self.num_simulations}, "
+                f"num_points={self.num_points}, start_time={self.start_time.isoformat()}, "
+                f"time_increment={self.time_increment})")
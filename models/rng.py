@@ -0,0 +1,45 @@
+"""
+Random number generation helpers.
+
+Models draw from their own numpy Generator (PCG64) instead of the global
+np.random state. Independent, reproducible streams for ensemble components
+or parallel workers are spawned from a SeedSequence.
+"""
+
+import numpy as np
+from typing import List, Union
+
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def make_rng(seed: SeedLike = None) -> np.random.Generator:
+    """
+    Build a PCG64 Generator.
+
+    Args:
+        seed: None (fresh OS entropy), an int, a SeedSequence, or an existing
+              Generator (returned unchanged)
+
+    Returns:
+        numpy Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+def spawn_seed_sequences(seed: Union[None, int, np.random.SeedSequence], n: int) -> List[np.random.SeedSequence]:
+    """
+    Spawn n independent child SeedSequences.
+
+    Passing the same SeedSequence again continues its spawn counter, so
+    successive calls yield new (but still reproducible) children.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
+def spawn_rngs(seed: Union[None, int, np.random.SeedSequence], n: int) -> List[np.random.Generator]:
+    """Spawn n independent PCG64 Generators from one seed."""
+    return [make_rng(child) for child in spawn_seed_sequences(seed, n)]
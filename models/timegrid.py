@@ -0,0 +1,60 @@
+"""
+Shared timestamp grid for simulated paths.
+
+Every path in a prompt uses the same time grid, so the epoch seconds and ISO
+strings are built once per (start_time, time_increment, time_horizon) and
+shared by all models, the ensemble and the Synth serializer.
+"""
+
+import numpy as np
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Tuple
+
+
+class TimeGrid:
+    """
+    Immutable time grid of num_points = time_horizon / time_increment + 1 points.
+
+    Attributes:
+        epoch: Read-only float64 array of POSIX timestamps (seconds)
+        iso: Tuple of ISO 8601 strings, one per point
+    """
+
+    __slots__ = ("start_time", "time_increment", "time_horizon", "epoch", "iso")
+
+    def __init__(self, start_time: datetime, time_increment: int, time_horizon: int):
+        num_points = int(time_horizon / time_increment) + 1
+        self.start_time = start_time
+        self.time_increment = time_increment
+        self.time_horizon = time_horizon
+
+        self.epoch = start_time.timestamp() + time_increment * np.arange(num_points, dtype=np.float64)
+        self.epoch.flags.writeable = False
+        self.iso: Tuple[str, ...] = tuple(
+            (start_time + timedelta(seconds=step * time_increment)).isoformat()
+            for step in range(num_points)
+        )
+
+    def __len__(self) -> int:
+        return len(self.iso)
+
+    def __repr__(self) -> str:
+        return (f"TimeGrid(start_time={self.start_time.isoformat()}, "
+                f"time_increment={self.time_increment}, num_points={len(self)})")
+
+
+@lru_cache(maxsize=64)
+def time_grid(start_time: datetime, time_increment: int = 300, time_horizon: int = 86400) -> TimeGrid:
+    """
+    Return the (cached) time grid for a prompt window.
+
+    Args:
+        start_time: Time of the first point
+        time_increment: Time between points in seconds
+        time_horizon: Time from the first to the last point in seconds
+
+    Returns:
+        Shared TimeGrid instance; treat it as read-only
+    """
+    return TimeGrid(start_time, time_increment, time_horizon)
@@ -0,0 +1,226 @@
+"""
+Offline CRPS-driven tuning of ensemble weights.
+
+Each component is simulated once per historical window and the arrays are
+cached; candidate weight vectors are then scored by recombining the cached
+arrays and computing the exact CRPS, so trying hundreds of weightings costs
+no extra simulation. Candidates are combined the way the ensemble serves
+them: a point-wise weighted average (one tensor contraction) or, in mixture
+mode, each component's share of the paths pooled together.
+"""
+
+import itertools
+import numpy as np
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+from .crps import CRPSCalculator
+from .ensemble import allocate_paths
+from .rng import spawn_rngs
+
+MODES = ("average", "mixture")
+
+
+class ComponentPathCache:
+    """
+    Component path arrays and realized prices for a set of historical windows.
+
+    Every window stores one (num_simulations, num_points) array per component,
+    simulated from the window's first realized price.
+    """
+
+    def __init__(self,
+                 models: Mapping,
+                 time_increment: int = 300,
+                 num_simulations: int = 100,
+                 seed=None,
+                 before_window: Callable[[float], None] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            models: Mapping of component name to PathModel
+            time_increment: Time between points in seconds
+            num_simulations: Paths per component per window
+            seed: Seed (int or SeedSequence) for reproducible windows
+            before_window: Optional hook called with the start price before
+                           each window is simulated (e.g. to set a mean price)
+        """
+        self.models = dict(models)
+        self.names = list(self.models)
+        self.time_increment = time_increment
+        self.num_simulations = num_simulations
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.before_window = before_window
+        self.windows: List[Tuple[np.ndarray, np.ndarray]] = []
+
+    def add_window(self, actual_prices: Sequence[float]) -> int:
+        """
+        Simulate every component for one window of realized prices.
+
+        Returns:
+            Index of the new window
+        """
+        actual = np.asarray(actual_prices, dtype=np.float64)
+        start_price = float(actual[0])
+        if self.before_window is not None:
+            self.before_window(start_price)
+
+        rngs = spawn_rngs(self.seed_sequence, len(self.names))
+        stack = np.stack([
+            self.models[name].simulate(start_price, len(actual) - 1, self.num_simulations,
+                                       rng=rng, time_increment=self.time_increment)
+            for name, rng in zip(self.names, rngs)
+        ])
+        self.windows.append((stack, actual))
+        return len(self.windows) - 1
+
+    def add_windows_from_prices(self, prices: Sequence[float], num_points: int, stride: int = None) -> int:
+        """
+        Slice a historical price series into windows and add them.
+
+        Args:
+            prices: Realized prices on the time_increment grid
+            num_points: Points per window (time_horizon / time_increment + 1)
+            stride: Points between window starts (default: num_points - 1)
+
+        Returns:
+            Number of windows added
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        stride = stride or num_points - 1
+        starts = range(0, len(prices) - num_points + 1, stride)
+        for start in starts:
+            self.add_window(prices[start:start + num_points])
+        return len(starts)
+
+    def save(self, path: str):
+        """Store the cached arrays in one .npz file."""
+        arrays = {"names": np.array(self.names)}
+        for i, (stack, actual) in enumerate(self.windows):
+            arrays[f"paths_{i}"] = stack
+            arrays[f"actual_{i}"] = actual
+        np.savez_compressed(path, **arrays)
+
+    def load(self, path: str) -> int:
+        """Append the windows stored by save(); component names must match."""
+        with np.load(path) as data:
+            if list(data["names"]) != self.names:
+                raise ValueError(f"Cached components {list(data['names'])} do not match {self.names}")
+            count = sum(1 for key in data.files if key.startswith("paths_"))
+            for i in range(count):
+                self.windows.append((data[f"paths_{i}"], data[f"actual_{i}"]))
+        return count
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+
+def simplex_grid(num_components: int, step: float = 0.05) -> np.ndarray:
+    """
+    All weight vectors on the simplex with entries that are multiples of step.
+
+    Returns:
+        Array of shape (num_candidates, num_components); rows sum to 1
+    """
+    ticks = int(round(1 / step))
+    rows = [
+        counts + (ticks - sum(counts),)
+        for counts in itertools.product(range(ticks + 1), repeat=num_components - 1)
+        if sum(counts) <= ticks
+    ]
+    return np.array(rows, dtype=np.float64) / ticks
+
+
+def combine_candidates(stack: np.ndarray, candidates: np.ndarray, mode: str = "average") -> np.ndarray:
+    """
+    Combined paths of one window for each candidate weight vector.
+
+    Args:
+        stack: (num_components, num_simulations, num_points) component paths
+        candidates: (num_candidates, num_components) weights
+        mode: "average" (point-wise weighted average) or "mixture" (the first
+              allocate_paths() share of each component's paths, pooled)
+
+    Returns:
+        Array of shape (num_candidates, num_simulations, num_points)
+    """
+    if mode == "average":
+        return np.tensordot(candidates, stack, axes=1)
+
+    num_simulations = stack.shape[1]
+    combined = np.empty((len(candidates),) + stack.shape[1:], dtype=stack.dtype)
+    for k, weights in enumerate(candidates):
+        counts = allocate_paths(dict(enumerate(weights)), num_simulations)
+        combined[k] = np.concatenate([stack[i, :count] for i, count in counts.items()])
+    return combined
+
+
+def score_weights(cache: ComponentPathCache,
+                  candidates: np.ndarray,
+                  crps: CRPSCalculator = None,
+                  chunk_size: int = 32,
+                  mode: str = "average") -> np.ndarray:
+    """
+    Mean CRPS over the cached windows for each candidate weight vector.
+
+    Args:
+        cache: ComponentPathCache with at least one window
+        candidates: (num_candidates, num_components) weights in cache.names order
+        crps: CRPSCalculator to use (default: float64)
+        chunk_size: Candidates combined at once (bounds memory)
+        mode: How the ensemble combines components, "average" or "mixture"
+
+    Returns:
+        Array of shape (num_candidates,)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+    if not cache.windows:
+        raise ValueError("No cached windows to score against")
+    crps = crps or CRPSCalculator()
+    candidates = np.asarray(candidates, dtype=np.float64)
+
+    scores = np.zeros(len(candidates))
+    for stack, actual in cache.windows:
+        for start in range(0, len(candidates), chunk_size):
+            chunk = candidates[start:start + chunk_size]
+            combined = combine_candidates(stack, chunk, mode)
+            scores[start:start + chunk_size] += crps.calculate_crps_batch(combined, actual)
+    return scores / len(cache.windows)
+
+
+def optimize_weights(cache: ComponentPathCache,
+                     step: float = 0.05,
+                     refine_step: float = 0.01,
+                     crps: CRPSCalculator = None,
+                     mode: str = "average") -> Tuple[Dict[str, float], float]:
+    """
+    Find the weights minimizing mean CRPS over the cached windows.
+
+    Searches the simplex on a coarse grid, then on a finer grid within one
+    coarse step of the best candidate. mode must match the ensemble the
+    weights are used in ("average" or "mixture").
+
+    Returns:
+        (weights keyed by component name, mean CRPS)
+    """
+    candidates = simplex_grid(len(cache.names), step)
+    scores = score_weights(cache, candidates, crps, mode=mode)
+    best = candidates[np.argmin(scores)]
+
+    if refine_step and refine_step < step:
+        offsets = np.arange(-step, step + refine_step / 2, refine_step)
+        local = [
+            np.append(best[:-1] + delta, 0.0)
+            for delta in itertools.product(offsets, repeat=len(best) - 1)
+        ]
+        local = np.array(local)
+        local[:, -1] = 1.0 - local[:, :-1].sum(axis=1)
+        local = local[np.all(local >= -1e-12, axis=1)].clip(0.0, 1.0)
+        candidates = np.vstack([best, local])
+        scores = score_weights(cache, candidates, crps, mode=mode)
+        best = candidates[np.argmin(scores)]
+
+    # Drop float noise from the grid arithmetic (e.g. 1e-17 instead of 0)
+    best = np.round(best, 10)
+    return dict(zip(cache.names, best.tolist())), float(np.min(scores))
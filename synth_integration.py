@@ -5,8 +5,12 @@ Integrates our best-performing Ensemble (GBM-weighted) model with Synth subnet
 
 import sys
 import os
+import copy
+import time
+import threading
 import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 
 # Add our project root to path
@@ -18,13 +22,23 @@ from models.baseline.random_walk import RandomWalkModel
 from models.baseline.geometric_brownian import GeometricBrownianModel
 from models.baseline.mean_reversion import MeanReversionModel
 from models.crps import CRPSCalculator
-from models.baseline.volatility_calculator import get_all_volatilities
+from models.result import SimulationResult
+from models.rng import spawn_rngs
+from models.timegrid import time_grid
+from models.ensemble import weighted_combination, allocate_paths, mixture_combination
+from models.weight_optimizer import ComponentPathCache, optimize_weights
+from models.registry import ModelRegistry
+from models.calibration import CalibrationScheduler, CalibrationStore
+from models.pregeneration import PregenerationService
+from models.baseline.volatility_calculator import (get_all_volatilities, set_bar_store, download_bars,
+                                                   set_online_estimation, set_price_source,
+                                                   set_volatility_estimator, ASSET_TICKERS)
+from models.baseline.price_sources import SynthPriceSource, ReplayPriceSource
+from models.baseline.bar_store import BarStore
 
-# Import Synth utilities
+# Synth utilities (imported lazily by SynthPriceSource for live prices)
 synth_subnet_root = os.path.join(project_root, 'synth-subnet')
 sys.path.insert(0, synth_subnet_root)
-from synth.miner.price_simulation import get_asset_price  # type: ignore
-from synth.utils.helpers import convert_prices_to_time_format  # type: ignore
 
 
 class EnsembleGBMWeightedModel:
@@ -33,10 +47,39 @@ class EnsembleGBMWeightedModel:
     CRPS Score: 547.30 (from notebook results)
     """
     
-    def __init__(self):
+    MODES = ("average", "mixture")
+    
+    def __init__(self, seed=None, mode="average", component_timeouts=None,
+                 response_margin=1.0, max_workers=None, calibration=None):
+        """
+        Args:
+            seed: Seed (int or numpy SeedSequence) for reproducible runs.
+                  Each predict() call spawns independent streams per component.
+            mode: "average" combines every component's paths point-wise;
+                  "mixture" splits the path budget across components by weight
+                  and pools their paths, simulating only the paths it returns.
+            component_timeouts: Optional per-component cap in seconds, e.g.
+                  {"MeanReversion": 2.0}; applied on top of the deadline budget.
+            response_margin: Seconds reserved before the deadline for
+                  formatting and sending the response.
+            max_workers: Size of the component thread pool
+                  (default: two workers per component). Components that miss
+                  their budget keep a worker until they finish; when every
+                  worker is taken, new components are skipped, not queued.
+            calibration: Optional CalibrationScheduler. When given, predict()
+                  only reads its latest snapshot and never fetches inline.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {self.MODES}")
         self.name = "Ensemble (GBM-weighted)"
+        self.mode = mode
         self.last_calibration = {}
         self.cached_params = {}
+        self.calibration = calibration
+        # Guards parameter updates; predict() copies the component models under
+        # it and simulates outside it, so concurrent requests don't queue
+        self._lock = threading.Lock()
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
         
         # Initialize individual models with optimized parameters
         self.models = {
@@ -52,107 +95,521 @@ class EnsembleGBMWeightedModel:
         # GBM-weighted ensemble (best performing configuration)
         self.weights = [0.2, 0.5, 0.3]  # [RW, GBM, MR]
         
+        # Components run concurrently; the pool outlives predict() calls so a
+        # component that misses its budget can finish in the background
+        self.component_timeouts = dict(component_timeouts or {})
+        self.response_margin = response_margin
+        self.max_workers = max_workers or 2 * len(self.models)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="ensemble")
+        # Workers taken by submitted components, including abandoned ones
+        self._busy_workers = 0
+        self._busy_lock = threading.Lock()
+    
+    @property
+    def model_weights(self) -> Dict[str, float]:
+        """Weights keyed by component name, in self.models order."""
+        return dict(zip(self.models, self.weights))
+    
+    def set_weights(self, weights: Dict[str, float]):
+        """Set component weights by name (rescaled to sum to 1)."""
+        total = sum(weights[name] for name in self.models)
+        if total <= 0:
+            raise ValueError("Weights must have a positive sum")
+        self.weights = [weights[name] / total for name in self.models]
+    
+    def tune_weights(self, prices, asset: str = None, time_increment: int = 300,
+                     time_horizon: int = 86400, num_simulations: int = 100,
+                     stride: int = None, step: float = 0.05, cache_path: str = None):
+        """
+        Re-tune the weights offline by minimizing CRPS on historical windows.
+        
+        Components are simulated once per window of prices (realized prices
+        on the time_increment grid); candidate weights only recombine those
+        cached arrays, averaged or pooled to match self.mode. With cache_path, windows are loaded from / saved to
+        that .npz file.
+        
+        Returns:
+            (weights keyed by component name, mean CRPS)
+        """
+        with self._lock:
+            if asset is not None:
+                self._apply_params(asset)
+            models = self._copy_models()
+        
+        mean_reversion = models['MeanReversion']
+        cache = ComponentPathCache(
+            models, time_increment, num_simulations, seed=self.seed_sequence,
+            before_window=lambda start_price: setattr(mean_reversion, 'mean_price', start_price)
+        )
+        if cache_path and os.path.exists(cache_path):
+            cache.load(cache_path)
+        else:
+            cache.add_windows_from_prices(prices, int(time_horizon / time_increment) + 1, stride)
+            if cache_path:
+                cache.save(cache_path)
+        
+        weights, score = optimize_weights(cache, step, mode=self.mode)
+        self.set_weights(weights)
+        return weights, score
+        
     def predict(self,
                 asset: str, 
                 start_price: float,
                 start_time: datetime,
                 time_increment: int = 300,  # 5 minutes
                 time_horizon: int = 86400,  # 24 hours
-                num_simulations: int = 100) -> List[List[Dict[str, Any]]]:
+                num_simulations: int = 100,
+                deadline: datetime = None) -> SimulationResult:
         """
         Generate predictions using our ensemble model.
-        Returns format compatible with Synth subnet.
+        Returns a SimulationResult that formats to the Synth subnet structure
+        on demand (indexing, iteration or to_list()).
+        
+        If a deadline is given, components that haven't finished by
+        deadline - response_margin are dropped and the remaining weights
+        are renormalized (in mixture mode their share is regenerated by the
+        other components within half the margin). Raises TimeoutError if the
+        instance stays busy past the budget, e.g. while weights are tuned.
         """
+        time_limit = self._time_limit(deadline)
         
-        # check if we need to calibrate
-        current_time = datetime.now()
-        needs_calibration = False
-        if asset not in self.last_calibration:
-            needs_calibration = True
+        lock_timeout = -1 if time_limit is None else max(0.0, time_limit - time.monotonic())
+        if not self._lock.acquire(timeout=lock_timeout):
+            raise TimeoutError(f"Ensemble for {asset} was busy past the deadline budget")
+        try:
+            if self.calibration is not None:
+                self._apply_snapshot(asset)
+            elif self.needs_calibration(asset):
+                self.calibrate()
+            self._apply_params(asset)
+            # Per-call copies: other requests may update the shared models
+            models = self._copy_models()
+            # Independent streams: one per component, plus one for the mixture shuffle
+            rngs = spawn_rngs(self.seed_sequence, len(models) + 1)
+            weights = self.model_weights
+        finally:
+            self._lock.release()
+        
+        # Update mean reversion model with current price
+        models['MeanReversion'].mean_price = start_price
+        
+        # Shared grid: built once per window and reused when the result is serialized
+        num_points = len(time_grid(start_time, time_increment, time_horizon))
+        component_rngs = dict(zip(models, rngs))
+        
+        if self.mode == "mixture":
+            prices = self._predict_mixture(models, weights, start_price, time_increment, num_points,
+                                           num_simulations, component_rngs, rngs[-1], time_limit)
         else:
-            time_since_calibration = current_time - self.last_calibration[asset]
-            if time_since_calibration.total_seconds() > 6 * 3600:
-                needs_calibration = True
-
-        if needs_calibration:
-            volatilities = get_all_volatilities()
-            self.cached_params[asset] = {
-                'volatility': volatilities[asset]['volatility'],
-                'drift': volatilities[asset]['drift']
-            }
-            self.last_calibration[asset] = current_time
-
-            self.models['RandomWalk'].volatility = self.cached_params[asset]['volatility']
-            self.models['GBM'].drift = self.cached_params[asset]['drift']
-            self.models['GBM'].volatility = self.cached_params[asset]['volatility']
-            self.models['MeanReversion'].reversion_strength = 0.1
-            self.models['MeanReversion'].volatility = self.cached_params[asset]['volatility']
+            prices = self._predict_average(models, weights, start_price, time_increment, num_points,
+                                           num_simulations, component_rngs, time_limit)
+        
+        prices[:, 0] = start_price  # Start time - use current price
+        np.maximum(prices, 0.01, out=prices)  # Ensure positive price
+        
+        return SimulationResult(prices, start_time, time_increment)
 
-        # Update mean reversion model with current price
-        self.models['MeanReversion'].mean_price = start_price
+    def _copy_models(self):
+        """Shallow copies of the component models with their current parameters."""
+        return {model_name: copy.copy(model) for model_name, model in self.models.items()}
+
+    @staticmethod
+    def _run_component(model_name, model, start_price, time_increment,
+                       num_points, num_simulations, rng):
+        """Simulate one component; returns None (with a warning) if it fails."""
+        try:
+            pred = model.simulate(start_price, num_points - 1, num_simulations,
+                                  rng=rng, time_increment=time_increment)
+        except Exception as e:
+            print(f"Warning: {model_name} model failed: {e}")
+            return None
+        
+        if pred.shape != (num_simulations, num_points):
+            print(f"Warning: {model_name} model returned paths with shape {pred.shape}, "
+                  f"expected {(num_simulations, num_points)}")
+            return None
+        if not np.all(np.isfinite(pred)):
+            print(f"Warning: {model_name} model returned non-finite paths")
+            return None
+        return pred
+    
+    def _submit(self, *args):
+        """
+        Submit a component run if a worker is free, else return None.
+        
+        Abandoned components keep running on their worker; queueing behind
+        them would make this request miss its own deadline as well.
+        """
+        with self._busy_lock:
+            if self._busy_workers >= self.max_workers:
+                return None
+            self._busy_workers += 1
+        future = self._executor.submit(self._run_component, *args)
+        future.add_done_callback(self._release_worker)
+        return future
+    
+    def _release_worker(self, future):
+        with self._busy_lock:
+            self._busy_workers -= 1
+    
+    def needs_calibration(self, asset: str, now: datetime = None) -> bool:
+        """True if asset has never been calibrated or its parameters are over 6 hours old."""
+        if asset not in self.last_calibration:
+            return True
+        now = now or datetime.now()
+        return (now - self.last_calibration[asset]).total_seconds() > 6 * 3600
+    
+    def calibrate(self) -> Dict[str, Dict[str, float]]:
+        """
+        Fetch volatility and drift for every asset in one pass and cache them.
+        
+        Assets whose fetch fails keep their previous parameters and the time
+        those were fetched.
+        """
+        volatilities = get_all_volatilities()
+        for asset, params in volatilities.items():
+            self.apply_calibration(asset, params, params.get('calibrated_at'))
+        return volatilities
+    
+    def apply_calibration(self, asset: str, params: Dict[str, float],
+                          calibrated_at: datetime = None):
+        """Cache already-fetched volatility/drift parameters for an asset."""
+        self.cached_params[asset] = {
+            'volatility': params['volatility'],
+            'drift': params['drift']
+        }
+        self.last_calibration[asset] = calibrated_at or datetime.now()
+    
+    def _apply_snapshot(self, asset: str):
+        """Take an asset's parameters from the scheduler's latest snapshot."""
+        snapshot = self.calibration.snapshot
+        params = snapshot.get(asset)
+        if params is not None:
+            self.apply_calibration(asset, params, snapshot.calibrated_at[asset])
+    
+    def _apply_params(self, asset: str):
+        """Load an asset's cached parameters into the component models."""
+        params = self.cached_params.get(asset)
+        if params is None:
+            print(f"Warning: no calibration for {asset}, using default parameters")
+            return
+        self.models['RandomWalk'].volatility = params['volatility']
+        self.models['GBM'].drift = params['drift']
+        self.models['GBM'].volatility = params['volatility']
+        self.models['MeanReversion'].reversion_strength = 0.1
+        self.models['MeanReversion'].volatility = params['volatility']
+    
+    def _time_limit(self, deadline):
+        """Convert a wall-clock deadline into a time.monotonic() limit (or None)."""
+        if deadline is None:
+            return None
+        now = datetime.now(timezone.utc) if deadline.tzinfo is not None else datetime.now()
+        budget = (deadline - now).total_seconds() - self.response_margin
+        return time.monotonic() + budget
+    
+    def _run_components(self, models, counts, start_price, time_increment, num_points,
+                        component_rngs, time_limit):
+        """
+        Run components concurrently and collect the ones that finish in time.
+        
+        Each component gets until the earlier of time_limit and its own
+        component_timeouts cap; late or failed components are left out.
+        """
+        submitted = time.monotonic()
+        futures = {
+            model_name: self._submit(model_name, models[model_name], start_price, time_increment,
+                                     num_points, count, component_rngs[model_name])
+            for model_name, count in counts.items()
+        }
         
-        # Get predictions from each individual model
         model_predictions = {}
-        for model_name, model in self.models.items():
+        for model_name, future in futures.items():
+            if future is None:
+                print(f"Warning: no free worker for {model_name} model "
+                      f"(earlier runs still past their budget), skipped")
+                continue
+            limit = time_limit
+            cap = self.component_timeouts.get(model_name)
+            if cap is not None:
+                limit = submitted + cap if limit is None else min(limit, submitted + cap)
+            timeout = None if limit is None else max(0.0, limit - time.monotonic())
             try:
-                pred = model.predict(start_price, start_time, 
-                                   time_increment, time_horizon, num_simulations)
-                if pred and len(pred) > 0:
-                    model_predictions[model_name] = pred
-            except Exception as e:
-                print(f"Warning: {model_name} model failed: {e}")
+                pred = future.result(timeout=timeout)
+            except FuturesTimeoutError:
+                future.cancel()
+                print(f"Warning: {model_name} model missed its time budget and was dropped")
                 continue
+            if pred is not None:
+                model_predictions[model_name] = pred
+        return model_predictions
+    
+    def _predict_average(self, models, weights, start_price, time_increment, num_points,
+                         num_simulations, component_rngs, time_limit=None):
+        """Point-wise weighted average of full-size component runs."""
+        counts = {model_name: num_simulations for model_name in models}
+        model_predictions = self._run_components(models, counts, start_price, time_increment,
+                                                 num_points, component_rngs, time_limit)
         
         if not model_predictions:
             raise ValueError("All models failed to generate predictions")
         
-        # Calculate number of time steps
-        num_steps = int(time_horizon / time_increment) + 1  # +1 for start time
+        # Weighted average over the components that succeeded; weights are
+        # renormalized so a failed or late component doesn't shrink the prices
+        return weighted_combination(model_predictions, weights)
+    
+    def _predict_mixture(self, models, weights, start_price, time_increment, num_points,
+                         num_simulations, component_rngs, shuffle_rng, time_limit=None):
+        """Mixture sample: each component simulates only its share of the paths."""
+        weights = dict(weights)
+        model_predictions = {}
+        remaining = num_simulations
         
-        all_predictions = []
+        # Components that fail hand their share to the ones that are left,
+        # as long as there is time for another round
+        while remaining > 0 and weights:
+            if time_limit is not None and time.monotonic() >= time_limit:
+                break
+            shares = allocate_paths(weights, remaining)
+            results = self._run_components(models, shares, start_price, time_increment,
+                                           num_points, component_rngs, time_limit)
+            remaining -= self._pool_results(model_predictions, shares, results, weights)
         
-        for sim in range(num_simulations):
-            simulation_predictions = []
-            
-            for step in range(num_steps):
-                current_time = start_time + timedelta(seconds=step * time_increment)
-                
-                if step == 0:
-                    # Start time - use current price
-                    simulation_predictions.append({
-                        'time': current_time.isoformat(),
-                        'price': start_price
-                    })
-                else:
-                    # Future time steps - ensemble predictions
-                    step_predictions = []
-                    weights_used = []
-                    
-                    for i, (model_name, model_preds) in enumerate(model_predictions.items()):
-                        if sim < len(model_preds) and step < len(model_preds[sim]):
-                            step_predictions.append(model_preds[sim][step]['price'])
-                            weights_used.append(self.weights[i])
-                    
-                    if step_predictions:
-                        # Weighted average of predictions
-                        weighted_price = sum(p * w for p, w in zip(step_predictions, weights_used))
-                        
-                        simulation_predictions.append({
-                            'time': current_time.isoformat(),
-                            'price': max(0.01, weighted_price)  # Ensure positive price
-                        })
-                    else:
-                        # Fallback to previous price if no predictions available
-                        prev_price = simulation_predictions[step-1]['price']
-                        simulation_predictions.append({
-                            'time': current_time.isoformat(),
-                            'price': prev_price
-                        })
-            
-            if simulation_predictions:
-                all_predictions.append(simulation_predictions)
+        if not model_predictions:
+            raise ValueError("All models failed to generate predictions")
+        
+        finished = {name: w for name, w in weights.items() if name in model_predictions}
+        if remaining > 0 and finished:
+            # Out of time: regenerate the shortfall from components that already
+            # finished (e.g. GBM takes milliseconds), using up to half the margin
+            refill_limit = None if time_limit is None else time_limit + self.response_margin / 2
+            shares = allocate_paths(finished, remaining)
+            results = self._run_components(models, shares, start_price, time_increment,
+                                           num_points, component_rngs, refill_limit)
+            remaining -= self._pool_results(model_predictions, shares, results, weights)
         
-        return all_predictions
+        pooled = mixture_combination(model_predictions, shuffle_rng)
+        if remaining > 0:
+            # Still short: fill the rest by resampling the pooled paths
+            print(f"Warning: resampling {remaining} paths after running out of time")
+            extra = pooled[shuffle_rng.integers(len(pooled), size=remaining)]
+            pooled = np.concatenate([pooled, extra])
+        return pooled
+    
+    @staticmethod
+    def _pool_results(model_predictions, shares, results, weights):
+        """
+        Append each component's new paths to model_predictions.
+        
+        Components without results are removed from weights.
+        
+        Returns:
+            Number of paths added
+        """
+        added = 0
+        for model_name, count in shares.items():
+            if model_name not in results:
+                weights.pop(model_name, None)
+                continue
+            pred = results[model_name]
+            if model_name in model_predictions:
+                pred = np.concatenate([model_predictions[model_name], pred])
+            model_predictions[model_name] = pred
+            added += count
+        return added
+
+# Live start prices come from the Synth (Pyth) feed. SYNTH_REPLAY_DATA=<dir of
+# <ASSET>.csv/.parquet bar files> replays local data for both start prices and
+# calibration, so backtests and CI run without network access.
+if os.environ.get('SYNTH_REPLAY_DATA'):
+    PRICE_SOURCE = ReplayPriceSource.from_directory(os.environ['SYNTH_REPLAY_DATA'])
+    set_price_source(PRICE_SOURCE)
+else:
+    PRICE_SOURCE = SynthPriceSource()
+    
+    # Calibration bars are cached on disk and only new bars are downloaded
+    set_bar_store(BarStore(os.environ.get('SYNTH_BAR_STORE', os.path.join(project_root, 'data', 'bars')),
+                           fetch=download_bars))
+
+# Volatility/drift are updated bar by bar over a rolling 2-day window
+# (576 five-minute returns), so refreshing is cheap and can run often
+set_online_estimation(window=576)
+
+# Optional range-based estimator (e.g. SYNTH_VOL_ESTIMATOR=yang_zhang); the
+# default stays close-to-close until a range estimator is validated on CRPS
+set_volatility_estimator(os.environ.get('SYNTH_VOL_ESTIMATOR', 'close'))
+
+# Volatility/drift are refreshed off the request path; models read snapshots.
+# The last good snapshot is kept on disk so a restarted miner starts warm.
+CALIBRATION_STORE = CalibrationStore(os.environ.get(
+    'SYNTH_CALIBRATION_STORE', os.path.join(project_root, 'data', 'calibration.json')))
+CALIBRATION_SCHEDULER = CalibrationScheduler(fetch=lambda: get_all_volatilities(),
+                                             interval=15 * 60, store=CALIBRATION_STORE)
+
+# One warm ensemble per asset, shared by every request in this process
+MODEL_REGISTRY = ModelRegistry(lambda asset: EnsembleGBMWeightedModel(calibration=CALIBRATION_SCHEDULER))
+
+
+# Pre-generation has its own ensembles, so a background run never holds up a
+# live request for the same asset
+PREGENERATION_MODELS = ModelRegistry(lambda asset: EnsembleGBMWeightedModel(calibration=CALIBRATION_SCHEDULER))
+
+
+def _pregenerate(asset, start_price, start_time, time_increment, time_horizon, num_simulations):
+    """Pre-generated paths for a slot must be ready before the slot starts."""
+    return PREGENERATION_MODELS.get(asset).predict(asset, start_price, start_time, time_increment,
+                                                   time_horizon, num_simulations, deadline=start_time)
+
+
+# Paths for the next prompt slots, generated at the latest price ahead of the
+# requests and invalidated whenever a new calibration snapshot is published
+PREGENERATION = PregenerationService(
+    generate=_pregenerate,
+    assets=list(ASSET_TICKERS),
+    version_fn=lambda: CALIBRATION_SCHEDULER.snapshot.created_at,
+    price_fn=lambda asset: PRICE_SOURCE.get_price(asset)
+)
+
+
+# Typical run time (seconds) of each strategy, updated as an EWMA of observed
+# runs; used to pick the best strategy that still fits before the deadline
+STRATEGY_SECONDS = {
+    'fresh_calibration': 15.0,
+    'ensemble': 0.5,
+    'gbm': 0.1,
+}
+
+# Last response per asset as unit-price paths, the last-resort fallback
+_LAST_UNIT_PATHS = {}
+
+# Guards STRATEGY_SECONDS and _LAST_UNIT_PATHS, which request threads update
+_STATE_LOCK = threading.Lock()
+
+
+def _record_duration(strategy, seconds, alpha=0.3):
+    with _STATE_LOCK:
+        STRATEGY_SECONDS[strategy] = (1 - alpha) * STRATEGY_SECONDS[strategy] + alpha * seconds
+
+
+def _strategy_seconds(*strategies):
+    """Typical combined run time of the strategies."""
+    with _STATE_LOCK:
+        return sum(STRATEGY_SECONDS[s] for s in strategies)
+
+
+def _seconds_left(deadline):
+    """Seconds until deadline (None = no deadline)."""
+    if deadline is None:
+        return None
+    now = datetime.now(timezone.utc) if deadline.tzinfo is not None else datetime.now()
+    return (deadline - now).total_seconds()
+
+
+def _fits(deadline, *strategies):
+    """True if the strategies' typical run times fit before the deadline."""
+    left = _seconds_left(deadline)
+    return left is None or _strategy_seconds(*strategies) < left
+
+
+def _rescale_last_paths(asset, start_price, start_time, time_increment, num_points, num_simulations):
+    """Last-resort paths: the previous response for asset scaled to start_price."""
+    with _STATE_LOCK:
+        cached = _LAST_UNIT_PATHS.get(asset)
+    if cached is None or cached[1] != time_increment or cached[0].shape != (num_simulations, num_points):
+        return None
+    return SimulationResult(float(start_price) * cached[0], start_time, time_increment)
+
+
+def _snapshot_gbm(asset):
+    """GBM with the cached calibration for asset, or defaults if it has none."""
+    params = CALIBRATION_SCHEDULER.snapshot.get(asset) or {}
+    return GeometricBrownianModel(drift=params.get('drift', 0.0001),
+                                  volatility=params.get('volatility', 0.015))
+
+
+def _remember_paths(asset, result, start_price):
+    """Keep a response as unit-price paths for _rescale_last_paths."""
+    unit_paths = result.prices / start_price
+    with _STATE_LOCK:
+        _LAST_UNIT_PATHS[asset] = (unit_paths, result.time_increment)
+
+
+def degraded_predict(asset, start_price, start_time, time_increment=300, time_horizon=86400,
+                     num_simulations=100, deadline=None) -> SimulationResult:
+    """
+    Best prediction that fits before deadline.
+    
+    Strategies, in order of preference:
+      1. ensemble after a blocking calibration fetch (only if parameters are stale)
+      2. ensemble with the cached calibration
+      3. GBM alone with the cached calibration
+      4. the previous response for the asset, rescaled to start_price
+    Each decision is printed with the time left.
+    """
+    def log(strategy):
+        left = _seconds_left(deadline)
+        budget = "no deadline" if left is None else f"{left:.2f}s left"
+        print(f"Strategy for {asset} at {start_time.isoformat()}: {strategy} ({budget})")
+    
+    model = MODEL_REGISTRY.get(asset)
+    age = CALIBRATION_SCHEDULER.snapshot.age(asset)
+    if (age is None or age > CALIBRATION_STORE.ttl) and _fits(deadline, 'fresh_calibration', 'ensemble'):
+        log("fresh calibration")
+        started = time.monotonic()
+        # Waits on a refresh already in flight (e.g. the scheduler's) instead
+        # of fetching twice, but only as long as the ensemble still fits after it
+        left = _seconds_left(deadline)
+        CALIBRATION_SCHEDULER.refresh(timeout=None if left is None else max(0.0, left - _strategy_seconds('ensemble')))
+        _record_duration('fresh_calibration', time.monotonic() - started)
+    
+    for strategy in ('ensemble', 'gbm'):
+        if not _fits(deadline, strategy):
+            continue
+        log(strategy)
+        started = time.monotonic()
+        try:
+            if strategy == 'ensemble':
+                result = model.predict(asset, start_price, start_time, time_increment,
+                                       time_horizon, num_simulations, deadline=deadline)
+            else:
+                result = _snapshot_gbm(asset).simulate_result(start_price, start_time, time_increment,
+                                                              time_horizon, num_simulations)
+        except Exception as e:
+            print(f"Warning: {strategy} strategy failed for {asset}: {e}")
+            continue
+        _record_duration(strategy, time.monotonic() - started)
+        return result
+    
+    num_points = int(time_horizon / time_increment) + 1
+    result = _rescale_last_paths(asset, start_price, start_time, time_increment,
+                                 num_points, num_simulations)
+    if result is not None:
+        log("rescaled previous paths")
+        return result
+    
+    # Nothing fits: a late answer still beats no answer
+    log("gbm (over budget)")
+    return _snapshot_gbm(asset).simulate_result(start_price, start_time, time_increment,
+                                                time_horizon, num_simulations)
+
+
+def warm_up_models(assets=tuple(ASSET_TICKERS), timeout=None):
+    """
+    Start background calibration and build the registry models.
+    
+    Call at miner startup. Stored parameters are loaded immediately; with a
+    timeout, wait up to that many seconds for a calibration snapshot.
+    
+    Returns:
+        True if a calibration snapshot is available
+    """
+    CALIBRATION_SCHEDULER.start()
+    for asset in assets:
+        MODEL_REGISTRY.get(asset)
+    PREGENERATION.start()
+    if timeout:
+        return CALIBRATION_SCHEDULER.wait_ready(timeout)
+    return bool(CALIBRATION_SCHEDULER.snapshot.params)
 
 
 def generate_synth_simulations(
@@ -162,6 +619,7 @@ def generate_synth_simulations(
     time_length=86400,
     num_simulations=100,  # Official Synth subnet requirement
     sigma=0.01,  # Ignored - we use our own model
+    deadline=None,
 ):
     """
     Generate simulated price paths using our best ensemble model.
@@ -174,6 +632,8 @@ def generate_synth_simulations(
         time_length (int): Total time length in seconds.
         num_simulations (int): Number of simulation runs.
         sigma (float): Standard deviation (ignored - we use our own model).
+        deadline (datetime): When the response must be ready. Defaults to
+            start_time if it is still in the future, otherwise no deadline.
     
     Returns:
         List[List[Dict]]: Simulated price paths in Synth format.
@@ -182,13 +642,14 @@ def generate_synth_simulations(
         raise ValueError("Start time must be provided.")
     
 
-    # Get current price from Synth's price feed
-    current_price = get_asset_price(asset)
+    # Get current price from the price feed (Synth/Pyth unless replaying)
+    current_price = PRICE_SOURCE.get_price(asset)
     if current_price is None:
         raise ValueError(f"Failed to fetch current price for asset: {asset}")
     
-    # Initialize our best model
-    model = EnsembleGBMWeightedModel()
+    # Calibration and pre-generation run in the background
+    CALIBRATION_SCHEDULER.start()
+    PREGENERATION.start()
     
     # Convert start_time to datetime (handle both string and datetime inputs)
     if isinstance(start_time, str):
@@ -196,17 +657,24 @@ def generate_synth_simulations(
     else:
         start_datetime = start_time
     
-    # Generate predictions using our ensemble model
-    predictions = model.predict(
-        asset=asset,
-        start_price=current_price,
-        start_time=start_datetime,
-        time_increment=time_increment,
-        time_horizon=time_length,
-        num_simulations=num_simulations
-    )
-    
-    return predictions
+    # Served in O(1) if this slot was pre-generated
+    predictions = PREGENERATION.get(asset, current_price, start_datetime,
+                                    time_increment, time_length, num_simulations)
+    if predictions is not None:
+        print(f"Strategy for {asset} at {start_datetime.isoformat()}: pre-generated")
+    else:
+        # Paths must be ready before start_time; a start_time that has already
+        # passed (backtests, manual runs) gets no budget
+        if deadline is None:
+            now = datetime.now(timezone.utc) if start_datetime.tzinfo is not None else datetime.now()
+            deadline = start_datetime if start_datetime > now else None
+        predictions = degraded_predict(asset, current_price, start_datetime, time_increment,
+                                       time_length, num_simulations, deadline)
+    
+    _remember_paths(asset, predictions, current_price)
+    
+    # Synth serialization boundary - materialize the dicts only here
+    return predictions.to_list()
 
 
 def test_our_model():
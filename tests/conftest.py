@@ -2,6 +2,8 @@ import pytest
 import numpy as np
 from datetime import datetime, timedelta
 
+import models.baseline.volatility_calculator as vc
+
 # Simple test fixtures for baseline model testing
 @pytest.fixture
 def sample_price_data():
@@ -27,3 +29,13 @@ def random_seed():
     """Set random seed for reproducible tests."""
     np.random.seed(42)
     return 42
+
+@pytest.fixture(scope="module")
+def synth_integration():
+    """The integration module, imported without leaking its global feed settings."""
+    names = ("_bar_store", "_price_source", "_online_estimators", "_online_settings", "_volatility_estimator")
+    saved = {name: getattr(vc, name) for name in names}
+    import synth_integration
+    for name, value in saved.items():
+        setattr(vc, name, value)
+    return synth_integration
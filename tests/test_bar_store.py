@@ -0,0 +1,65 @@
+"""
+Tests for the incremental OHLC bar store.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.baseline.bar_store import BarStore, period_to_timedelta
+
+
+def make_bars(start, count, close=100.0):
+    index = pd.date_range(start, periods=count, freq="5min", tz="UTC")
+    values = np.full(count, close)
+    return pd.DataFrame({"Open": values, "High": values + 1, "Low": values - 1,
+                         "Close": values, "Volume": np.ones(count)}, index=index)
+
+
+class TestBarStore:
+    """Test suite for BarStore."""
+
+    def setup_method(self):
+        """Set up a fake feed: 2 days of bars, then 3 new bars per fetch."""
+        self.calls = []
+        self.now = pd.Timestamp.now(tz="UTC").floor("5min")
+
+        def fetch(ticker, start, period):
+            self.calls.append((start, period))
+            if start is None:
+                return make_bars(self.now - pd.Timedelta(days=2), 577)
+            # The last cached bar comes back with its final values
+            return make_bars(start, 3, close=101.0)
+
+        self.fetch = fetch
+
+    def test_period_to_timedelta(self):
+        """Test yfinance-style period parsing."""
+        assert period_to_timedelta("2d") == pd.Timedelta(days=2)
+        assert period_to_timedelta("90m") == pd.Timedelta(minutes=90)
+        with pytest.raises(ValueError):
+            period_to_timedelta("1mo")
+
+    def test_incremental_fetch_merges_and_dedupes(self, tmp_path):
+        """Test that only bars after the last cached one are fetched and merged."""
+        store = BarStore(str(tmp_path), fetch=self.fetch)
+        first = store.update("BTC-USD")
+        assert len(first) == 577
+        assert self.calls == [(None, "2d")]
+
+        newest = first.index[-1]
+        merged = store.update("BTC-USD")
+        assert self.calls[-1] == (newest, None)
+        assert len(merged) == 579
+        assert merged.index.is_unique and merged.index.is_monotonic_increasing
+        assert merged.loc[newest, "Close"] == 101.0
+
+    def test_bars_persist_and_serve_periods(self, tmp_path):
+        """Test that a new store instance reads bars back from disk."""
+        BarStore(str(tmp_path), fetch=self.fetch).update("GC=F")
+
+        reopened = BarStore(str(tmp_path), fetch=self.fetch)
+        bars = reopened.get("GC=F", "1h", refresh=False)
+        assert len(bars) == 12
+        assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert len(self.calls) == 1
@@ -13,6 +13,9 @@ from datetime import datetime, timedelta
 from models.baseline.random_walk import RandomWalkModel
 from models.baseline.geometric_brownian import GeometricBrownianModel
 from models.baseline.mean_reversion import MeanReversionModel
+from models.analog.fluid_dynamics import FluidDynamicsModel
+from models.base import PathModel
+from models.result import format_paths
 
 
 class TestBaselineModels:
@@ -26,13 +29,12 @@ class TestBaselineModels:
         self.time_horizon = 3600   # 1 hour (reduced from 24 hours for faster testing)
         self.num_simulations = 10  # Small number for testing
         
-        # Set random seed for reproducible tests
-        np.random.seed(42)
+        self.seed = 42  # Passed to every model as rng for reproducible tests
     
     def test_random_walk_basic(self):
         """Test basic random walk functionality."""
         # 1. Create RandomWalkModel instance
-        model = RandomWalkModel(volatility=0.02)
+        model = RandomWalkModel(volatility=0.02, rng=self.seed)
         
         # 2. Generate predictions
         predictions = model.predict(
@@ -64,10 +66,42 @@ class TestBaselineModels:
             time_diff = (current_time - prev_time).total_seconds()
             assert time_diff == self.time_increment, f"Time increment should be {self.time_increment} seconds"
     
+    def test_random_walk_simulate_array(self):
+        """Test the batched random walk path engine."""
+        model = RandomWalkModel(volatility=0.02, rng=self.seed)
+
+        paths = model.simulate_array(
+            start_price=self.start_price,
+            time_increment=self.time_increment,
+            time_horizon=self.time_horizon,
+            num_simulations=self.num_simulations
+        )
+
+        num_steps = self.time_horizon // self.time_increment
+        assert isinstance(paths, np.ndarray), "Paths should be an ndarray"
+        assert paths.shape == (self.num_simulations, num_steps + 1), "Shape should be (sims, steps + 1)"
+        assert np.all(paths[:, 0] == self.start_price), "First column should be the start price"
+        assert np.all(paths > 0), "Prices should be positive"
+
+        # Step returns should have roughly the configured volatility
+        returns = paths[:, 1:] / paths[:, :-1] - 1
+        assert abs(returns.std() - 0.02) < 0.005, f"Step volatility off: {returns.std():.4f}"
+
+    def test_random_walk_floor_is_absorbing(self):
+        """Test that a path stays at the 0.01 floor once it hits it."""
+        model = RandomWalkModel(volatility=0.6, rng=self.seed)
+        paths = model.simulate(100.0, 200, 2000)
+
+        hit = paths <= 0.01
+        assert hit[:, -1].sum() > 100, "Expected many paths to hit the floor at this volatility"
+        # Once a path is at the floor every later point is too
+        assert np.all(hit[:, :-1] <= hit[:, 1:])
+        assert np.all(paths[hit] == 0.01)
+
     def test_gbm_basic(self):
         """Test basic geometric brownian motion functionality."""
         # 1. Create GeometricBrownianModel instance
-        model = GeometricBrownianModel(drift=0.001, volatility=0.02)
+        model = GeometricBrownianModel(drift=0.001, volatility=0.02, rng=self.seed)
         
         # 2. Test with different drift and volatility parameters
         predictions = model.predict(
@@ -97,6 +131,27 @@ class TestBaselineModels:
                 assert 'price' in prediction, "Each prediction should have 'price' key"
                 assert prediction['price'] > 0, "GBM prices should be positive"
     
+    def test_gbm_simulate_array(self):
+        """Test that batched GBM paths follow the exact log-space solution."""
+        drift, volatility = 0.001, 0.02
+        model = GeometricBrownianModel(drift=drift, volatility=volatility, rng=self.seed)
+
+        paths = model.simulate_array(
+            start_price=self.start_price,
+            time_increment=self.time_increment,
+            time_horizon=86400,
+            num_simulations=1000
+        )
+
+        assert paths.shape == (1000, 289), "Shape should be (sims, steps + 1)"
+        assert np.all(paths[:, 0] == self.start_price), "First point should be the start price"
+        assert np.all(paths > 0), "GBM prices should be positive"
+
+        # Log-returns are normal with mean (mu - sigma^2 / 2) and std sigma
+        log_returns = np.diff(np.log(paths), axis=1)
+        assert abs(log_returns.mean() - (drift - 0.5 * volatility ** 2)) < 2e-4
+        assert abs(log_returns.std() - volatility) < 5e-4
+
     def test_mean_reversion_basic(self):
         """Test basic mean reversion functionality."""
         # 1. Create MeanReversionModel instance
@@ -104,7 +159,8 @@ class TestBaselineModels:
         model = MeanReversionModel(
             mean_price=mean_price,
             reversion_strength=0.1,
-            volatility=0.02
+            volatility=0.02,
+            rng=self.seed
         )
         
         # 2. Test reversion toward mean price
@@ -135,13 +191,42 @@ class TestBaselineModels:
         assert max_price < self.start_price * 10, "Prices shouldn't explode upward"
         assert min_price > self.start_price * 0.1, "Prices shouldn't collapse to near zero"
     
+    def test_mean_reversion_schemes(self):
+        """Test both batched mean reversion schemes."""
+        mean_price = 50000.0
+
+        for scheme in ("euler", "exact"):
+            model = MeanReversionModel(
+                mean_price=mean_price,
+                reversion_strength=0.1,
+                volatility=0.02,
+                scheme=scheme,
+                rng=self.seed
+            )
+            paths = model.simulate_array(
+                start_price=self.start_price * 1.2,
+                time_increment=self.time_increment,
+                time_horizon=86400,
+                num_simulations=500
+            )
+
+            assert paths.shape == (500, 289), f"{scheme}: shape should be (sims, steps + 1)"
+            assert np.all(paths[:, 0] == self.start_price * 1.2), f"{scheme}: first point should be the start price"
+            assert np.all(paths > 0), f"{scheme}: prices should stay positive"
+
+            # Paths started 20% above the mean should be pulled back toward it
+            assert abs(paths[:, -1].mean() - mean_price) < 0.02 * mean_price, f"{scheme}: no reversion to mean"
+
+        with pytest.raises(ValueError):
+            MeanReversionModel(scheme="unknown")
+
     def test_prediction_format(self):
         """Test that all models return correct prediction format."""
         # 1. Test all baseline models
         models = [
-            RandomWalkModel(volatility=0.02),
-            GeometricBrownianModel(drift=0.001, volatility=0.02),
-            MeanReversionModel(mean_price=50000.0, reversion_strength=0.1, volatility=0.02)
+            RandomWalkModel(volatility=0.02, rng=self.seed),
+            GeometricBrownianModel(drift=0.001, volatility=0.02, rng=self.seed),
+            MeanReversionModel(mean_price=50000.0, reversion_strength=0.1, volatility=0.02, rng=self.seed)
         ]
         
         for model in models:
@@ -175,10 +260,33 @@ class TestBaselineModels:
                     assert isinstance(prediction['price'], (int, float)), "Price should be numeric"
                     assert prediction['price'] > 0, "Price should be positive"
     
+    def test_path_model_protocol(self):
+        """Test that every model shares the PathModel array contract."""
+        models = [
+            RandomWalkModel(volatility=0.02, rng=self.seed),
+            GeometricBrownianModel(drift=0.001, volatility=0.02, rng=self.seed),
+            MeanReversionModel(mean_price=50000.0, reversion_strength=0.1, volatility=0.02, rng=self.seed),
+            FluidDynamicsModel(rng=self.seed)
+        ]
+        num_steps = self.time_horizon // self.time_increment
+        
+        for model in models:
+            assert isinstance(model, PathModel), f"{model.name} should be a PathModel"
+            
+            paths = model.simulate(self.start_price, num_steps, self.num_simulations)
+            assert paths.shape == (self.num_simulations, num_steps + 1), f"{model.name}: wrong shape"
+            assert np.all(paths[:, 0] == self.start_price), f"{model.name}: first column should be the start price"
+        
+        # The shared formatter should preserve prices and space times evenly
+        formatted = format_paths(paths, self.start_time, self.time_increment)
+        assert len(formatted) == self.num_simulations
+        assert [p['price'] for p in formatted[0]] == paths[0].tolist()
+        assert formatted[0][-1]['time'] == (self.start_time + timedelta(seconds=self.time_horizon)).isoformat()
+    
     def test_parameter_validation(self):
         """Test that models handle invalid parameters gracefully."""
         # 1. Test negative prices
-        model = RandomWalkModel(volatility=0.02)
+        model = RandomWalkModel(volatility=0.02, rng=self.seed)
         
         # This should work (models should handle negative start prices gracefully or raise clear errors)
         try:
@@ -236,7 +344,7 @@ class TestBaselineModels:
     
     def test_performance_benchmarks(self):
         """Test that models meet basic performance requirements."""
-        model = RandomWalkModel(volatility=0.02)
+        model = RandomWalkModel(volatility=0.02, rng=self.seed)
         
         # 1. Measure prediction generation time
         start_time = time.time()
@@ -291,5 +399,33 @@ class TestBaselineModels:
 # 5. Performance regression tests
 
 
+class TestFloat32Mode:
+    """Test suite for the configurable simulation dtype."""
+
+    def test_models_respect_dtype(self):
+        """Paths stay float32 end to end, even with numpy float64 parameters."""
+        vol = np.float64(0.01)
+        models = [
+            RandomWalkModel(volatility=vol, dtype=np.float32),
+            GeometricBrownianModel(drift=np.float64(1e-4), volatility=vol, dtype=np.float32, sampling="sobol"),
+            MeanReversionModel(mean_price=np.float64(100.0), volatility=vol, dtype=np.float32),
+            MeanReversionModel(mean_price=np.float64(100.0), volatility=vol, dtype=np.float32, scheme="exact"),
+            FluidDynamicsModel(dtype=np.float32, integrator="rk4"),
+        ]
+        for model in models:
+            paths = model.simulate(np.float64(100.0), 24, 8)
+            assert paths.dtype == np.float32, f"{model.name} returned {paths.dtype}"
+
+        with pytest.raises(ValueError):
+            GeometricBrownianModel(dtype=np.int64)
+
+    def test_serialization_boundary_uses_python_floats(self):
+        """Formatted predictions contain plain Python floats."""
+        model = GeometricBrownianModel(dtype=np.float32)
+        predictions = model.predict(100.0, datetime(2025, 1, 1), 300, 3600, 2)
+        assert all(type(p['price']) is float for sim in predictions for p in sim)
+
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,206 @@
+"""
+Tests for background calibration snapshots and scheduling.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.calibration import CalibrationScheduler, CalibrationSnapshot, CalibrationStore
+
+
+def fake_fetch(assets, volatility=0.002):
+    return lambda: {asset: {"volatility": volatility, "drift": 0.0} for asset in assets}
+
+
+class TestCalibrationScheduler:
+    """Test suite for CalibrationScheduler."""
+
+    def test_refresh_publishes_new_snapshot(self):
+        """Test that a refresh swaps in a new immutable snapshot."""
+        scheduler = CalibrationScheduler(fetch=fake_fetch(["BTC", "ETH"]), assets=["BTC", "ETH"])
+        before = scheduler.snapshot
+        assert before.get("BTC") is None
+
+        assert scheduler.refresh()
+        after = scheduler.snapshot
+        assert after is not before
+        assert after.get("BTC") == {"volatility": 0.002, "drift": 0.0}
+        assert scheduler.wait_ready(0)
+
+    def test_partial_failure_keeps_previous_parameters(self):
+        """Test that assets missing from a fetch keep their last good values."""
+        scheduler = CalibrationScheduler(fetch=fake_fetch(["BTC", "ETH"]), assets=["BTC", "ETH"])
+        scheduler.refresh()
+        eth_time = scheduler.snapshot.calibrated_at["ETH"]
+
+        scheduler.fetch = fake_fetch(["BTC"], volatility=0.003)
+        assert not scheduler.refresh()
+        assert scheduler.snapshot.get("BTC")["volatility"] == 0.003
+        assert scheduler.snapshot.get("ETH")["volatility"] == 0.002
+        assert scheduler.snapshot.calibrated_at["ETH"] == eth_time
+
+    def test_fallback_values_keep_their_fetch_time(self):
+        """Test that fetcher fallbacks are neither restamped nor counted as calibrated."""
+        fetched_at = datetime(2025, 1, 1, 12, 0, 0)
+        fallback = {"ETH": {"volatility": 0.002, "drift": 0.0, "calibrated_at": fetched_at}}
+        scheduler = CalibrationScheduler(fetch=lambda: dict(fallback, BTC={"volatility": 0.003, "drift": 0.0}),
+                                         assets=["BTC", "ETH"])
+
+        assert not scheduler.refresh()
+        assert scheduler.snapshot.calibrated_at["ETH"] == fetched_at
+        assert scheduler.snapshot.get("ETH") == {"volatility": 0.002, "drift": 0.0}
+        assert scheduler.snapshot.age("BTC") < 60
+
+        # Nothing new: the snapshot is not republished and backoff applies
+        snapshot = scheduler.snapshot
+        scheduler.fetch = lambda: fallback
+        assert not scheduler.refresh()
+        assert scheduler.snapshot is snapshot
+        assert scheduler.next_delay(False) == scheduler.retry_delay
+
+    def test_snapshot_age(self):
+        """Test per-asset calibration age."""
+        calibrated = datetime(2025, 1, 1, 12, 0, 0)
+        snapshot = CalibrationSnapshot({"BTC": {"volatility": 0.002, "drift": 0.0}}, {"BTC": calibrated})
+        assert snapshot.age("BTC", now=calibrated + timedelta(minutes=5)) == 300
+        assert snapshot.age("ETH") is None
+
+    def test_fetch_exception_is_contained(self):
+        """Test that a raising fetch is reported as a failed refresh."""
+        def failing():
+            raise ConnectionError("offline")
+
+        scheduler = CalibrationScheduler(fetch=failing, assets=["BTC"])
+        assert not scheduler.refresh()
+        assert scheduler.snapshot.params == {}
+
+    def test_concurrent_refreshes_share_one_fetch(self):
+        """Test that a refresh already in flight is waited on, not repeated."""
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.3)
+            return {"BTC": {"volatility": 0.002, "drift": 0.0}, "ETH": {"volatility": 0.003, "drift": 0.0}}
+
+        scheduler = CalibrationScheduler(fetch=slow_fetch, assets=["BTC", "ETH"])
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(scheduler.refresh())) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [True, True, True]
+        assert sorted(scheduler.snapshot.params) == ["BTC", "ETH"]
+
+    def test_delays_with_jitter_and_backoff(self):
+        """Test jittered intervals after success and capped exponential backoff."""
+        scheduler = CalibrationScheduler(interval=100, jitter=0.1, retry_delay=10,
+                                         max_retry_delay=35, seed=0)
+        for _ in range(20):
+            assert 90 <= scheduler.next_delay(True) <= 110
+
+        assert [scheduler.next_delay(False) for _ in range(4)] == [10, 20, 35, 35]
+        scheduler.next_delay(True)
+        assert scheduler.next_delay(False) == 10
+
+    def test_background_thread(self):
+        """Test that the thread publishes a snapshot and stops cleanly."""
+        scheduler = CalibrationScheduler(fetch=fake_fetch(["BTC"]), assets=["BTC"])
+        scheduler.start()
+        try:
+            assert scheduler.wait_ready(5)
+            assert scheduler.running
+        finally:
+            scheduler.stop(5)
+        assert not scheduler.running
+
+
+class TestCalibrationStore:
+    """Test suite for the persistent calibration store."""
+
+    def make_snapshot(self, calibrated_at):
+        params = {"BTC": {"volatility": 0.002, "drift": 0.0001},
+                  "ETH": {"volatility": 0.003, "drift": 0.0}}
+        return CalibrationSnapshot(params, {asset: calibrated_at for asset in params}, calibrated_at)
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved snapshot loads back unchanged."""
+        store = CalibrationStore(str(tmp_path / "nested" / "calibration.json"))
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        store.save(self.make_snapshot(now))
+
+        loaded = store.load(now=now)
+        assert loaded.params == self.make_snapshot(now).params
+        assert loaded.calibrated_at["BTC"] == now
+        assert store.seconds_until_stale(loaded, ["BTC", "ETH"], now=now) == store.ttl
+        assert store.seconds_until_stale(loaded, ["BTC", "SOL"], now=now) == 0.0
+
+    def test_staleness_policy(self, tmp_path):
+        """Test that stale parameters are kept and expired ones discarded."""
+        store = CalibrationStore(str(tmp_path / "calibration.json"), ttl=3600, max_age=7200)
+        saved = datetime(2025, 1, 1, 12, 0, 0)
+        store.save(self.make_snapshot(saved))
+
+        stale = store.load(now=saved + timedelta(minutes=90))
+        assert stale is not None
+        assert store.seconds_until_stale(stale, ["BTC"], now=saved + timedelta(minutes=90)) == 0.0
+        assert store.load(now=saved + timedelta(hours=3)) is None
+
+    def test_unreadable_or_foreign_files_are_ignored(self, tmp_path):
+        """Test missing, corrupt and other-schema files."""
+        path = tmp_path / "calibration.json"
+        store = CalibrationStore(str(path))
+        assert store.load() is None
+
+        path.write_text("{not json")
+        assert store.load() is None
+
+        path.write_text(json.dumps({"schema_version": 999, "assets": {}}))
+        assert store.load() is None
+
+    def test_malformed_saved_at_is_contained(self, tmp_path):
+        """Test that a current-schema file without a valid saved_at never raises."""
+        path = tmp_path / "calibration.json"
+        store = CalibrationStore(str(path))
+        entry = {"volatility": 0.002, "drift": 0.0, "calibrated_at": datetime.now().isoformat()}
+
+        for saved_at in ({}, {"saved_at": "yesterday"}, {"saved_at": None}):
+            path.write_text(json.dumps({"schema_version": 1, "assets": {"BTC": entry}, **saved_at}))
+            assert store.load() is None
+
+        scheduler = CalibrationScheduler(fetch=fake_fetch(["BTC"]), assets=["BTC"], store=store)
+        scheduler.start(delay=3600)
+        scheduler.stop()
+
+    def test_timezone_aware_timestamps(self, tmp_path):
+        """Test that tz-aware timestamps are compared as local time, not dropped."""
+        path = tmp_path / "calibration.json"
+        store = CalibrationStore(str(path))
+        calibrated = datetime.now(timezone.utc) - timedelta(hours=1)
+        path.write_text(json.dumps({
+            "schema_version": 1,
+            "saved_at": calibrated.isoformat(),
+            "assets": {"BTC": {"volatility": 0.002, "drift": 0.0, "calibrated_at": calibrated.isoformat()}}
+        }))
+
+        loaded = store.load()
+        assert loaded is not None
+        assert loaded.age("BTC") == pytest.approx(3600, abs=5)
+
+    def test_scheduler_loads_and_saves(self, tmp_path):
+        """Test that a restarted scheduler publishes stored parameters before fetching."""
+        store = CalibrationStore(str(tmp_path / "calibration.json"))
+        first = CalibrationScheduler(fetch=fake_fetch(["BTC"]), assets=["BTC"], store=store)
+        first.refresh()
+
+        restarted = CalibrationScheduler(fetch=fake_fetch(["BTC"], volatility=0.009),
+                                         assets=["BTC"], store=store)
+        assert restarted.load_store() > 0
+        assert restarted.snapshot.get("BTC")["volatility"] == 0.002
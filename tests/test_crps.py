@@ -182,6 +182,34 @@ class TestCRPSCalculation:
                 [datetime.now(), datetime.now(), datetime.now()]  # 3 times
             )
     
+    def test_crps_array_input(self):
+        """Test that a price array scores the same as the equivalent dicts."""
+        actual_prices = [point['price'] for point in self.actual_data]
+        actual_times = [datetime.fromisoformat(point['time']) for point in self.actual_data]
+        price_array = np.array([[point['price'] for point in sim] for sim in self.predictions])
+        
+        dict_crps = CRPSCalculator(rng=0).calculate_crps(self.predictions, actual_prices, actual_times)
+        array_crps = CRPSCalculator(rng=0).calculate_crps(price_array, actual_prices, actual_times)
+        
+        assert array_crps == pytest.approx(dict_crps)
+    
+    def test_crps_array_exact(self):
+        """Test the vectorized exact CRPS against a brute-force pair average."""
+        rng = np.random.default_rng(1)
+        paths = rng.normal(50000, 1000, size=(20, 6))
+        actual = rng.normal(50000, 500, size=6)
+        
+        expected = np.mean([
+            np.abs(paths[:, t] - actual[t]).mean()
+            - 0.5 * np.abs(paths[:, t][:, None] - paths[:, t][None, :]).mean()
+            for t in range(6)
+        ])
+        
+        assert self.calculator.calculate_crps_array(paths, actual) == pytest.approx(expected)
+        
+        with pytest.raises(ValueError, match="Number of predictions"):
+            self.calculator.calculate_crps_array(paths, actual[:3])
+    
     def test_model_comparison(self):
         """Test comparing multiple models using CRPS."""
         # Create predictions for multiple models
@@ -325,6 +353,39 @@ class TestCRPSCalculation:
         assert metrics['num_simulations'] == 100
         assert metrics['num_time_points'] == 50
 
+    def test_simulation_result_is_scored_without_formatting(self, monkeypatch):
+        """SimulationResults are scored from their price array, never via Synth dicts."""
+        from models.result import SimulationResult
+
+        rng = np.random.default_rng(0)
+        prices = 100.0 + rng.normal(0, 1, (20, 5))
+        actual = 100.0 + rng.normal(0, 1, 5)
+        times = [datetime(2025, 1, 1) + timedelta(minutes=5 * i) for i in range(5)]
+        result = SimulationResult(prices, times[0], 300)
+
+        def no_formatting(*args, **kwargs):
+            raise AssertionError("SimulationResult was materialized")
+
+        monkeypatch.setattr(SimulationResult, "to_list", no_formatting)
+        monkeypatch.setattr(SimulationResult, "__iter__", no_formatting)
+        monkeypatch.setattr(SimulationResult, "__getitem__", no_formatting)
+
+        expected = self.calculator.calculate_crps_array(prices, actual)
+        assert self.calculator.calculate_crps_array(result, actual) == pytest.approx(expected)
+        assert self.calculator.calculate_crps_batch([result, result], actual) == pytest.approx([expected, expected])
+        assert self.calculator._to_price_matrix(result) is prices
+
+    def test_float32_crps_precision(self):
+        """float32 CRPS should agree closely with float64 on the same paths."""
+        from models.baseline.geometric_brownian import GeometricBrownianModel
+
+        paths = GeometricBrownianModel(volatility=0.002, rng=1).simulate(100.0, 288, 1000)
+        truth = paths[0]
+
+        crps64 = CRPSCalculator().calculate_crps_array(paths, truth)
+        crps32 = CRPSCalculator(dtype=np.float32).calculate_crps_array(paths.astype(np.float32), truth)
+        assert crps32 == pytest.approx(crps64, rel=1e-4)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
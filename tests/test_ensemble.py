@@ -0,0 +1,243 @@
+"""
+Tests for array-level ensemble combination.
+"""
+
+import time
+import threading
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+from models.ensemble import (
+    renormalize_weights, weighted_combination, allocate_paths, mixture_combination
+)
+
+
+class TestWeightedCombination:
+    """Test suite for weighted path combination."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.weights = {'RandomWalk': 0.2, 'GBM': 0.5, 'MeanReversion': 0.3}
+        self.paths = {
+            'RandomWalk': np.full((4, 6), 100.0),
+            'GBM': np.full((4, 6), 110.0),
+            'MeanReversion': np.full((4, 6), 90.0),
+        }
+
+    def test_matches_pointwise_average(self):
+        """The tensor reduction equals the per-point weighted sum."""
+        rng = np.random.default_rng(0)
+        paths = {name: rng.normal(100, 5, (4, 6)) for name in self.weights}
+
+        combined = weighted_combination(paths, self.weights)
+        expected = sum(w * paths[name] for name, w in self.weights.items())
+
+        assert combined.shape == (4, 6)
+        np.testing.assert_allclose(combined, expected)
+
+    def test_failed_component_renormalizes(self):
+        """Dropping a component rescales the remaining weights."""
+        del self.paths['RandomWalk']
+
+        combined = weighted_combination(self.paths, self.weights)
+
+        # 0.5 / 0.8 * 110 + 0.3 / 0.8 * 90 = 102.5 (not 82.0 from unscaled weights)
+        np.testing.assert_allclose(combined, 102.5)
+        assert renormalize_weights(self.weights, self.paths) == pytest.approx(
+            {'GBM': 0.625, 'MeanReversion': 0.375}
+        )
+
+    def test_no_usable_component(self):
+        """Components without positive weight cannot be combined."""
+        with pytest.raises(ValueError):
+            weighted_combination({'Other': np.ones((2, 2))}, self.weights)
+
+
+class TestMixtureCombination:
+    """Test suite for mixture-mode path allocation and pooling."""
+
+    def test_allocation_follows_weights(self):
+        """The path budget is split by weight and always sums to the total."""
+        weights = {'RandomWalk': 0.2, 'GBM': 0.5, 'MeanReversion': 0.3}
+
+        assert allocate_paths(weights, 100) == {'RandomWalk': 20, 'GBM': 50, 'MeanReversion': 30}
+        for total in (1, 7, 99, 101):
+            assert sum(allocate_paths(weights, total).values()) == total
+
+        # Largest remainders get the leftover paths
+        assert allocate_paths({'a': 1, 'b': 1, 'c': 1}, 4) == {'a': 2, 'b': 1, 'c': 1}
+
+    def test_mixture_keeps_component_spread(self):
+        """Pooling keeps each path intact instead of averaging it away."""
+        rng = np.random.default_rng(0)
+        paths = {'wide': rng.normal(100, 10, (50, 3)), 'narrow': rng.normal(100, 1, (50, 3))}
+
+        pooled = mixture_combination(paths, rng=np.random.default_rng(1))
+
+        assert pooled.shape == (100, 3)
+        np.testing.assert_allclose(np.sort(pooled, axis=0),
+                                   np.sort(np.concatenate(list(paths.values())), axis=0))
+        averaged = weighted_combination(paths, {'wide': 0.5, 'narrow': 0.5})
+        assert pooled[:, -1].std() > averaged[:, -1].std()
+
+
+class StubComponent:
+    """Component model with paths around a fixed level, optionally slow or failing."""
+
+    def __init__(self, level, spread=1.0, delay=0.0, fail=False):
+        self.level = level
+        self.spread = spread
+        self.delay = delay
+        self.fail = fail
+
+    def simulate(self, start_price, n_steps, n_sims, rng=None, time_increment=300):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("stub failure")
+        return self.level + self.spread * rng.standard_normal((n_sims, n_steps + 1))
+
+
+class HangingComponent:
+    """Component whose runs block until released."""
+
+    def __init__(self, release):
+        self.release = release
+
+    def simulate(self, start_price, n_steps, n_sims, rng=None, time_increment=300):
+        self.release.wait()
+        return np.full((n_sims, n_steps + 1), start_price)
+
+
+def make_ensemble(synth_integration, mode, components, response_margin=0.4, **kwargs):
+    """EnsembleGBMWeightedModel over stub components, calibrated for BTC without network access."""
+    model = synth_integration.EnsembleGBMWeightedModel(seed=0, mode=mode, response_margin=response_margin,
+                                                       **kwargs)
+    model.models = dict(zip(model.models, components))
+    model.apply_calibration("BTC", {"volatility": 0.01, "drift": 0.0})
+    return model
+
+
+class TestEnsembleDeadline:
+    """Test suite for EnsembleGBMWeightedModel under a deadline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.start_time = datetime(2025, 1, 1)
+
+    def test_average_drops_slow_component(self, synth_integration):
+        """A component that misses the budget is dropped and the weights renormalized."""
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0, spread=0.0), StubComponent(110.0, spread=0.0),
+                               StubComponent(90.0, spread=0.0, delay=2.0)])
+        deadline = datetime.now() + timedelta(seconds=1.0)
+
+        result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 100, deadline=deadline)
+
+        assert datetime.now() <= deadline - timedelta(seconds=model.response_margin - 0.1)
+        assert result.prices.shape == (100, 13)
+        # (0.2 * 100 + 0.5 * 110) / 0.7, not 0.2 * 100 + 0.5 * 110
+        np.testing.assert_allclose(result.prices[:, 1:], 75.0 / 0.7)
+
+    def test_average_drops_failed_component(self, synth_integration):
+        """A failing component is left out and the weights renormalized."""
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0, spread=0.0, fail=True), StubComponent(110.0, spread=0.0),
+                               StubComponent(90.0, spread=0.0)])
+
+        result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 100,
+                               deadline=datetime.now() + timedelta(seconds=1.0))
+
+        assert result.prices.shape == (100, 13)
+        np.testing.assert_allclose(result.prices[:, 1:], (0.5 * 110.0 + 0.3 * 90.0) / 0.8)
+
+    def test_mixture_reallocates_failed_component(self, synth_integration):
+        """A failing component's share is simulated by the others."""
+        model = make_ensemble(synth_integration, "mixture",
+                              [StubComponent(100.0), StubComponent(110.0, fail=True), StubComponent(90.0)])
+
+        result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 100,
+                               deadline=datetime.now() + timedelta(seconds=1.0))
+
+        assert result.prices.shape == (100, 13)
+        assert len(np.unique(result.prices, axis=0)) == 100
+        # RandomWalk and MeanReversion split the paths 0.2 : 0.3
+        assert np.sum(result.prices[:, -1] > 95.0) == 40
+
+    def test_concurrent_requests_do_not_queue(self, synth_integration):
+        """Requests sharing one instance each get their own full budget."""
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0), StubComponent(110.0, delay=0.5), StubComponent(90.0)])
+        deadline = datetime.now() + timedelta(seconds=1.5)
+        results = []
+
+        def request():
+            results.append(model.predict("BTC", 100.0, self.start_time, 300, 3600, 100, deadline=deadline))
+
+        threads = [threading.Thread(target=request) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert datetime.now() <= deadline - timedelta(seconds=model.response_margin)
+        assert len(results) == 3
+        # Every request finished in time with GBM included, so nothing was dropped
+        for result in results:
+            assert result.prices.shape == (100, 13)
+            assert result.prices[:, -1].mean() == pytest.approx(0.2 * 100 + 0.5 * 110 + 0.3 * 90, abs=1.0)
+
+    def test_hung_component_does_not_exhaust_workers(self, synth_integration):
+        """Abandoned runs of a hung component never make later requests queue."""
+        release = threading.Event()
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0, spread=0.0), StubComponent(110.0, spread=0.0),
+                               HangingComponent(release)], response_margin=0.2, max_workers=3)
+        try:
+            for _ in range(4):
+                deadline = datetime.now() + timedelta(seconds=0.5)
+                result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 100, deadline=deadline)
+
+                assert datetime.now() <= deadline - timedelta(seconds=model.response_margin - 0.1)
+                np.testing.assert_allclose(result.prices[:, 1:], 75.0 / 0.7)
+        finally:
+            release.set()
+
+    def test_non_finite_paths_are_rejected(self, synth_integration, capsys):
+        """A component returning NaN paths is dropped with the right reason."""
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0, spread=0.0), StubComponent(110.0, spread=0.0),
+                               StubComponent(np.nan, spread=0.0)])
+
+        result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 10)
+
+        np.testing.assert_allclose(result.prices[:, 1:], 75.0 / 0.7)
+        assert "MeanReversion model returned non-finite paths" in capsys.readouterr().out
+
+    def test_busy_instance_respects_deadline(self, synth_integration):
+        """A request never waits on the instance lock past its budget."""
+        model = make_ensemble(synth_integration, "average",
+                              [StubComponent(100.0), StubComponent(110.0), StubComponent(90.0)])
+        deadline = datetime.now() + timedelta(seconds=0.8)
+
+        with model._lock:
+            with pytest.raises(TimeoutError):
+                model.predict("BTC", 100.0, self.start_time, 300, 3600, 100, deadline=deadline)
+        assert datetime.now() <= deadline - timedelta(seconds=model.response_margin - 0.1)
+
+    def test_mixture_refills_shortfall_from_finished_components(self, synth_integration, capsys):
+        """A late component's share is regenerated, not filled with duplicate paths."""
+        model = make_ensemble(synth_integration, "mixture",
+                              [StubComponent(100.0), StubComponent(110.0), StubComponent(90.0, delay=2.0)])
+        deadline = datetime.now() + timedelta(seconds=1.0)
+
+        result = model.predict("BTC", 100.0, self.start_time, 300, 3600, 100, deadline=deadline)
+
+        # Regenerating the shortfall may use up to half the response margin
+        assert datetime.now() <= deadline - timedelta(seconds=model.response_margin / 2 - 0.1)
+        assert result.prices.shape == (100, 13)
+        assert len(np.unique(result.prices, axis=0)) == 100
+        # Only the on-time components contribute paths
+        assert np.all(np.abs(result.prices[:, -1] - 90.0) > 5.0)
+        assert "resampling" not in capsys.readouterr().out
@@ -0,0 +1,105 @@
+"""
+Tests for the multi-asset correlated GBM engine.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from models.baseline.multi_asset import MultiAssetGBMModel, nearest_correlation
+from models.result import SimulationResult
+
+
+class TestMultiAssetGBMModel:
+    """Test suite for correlated multi-asset simulation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.correlation = np.array([
+            [1.0, 0.8, 0.7, 0.1],
+            [0.8, 1.0, 0.75, 0.1],
+            [0.7, 0.75, 1.0, 0.05],
+            [0.1, 0.1, 0.05, 1.0],
+        ])
+        self.model = MultiAssetGBMModel(
+            volatilities={"BTC": 0.002, "ETH": 0.003, "SOL": 0.004, "XAU": 0.001},
+            correlation=self.correlation,
+            rng=0
+        )
+        self.start_prices = {"BTC": 60000.0, "ETH": 3000.0, "SOL": 150.0, "XAU": 2400.0}
+        self.start_time = datetime(2025, 1, 1)
+
+    def test_tensor_shape_and_start_prices(self):
+        """All assets are simulated in one tensor."""
+        paths = self.model.simulate(self.start_prices, 288, 50)
+
+        assert paths.shape == (4, 50, 289)
+        np.testing.assert_array_equal(paths[:, :, 0], np.array([[60000.0], [3000.0], [150.0], [2400.0]]).repeat(50, 1))
+        assert np.all(paths > 0)
+
+    def test_shocks_follow_correlation(self):
+        """Log-returns should reproduce the target correlation and volatilities."""
+        paths = self.model.simulate_relative(288, 2000)
+        log_returns = np.diff(np.log(paths), axis=2).reshape(4, -1)
+
+        np.testing.assert_allclose(np.corrcoef(log_returns), self.correlation, atol=0.02)
+        np.testing.assert_allclose(log_returns.std(axis=1), [0.002, 0.003, 0.004, 0.001], rtol=0.02)
+
+    def test_window_cache(self):
+        """Prompts for other assets in the same window reuse the cached tensor."""
+        btc = self.model.predict_asset("BTC", 60000.0, self.start_time, 300, 3600, 10)
+        eth = self.model.predict_asset("ETH", 3000.0, self.start_time, 300, 3600, 10)
+        btc_again = self.model.predict_asset("BTC", 61000.0, self.start_time, 300, 3600, 10)
+
+        assert isinstance(btc, SimulationResult)
+        assert len(self.model._cache) == 1
+        np.testing.assert_allclose(btc_again.prices / 61000.0, btc.prices / 60000.0)
+        assert eth.prices[0, 0] == 3000.0
+
+        # A new window simulates fresh paths; invalidation empties the cache
+        self.model.predict_asset("BTC", 60000.0, datetime(2025, 1, 2), 300, 3600, 10)
+        assert len(self.model._cache) == 2
+        self.model.invalidate_cache()
+        assert len(self.model._cache) == 0
+
+        with pytest.raises(ValueError):
+            self.model.predict_asset("DOGE", 1.0, self.start_time)
+
+    def test_window_cache_follows_parameters(self):
+        """Editing the public parameter dicts never serves a stale tensor."""
+        before = self.model.predict_asset("BTC", 60000.0, self.start_time, 300, 3600, 2000)
+        self.model.volatilities["BTC"] = 0.02
+        after = self.model.predict_asset("BTC", 60000.0, self.start_time, 300, 3600, 2000)
+
+        assert len(self.model._cache) == 2
+        log_returns = np.diff(np.log(after.prices), axis=1)
+        assert log_returns.std() == pytest.approx(0.02, rel=0.05)
+        assert not np.allclose(before.prices, after.prices)
+
+    def test_calibrate_from_returns(self):
+        """Calibration fits per-asset moments and a valid correlation."""
+        rng = np.random.default_rng(1)
+        base = rng.normal(0, 0.002, 500)
+        returns = pd.DataFrame({
+            "BTC": base,
+            "ETH": base * 1.5 + rng.normal(0, 0.001, 500),
+            "SOL": rng.normal(0, 0.004, 500),
+        })
+        # Gold trades fewer hours: only part of the window has data
+        returns["XAU"] = np.where(np.arange(500) < 200, rng.normal(0, 0.001, 500), np.nan)
+
+        params = self.model.calibrate(returns)
+
+        assert params["volatilities"]["BTC"] == pytest.approx(base.std(ddof=1))
+        assert self.model.correlation[0, 1] > 0.9
+        np.testing.assert_allclose(np.diag(self.model.correlation), 1.0)
+        np.linalg.cholesky(self.model.correlation)
+
+    def test_nearest_correlation(self):
+        """Indefinite pairwise estimates are repaired into valid correlations."""
+        broken = np.array([[1.0, 0.9, 0.9], [0.9, 1.0, -0.9], [0.9, -0.9, 1.0]])
+        fixed = nearest_correlation(broken)
+
+        np.testing.assert_allclose(np.diag(fixed), 1.0)
+        assert np.all(np.linalg.eigvalsh(fixed) > 0)
@@ -0,0 +1,92 @@
+"""
+Tests for the streaming volatility/drift estimator.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.baseline.online_volatility import OnlineVolatilityEstimator
+
+
+class TestOnlineVolatilityEstimator:
+    """Test suite for OnlineVolatilityEstimator."""
+
+    def setup_method(self):
+        """Set up a price series."""
+        rng = np.random.default_rng(0)
+        self.prices = 100.0 * np.cumprod(1 + rng.normal(0.0001, 0.002, 500))
+        self.returns = pd.Series(self.prices).pct_change().dropna()
+
+    def test_welford_matches_pandas(self):
+        """Test the expanding estimate against pct_change().std()/.mean()."""
+        estimator = OnlineVolatilityEstimator()
+        for price in self.prices:
+            estimator.update(price)
+
+        assert estimator.count == len(self.returns)
+        assert estimator.volatility == pytest.approx(self.returns.std(), rel=1e-10)
+        assert estimator.drift == pytest.approx(self.returns.mean(), rel=1e-10)
+
+    def test_rolling_window_matches_tail(self):
+        """Test the ring-buffer window against the last window returns."""
+        estimator = OnlineVolatilityEstimator(window=100)
+        for price in self.prices:
+            estimator.update(price)
+
+        tail = self.returns.iloc[-100:]
+        assert estimator.count == 100
+        assert estimator.volatility == pytest.approx(tail.std(), rel=1e-8)
+        assert estimator.drift == pytest.approx(tail.mean(), rel=1e-8)
+
+    def test_ewma_matches_pandas(self):
+        """Test the EWMA estimate against pandas' adjust=False recursion."""
+        estimator = OnlineVolatilityEstimator(method="ewma", halflife=50)
+        for r in self.returns:
+            estimator.update_return(r)
+
+        ewm = self.returns.ewm(halflife=50, adjust=False)
+        assert estimator.drift == pytest.approx(ewm.mean().iloc[-1], rel=1e-10)
+        # Same recursion, seeded with zero variance at the first return
+        assert estimator.volatility == pytest.approx(np.sqrt(ewm.var(bias=True).iloc[-1]), rel=1e-6)
+
+    def test_ingest_bars_only_consumes_new_bars(self):
+        """Test incremental ingestion of a growing bar frame."""
+        index = pd.date_range("2025-01-01", periods=len(self.prices), freq="5min", tz="UTC")
+        bars = pd.DataFrame({"Close": self.prices}, index=index)
+
+        estimator = OnlineVolatilityEstimator()
+        assert estimator.ingest_bars(bars.iloc[:300], closed_only=False) == 300
+        assert estimator.ingest_bars(bars, closed_only=False) == 200
+        assert estimator.ingest_bars(bars, closed_only=False) == 0
+        assert estimator.volatility == pytest.approx(self.returns.std(), rel=1e-10)
+
+    def test_forming_bar_is_ingested_once_closed(self):
+        """Test that the last bar is only consumed, with its corrected close, once a newer bar exists."""
+        index = pd.date_range("2025-01-01", periods=len(self.prices), freq="5min", tz="UTC")
+        bars = pd.DataFrame({"Close": self.prices}, index=index)
+        forming = bars.iloc[:300].copy()
+        forming.iloc[-1, 0] *= 1.5
+
+        estimator = OnlineVolatilityEstimator()
+        assert estimator.ingest_bars(forming) == 299
+        assert estimator.ingest_bars(bars) == 200
+        assert estimator.volatility == pytest.approx(self.returns.iloc[:-1].std(), rel=1e-10)
+
+    def test_invalid_prices_are_skipped(self):
+        """Test that NaN, zero and negative closes do not poison the state."""
+        estimator = OnlineVolatilityEstimator()
+        used = [estimator.update(price) for price in [100.0, np.nan, 0.0, 101.0, -5.0, np.inf, 102.0]]
+
+        assert used == [True, False, False, True, False, False, True]
+        returns = pd.Series([100.0, 101.0, 102.0]).pct_change().dropna()
+        assert estimator.volatility == pytest.approx(returns.std(), rel=1e-10)
+        assert estimator.drift == pytest.approx(returns.mean(), rel=1e-10)
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            OnlineVolatilityEstimator(method="garch")
+        with pytest.raises(ValueError):
+            OnlineVolatilityEstimator(window=1)
+        assert OnlineVolatilityEstimator().volatility is None
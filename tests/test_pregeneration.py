@@ -0,0 +1,90 @@
+"""
+Tests for speculative pre-generation of prompt responses.
+"""
+
+import numpy as np
+from datetime import datetime, timezone
+
+from models.pregeneration import PregenerationService
+from models.baseline.geometric_brownian import GeometricBrownianModel
+
+
+class TestPregenerationService:
+    """Test suite for PregenerationService."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.model = GeometricBrownianModel(drift=0.0, volatility=0.01, rng=0)
+        self.version = 1
+        self.service = PregenerationService(
+            generate=lambda asset, *args: self.model.simulate_result(*args),
+            assets=["BTC", "ETH"],
+            time_horizon=3600,
+            num_simulations=10,
+            cadence=60,
+            cache_size=3,
+            version_fn=lambda: self.version
+        )
+        self.start_time = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_upcoming_slots(self):
+        """Test cadence-aligned slots between the prompt lead and the lead time."""
+        now = datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        slots = self.service.upcoming_slots(now)
+        # Prompts for slots before 12:02:30 have already arrived
+        assert [slot.isoformat() for slot in slots] == [
+            "2025-01-01T12:03:00+00:00", "2025-01-01T12:04:00+00:00", "2025-01-01T12:05:00+00:00"
+        ]
+
+        default = PregenerationService(generate=None, assets=["BTC"])
+        assert [slot.isoformat() for slot in default.upcoming_slots(now)] == ["2025-01-01T12:05:00+00:00"]
+        assert default.lead_time > default.prompt_lead + default.poll_interval
+
+    def test_hit_is_scaled_to_live_price(self):
+        """Test that a pre-generated slot is served once, scaled by the start price."""
+        assert self.service.pregenerate("BTC", self.start_time)
+        assert not self.service.pregenerate("BTC", self.start_time)
+
+        result = self.service.get("BTC", 50000.0, self.start_time)
+        assert result.prices.shape == (10, 13)
+        np.testing.assert_allclose(result.prices[:, 0], 50000.0)
+        assert result[0][0]["time"] == self.start_time.isoformat()
+
+        assert self.service.get("BTC", 50000.0, self.start_time) is None
+        assert (self.service.hits, self.service.misses) == (1, 1)
+
+    def test_generated_at_latest_price(self):
+        """Test that paths are generated at the latest price and rescaled when served."""
+        calls = []
+
+        def generate(asset, start_price, *args):
+            calls.append(start_price)
+            return self.model.simulate_result(start_price, *args)
+
+        prices = {"BTC": 50000.0}
+        service = PregenerationService(generate=generate, assets=["BTC", "ETH"], time_horizon=3600,
+                                       num_simulations=10, price_fn=prices.get)
+        assert service.pregenerate("BTC", self.start_time)
+        # No known price for ETH, so nothing is generated
+        assert not service.pregenerate("ETH", self.start_time)
+        assert calls == [50000.0]
+
+        result = service.get("BTC", 50500.0, self.start_time)
+        assert np.allclose(result.prices[:, 0], 50500.0)
+
+    def test_naive_request_time_matches_utc_slot(self):
+        """Test that a naive (local) request time hits the tz-aware slot."""
+        self.service.pregenerate("BTC", self.start_time)
+        naive = self.start_time.astimezone().replace(tzinfo=None)
+        assert self.service.get("BTC", 50000.0, naive) is not None
+
+    def test_misses(self):
+        """Test unknown windows, new versions and cache eviction."""
+        self.service.pregenerate("BTC", self.start_time)
+        assert self.service.get("BTC", 1.0, self.start_time, num_simulations=100) is None
+
+        self.version = 2
+        assert self.service.get("BTC", 1.0, self.start_time) is None
+
+        assert self.service.run_once(datetime(2025, 1, 1, 11, 58, 30, tzinfo=timezone.utc)) == 6
+        assert len(self.service) == 3
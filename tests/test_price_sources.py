@@ -0,0 +1,100 @@
+"""
+Tests for the price source abstraction and the offline replay backend.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.baseline import price_sources
+from models.baseline.price_sources import (PriceSource, ReplayPriceSource, YFinancePriceSource,
+                                           asset_for, normalize_bars)
+import models.baseline.volatility_calculator as vc
+
+
+def make_bars(count=50):
+    index = pd.date_range("2025-01-01", periods=count, freq="5min", tz="UTC")
+    close = 100.0 + np.arange(count)
+    return pd.DataFrame({"close": close, "high": close + 1, "low": close - 1}, index=index)
+
+
+class TestReplayPriceSource:
+    """Test suite for ReplayPriceSource."""
+
+    def test_normalize_bars(self):
+        """Test column names, missing columns and the UTC index."""
+        bars = normalize_bars(make_bars())
+        assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        np.testing.assert_array_equal(bars["Open"], bars["Close"])
+        assert str(bars.index.tz) == "UTC"
+
+    def test_replay_clock(self):
+        """Test that only bars up to the replay time are visible."""
+        source = ReplayPriceSource({"BTC-USD": make_bars()}, now="2025-01-01 01:00")
+        assert isinstance(source, PriceSource)
+        assert asset_for("BTC-USD") == "BTC"
+
+        assert source.get_price("BTC") == 112.0
+        assert len(source.get_bars("BTC-USD", period="30m")) == 6
+        assert len(source.get_bars("BTC", start="2025-01-01 00:50")) == 3
+
+        source.advance(600)
+        assert source.get_price("BTC") == 114.0
+
+    def test_stream_advances_clock(self):
+        """Test bar-by-bar replay."""
+        source = ReplayPriceSource({"ETH": make_bars(5)})
+        closes = [row["Close"] for _, row in source.stream("ETH")]
+        assert closes == [100.0, 101.0, 102.0, 103.0, 104.0]
+        assert source.now == pd.Timestamp("2025-01-01 00:20", tz="UTC")
+
+    def test_files_and_calibration(self, tmp_path, monkeypatch):
+        """Test loading a directory of CSV files and calibrating from it offline."""
+        make_bars().to_csv(tmp_path / "SOL.csv")
+        source = ReplayPriceSource.from_directory(str(tmp_path))
+        assert source.get_price("SOL-USD") == 149.0
+
+        monkeypatch.setattr(vc, "_price_source", source)
+        monkeypatch.setattr(vc, "_bar_store", None)
+        vol, drift = vc.get_volatility("1d", "SOL-USD")
+        expected = source.get_bars("SOL")["Close"].pct_change().dropna()
+        assert vol == pytest.approx(expected.std())
+        assert drift == pytest.approx(expected.mean())
+
+    def test_parquet_time_column(self, tmp_path, monkeypatch):
+        """Test that a parquet file with time in the first column keeps its timestamps."""
+        frame = make_bars(5).reset_index(names="time")
+        monkeypatch.setattr(pd, "read_parquet", lambda path: frame.copy())
+
+        source = ReplayPriceSource({"BTC": str(tmp_path / "BTC.parquet")})
+        bars = source.get_bars("BTC")
+        assert bars.index[0] == pd.Timestamp("2025-01-01 00:00", tz="UTC")
+        assert bars["Close"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+
+
+class TestYFinancePriceSource:
+    """Test suite for YFinancePriceSource."""
+
+    def test_bars_follow_the_interface(self, monkeypatch):
+        """Test that yfinance frames come back as UTC OHLCV bars."""
+        index = pd.date_range("2025-01-01 09:30", periods=3, freq="5min", tz="America/New_York")
+        raw = pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 10,
+                            "Dividends": 0.0, "Stock Splits": 0.0}, index=index)
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            def history(self, **kwargs):
+                return raw
+
+        class FakeYFinance:
+            Ticker = FakeTicker
+
+        monkeypatch.setattr(price_sources, "yf", FakeYFinance)
+        bars = YFinancePriceSource().get_bars("GC=F", period="1d")
+
+        assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert str(bars.index.tz) == "UTC"
+        assert bars.index[0] == pd.Timestamp("2025-01-01 14:30", tz="UTC")
+
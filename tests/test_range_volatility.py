@@ -0,0 +1,88 @@
+"""
+Tests for range-based realized volatility estimators.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.baseline.range_volatility import (
+    RANGE_ESTIMATORS, range_volatility, parkinson, rogers_satchell, yang_zhang, _log_ranges
+)
+import models.baseline.volatility_calculator as vc
+
+
+def simulate_bars(num_bars, sigma, steps_per_bar=100, seed=0):
+    """OHLC bars from a driftless log random walk with per-bar volatility sigma."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, sigma / np.sqrt(steps_per_bar), (num_bars, steps_per_bar))
+    log_path = np.cumsum(steps, axis=1)
+    opens = np.concatenate([[0.0], log_path[:-1, -1].cumsum()])
+    within = opens[:, None] + log_path
+    index = pd.date_range("2025-01-01", periods=num_bars, freq="5min", tz="UTC")
+    return pd.DataFrame({
+        "Open": 100 * np.exp(opens),
+        "High": 100 * np.exp(np.maximum(within.max(axis=1), opens)),
+        "Low": 100 * np.exp(np.minimum(within.min(axis=1), opens)),
+        "Close": 100 * np.exp(within[:, -1]),
+    }, index=index)
+
+
+class TestRangeVolatility:
+    """Test suite for the range estimators."""
+
+    def test_estimators_recover_volatility(self):
+        """Test every estimator against the true per-bar volatility."""
+        bars = simulate_bars(2000, sigma=0.002)
+        for method in RANGE_ESTIMATORS:
+            # Discrete sampling of the high/low biases range estimators slightly low
+            assert range_volatility(bars, method) == pytest.approx(0.002, rel=0.1), method
+
+    def test_range_estimators_need_fewer_bars(self):
+        """Test that Parkinson is tighter than close-to-close on short windows."""
+        range_errors, close_errors = [], []
+        for seed in range(50):
+            bars = simulate_bars(48, sigma=0.002, seed=seed)
+            range_errors.append(parkinson(bars) - 0.002)
+            close_errors.append(bars["Close"].pct_change().std() - 0.002)
+        assert np.std(range_errors) < np.std(close_errors)
+
+    def test_invalid_input(self):
+        """Test unknown estimators and too few bars."""
+        bars = simulate_bars(10, sigma=0.002)
+        with pytest.raises(ValueError):
+            range_volatility(bars, "garch")
+        with pytest.raises(ValueError):
+            range_volatility(bars.iloc[:1])
+
+    def test_inconsistent_bars_do_not_raise(self):
+        """Test that a negative variance from bad bars (high below close) is clamped to zero."""
+        bars = {"Open": np.array([100.0, 100.0]), "High": np.array([101.0, 101.0]),
+                "Low": np.array([100.0, 100.0]), "Close": np.array([110.0, 110.0])}
+        assert rogers_satchell(bars) == 0.0
+        assert yang_zhang(bars) == 0.0
+
+    def test_no_gap_across_dropped_bars(self):
+        """Test that gaps are only taken between bars adjacent in the input."""
+        bars = simulate_bars(20, sigma=0.002)
+        # Every open equals the previous close, so all real gaps are zero
+        bars.iloc[5, bars.columns.get_loc("Close")] = 0.0
+
+        u, _, _, gap = _log_ranges(bars)
+        assert len(u) == 19
+        assert len(gap) == 17
+        np.testing.assert_allclose(gap, 0.0, atol=1e-12)
+
+    def test_get_volatility_with_range_estimator(self, monkeypatch):
+        """Test get_volatility with a range estimator selected."""
+        bars = simulate_bars(200, sigma=0.002)
+        monkeypatch.setattr(vc, "get_history", lambda time, ticker: bars)
+        vc.set_volatility_estimator("yang_zhang")
+        try:
+            vol, drift = vc.get_volatility("1d", "BTC-USD")
+        finally:
+            vc.set_volatility_estimator("close")
+        assert vol == pytest.approx(range_volatility(bars, "yang_zhang"))
+        assert drift == pytest.approx(bars["Close"].pct_change().mean())
+        with pytest.raises(ValueError):
+            vc.set_volatility_estimator("garch")
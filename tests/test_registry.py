@@ -0,0 +1,47 @@
+"""
+Tests for the process-wide model registry.
+"""
+
+import threading
+
+from models.registry import ModelRegistry
+from models.baseline.geometric_brownian import GeometricBrownianModel
+
+
+class TestModelRegistry:
+    """Test suite for ModelRegistry."""
+
+    def test_instances_are_reused_per_key(self):
+        """Test that get() builds once per key and then returns the same instance."""
+        built = []
+        registry = ModelRegistry(lambda asset: built.append(asset) or GeometricBrownianModel())
+
+        btc = registry.get("BTC")
+        assert registry.get("BTC") is btc
+        assert registry.get("ETH") is not btc
+        assert built == ["BTC", "ETH"]
+        assert "BTC" in registry and len(registry) == 2
+
+    def test_invalidation(self):
+        """Test dropping one key or the whole registry."""
+        registry = ModelRegistry(lambda asset: GeometricBrownianModel())
+        btc, eth = registry.get("BTC"), registry.get("ETH")
+
+        registry.invalidate("BTC")
+        assert registry.get("BTC") is not btc
+        assert registry.get("ETH") is eth
+
+        registry.invalidate()
+        assert len(registry) == 0
+
+    def test_concurrent_get_builds_once(self):
+        """Test that racing threads share one instance."""
+        registry = ModelRegistry(lambda asset: GeometricBrownianModel())
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(registry.get("BTC"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(model is seen[0] for model in seen)
@@ -0,0 +1,65 @@
+"""
+Tests for variance-reduced shock sampling.
+"""
+
+import pytest
+import numpy as np
+from scipy.stats import norm
+
+from models.rng import make_rng
+from models.sampling import SAMPLING_METHODS, standard_normals
+from models.baseline.geometric_brownian import GeometricBrownianModel
+from models.crps import CRPSCalculator
+
+
+class TestSampling:
+    """Test suite for sampling methods."""
+
+    @pytest.mark.parametrize("method", SAMPLING_METHODS)
+    def test_shape_and_moments(self, method):
+        """Every method should produce standard normal shocks."""
+        z = standard_normals(make_rng(0), (512, 16), method)
+
+        assert z.shape == (512, 16)
+        assert np.all(np.isfinite(z))
+        assert abs(z.mean()) < 0.05
+        assert abs(z.std() - 1.0) < 0.05
+
+    def test_antithetic_pairs(self):
+        """Antithetic draws should come in exact +/- pairs."""
+        z = standard_normals(make_rng(0), (10, 5), "antithetic")
+        np.testing.assert_array_equal(z[:5], -z[5:])
+
+        # Odd path counts are truncated, not padded
+        assert standard_normals(make_rng(0), (7, 5), "antithetic").shape == (7, 5)
+
+    def test_lhs_stratifies_each_step(self):
+        """Latin hypercube puts exactly one path in each probability stratum."""
+        n = 100
+        z = standard_normals(make_rng(0), (n, 8), "lhs")
+        strata = np.floor(norm.cdf(z) * n).astype(int)
+        for column in strata.T:
+            assert sorted(column) == list(range(n))
+
+    def test_invalid_method(self):
+        """Unknown methods should raise clear errors."""
+        with pytest.raises(ValueError):
+            standard_normals(make_rng(0), (4, 4), "halton")
+        with pytest.raises(ValueError):
+            GeometricBrownianModel(sampling="halton")
+
+    def test_variance_reduction_is_measurable(self):
+        """Antithetic and QMC sampling should stabilize CRPS at a fixed budget."""
+        truth = GeometricBrownianModel(volatility=0.002, rng=5).simulate(100.0, 48, 1)[0]
+        model = GeometricBrownianModel(volatility=0.002)
+
+        results = CRPSCalculator().compare_sampling_methods(
+            model, 100.0, truth, num_simulations=64, repeats=20, seed=3
+        )
+
+        assert set(results) == set(SAMPLING_METHODS)
+        for method in ("antithetic", "sobol", "lhs"):
+            assert results[method]['crps_std'] < results['plain']['crps_std']
+        assert all(r['seconds_per_run'] >= 0 for r in results.values())
+        # The caller's model keeps its own sampling setting
+        assert model.sampling == "plain"
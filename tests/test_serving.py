@@ -0,0 +1,167 @@
+"""
+Tests for the serving path of the integration module: registries,
+pre-generation wiring and the deadline fallback chain.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+from models.calibration import CalibrationScheduler
+from models.pregeneration import PregenerationService
+from models.registry import ModelRegistry
+from models.result import SimulationResult
+from tests.test_ensemble import StubComponent, make_ensemble
+
+
+class FixedPrice:
+    """Price source that always reports the same price."""
+
+    def get_price(self, symbol):
+        return 100.0
+
+
+@pytest.fixture(autouse=True)
+def serving_globals(synth_integration, monkeypatch):
+    """Fresh serving globals, so no test sees another's state or touches the network."""
+    si = synth_integration
+
+    def stub_ensemble(asset):
+        return make_ensemble(si, "average", [StubComponent(100.0), StubComponent(110.0), StubComponent(90.0)])
+
+    pregeneration = PregenerationService(
+        generate=si._pregenerate,
+        assets=["BTC"],
+        version_fn=lambda: si.CALIBRATION_SCHEDULER.snapshot.created_at,
+        price_fn=lambda asset: si.PRICE_SOURCE.get_price(asset)
+    )
+    pregeneration.start = lambda: None
+
+    monkeypatch.setattr(si, "CALIBRATION_SCHEDULER", CalibrationScheduler(fetch=lambda: {}, assets=["BTC"]))
+    monkeypatch.setattr(si, "MODEL_REGISTRY", ModelRegistry(stub_ensemble))
+    monkeypatch.setattr(si, "PREGENERATION_MODELS", ModelRegistry(stub_ensemble))
+    monkeypatch.setattr(si, "PREGENERATION", pregeneration)
+    monkeypatch.setattr(si, "PRICE_SOURCE", FixedPrice())
+    monkeypatch.setattr(si, "STRATEGY_SECONDS", dict(si.STRATEGY_SECONDS))
+    monkeypatch.setattr(si, "_LAST_UNIT_PATHS", {})
+
+
+class TestPregenerationWiring:
+    """Test suite for how the integration module pre-generates slots."""
+
+    def test_pregeneration_uses_own_instances_and_slot_deadline(self, synth_integration, monkeypatch):
+        """Background runs never share an instance with live requests and end by the slot start."""
+        calls = []
+
+        class Recorder:
+            def predict(self, asset, start_price, start_time, time_increment, time_horizon,
+                        num_simulations, deadline=None):
+                calls.append((self, start_price, deadline))
+                return SimulationResult(np.ones((num_simulations, 3)), start_time, time_increment)
+
+        monkeypatch.setattr(synth_integration, "PREGENERATION_MODELS", ModelRegistry(lambda asset: Recorder()))
+        slot = datetime(2030, 1, 1, 0, 5, tzinfo=timezone.utc)
+
+        assert synth_integration.PREGENERATION.pregenerate("BTC", slot, 300, 600, 2)
+        instance, start_price, deadline = calls[0]
+        assert deadline == slot
+        assert start_price == 100.0
+        assert instance is not synth_integration.MODEL_REGISTRY.get("BTC")
+
+
+class TestDegradedPredict:
+    """Test suite for the deadline fallback chain of the integration module."""
+
+    @pytest.fixture(autouse=True)
+    def serving_state(self, synth_integration, serving_globals, monkeypatch):
+        """Counting scheduler and a registry of ensembles that read it."""
+        self.si = synth_integration
+        self.fetches = []
+
+        def fetch():
+            self.fetches.append(1)
+            return {"BTC": {"volatility": 0.002, "drift": 0.0}}
+
+        self.scheduler = CalibrationScheduler(fetch=fetch, assets=["BTC"])
+        self.registry = ModelRegistry(self.make_model)
+        monkeypatch.setattr(synth_integration, "CALIBRATION_SCHEDULER", self.scheduler)
+        monkeypatch.setattr(synth_integration, "MODEL_REGISTRY", self.registry)
+        self.start_time = datetime(2025, 1, 1)
+
+    def make_model(self, asset):
+        model = make_ensemble(self.si, "average",
+                              [StubComponent(100.0), StubComponent(110.0), StubComponent(90.0)])
+        model.calibration = self.scheduler
+        return model
+
+    def test_stale_snapshot_is_refreshed_first(self, capsys):
+        """Without a fresh calibration the fetch runs before the ensemble."""
+        result = self.si.degraded_predict("BTC", 100.0, self.start_time, 300, 3600, 100)
+
+        assert self.fetches == [1]
+        assert self.scheduler.snapshot.get("BTC")["volatility"] == 0.002
+        assert result.prices.shape == (100, 13)
+        out = capsys.readouterr().out
+        assert "fresh calibration" in out and ": ensemble (" in out
+
+    def test_fresh_snapshot_skips_refresh(self):
+        """A fresh snapshot is used as-is."""
+        self.scheduler.refresh()
+
+        self.si.degraded_predict("BTC", 100.0, self.start_time, 300, 3600, 100)
+        assert self.fetches == [1]
+
+    def test_ensemble_failure_falls_back_to_gbm(self, capsys, monkeypatch):
+        """A failing ensemble is replaced by GBM with the snapshot parameters."""
+        self.scheduler.refresh()
+        def broken_predict(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(self.registry.get("BTC"), "predict", broken_predict)
+
+        result = self.si.degraded_predict("BTC", 100.0, self.start_time, 300, 3600, 100)
+
+        assert result.prices.shape == (100, 13)
+        assert np.all(result.prices[:, 0] == 100.0)
+        assert ": gbm (" in capsys.readouterr().out
+
+    def test_no_time_serves_rescaled_previous_paths(self, capsys):
+        """With no budget left the previous response is rescaled to the new price."""
+        unit_paths = np.random.default_rng(0).lognormal(0, 0.01, (100, 13))
+        self.si._LAST_UNIT_PATHS["BTC"] = (unit_paths, 300)
+
+        result = self.si.degraded_predict("BTC", 200.0, self.start_time, 300, 3600, 100,
+                                          deadline=datetime.now() + timedelta(milliseconds=50))
+
+        np.testing.assert_allclose(result.prices, 200.0 * unit_paths)
+        assert "rescaled previous paths" in capsys.readouterr().out
+        assert self.fetches == []
+
+    def test_no_time_and_no_history_still_answers(self, capsys):
+        """Over budget with nothing cached, a plain GBM answer is returned late."""
+        result = self.si.degraded_predict("BTC", 100.0, self.start_time, 300, 3600, 100,
+                                          deadline=datetime.now() - timedelta(seconds=1))
+
+        assert result.prices.shape == (100, 13)
+        assert "gbm (over budget)" in capsys.readouterr().out
+
+    def test_over_budget_gbm_uses_snapshot(self):
+        """The last-resort GBM still uses the cached calibration."""
+        self.scheduler.refresh()
+
+        result = self.si.degraded_predict("BTC", 100.0, self.start_time, 300, 3600, 100,
+                                          deadline=datetime.now() - timedelta(seconds=1))
+
+        # Snapshot volatility is 0.002 per step; the default would be 0.015
+        assert np.std(np.diff(np.log(result.prices), axis=1)) == pytest.approx(0.002, rel=0.2)
+
+    def test_generate_synth_simulations_remembers_unit_paths(self, monkeypatch):
+        """Every response is kept as unit-price paths for the last-resort fallback."""
+        monkeypatch.setattr(self.scheduler, "start", lambda: None)
+
+        paths = self.si.generate_synth_simulations("BTC", self.start_time.isoformat(), 300, 3600, 100)
+
+        assert len(paths) == 100 and len(paths[0]) == 13
+        unit_paths, increment = self.si._LAST_UNIT_PATHS["BTC"]
+        assert increment == 300
+        np.testing.assert_allclose(unit_paths[0] * 100.0, [p["price"] for p in paths[0]])
@@ -0,0 +1,95 @@
+"""
+Tests for the lazy SimulationResult container.
+"""
+
+import json
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+from models.result import SimulationResult, format_paths
+from models.timegrid import time_grid
+from models.baseline.geometric_brownian import GeometricBrownianModel
+
+
+class TestSimulationResult:
+    """Test suite for SimulationResult."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.start_time = datetime(2025, 1, 1, 12, 0, 0)
+        self.time_increment = 300
+        self.prices = np.array([
+            [100.0, 101.0, 102.0],
+            [100.0, 99.0, 98.5],
+        ])
+        self.result = SimulationResult(self.prices, self.start_time, self.time_increment)
+
+    def test_len_and_indexing(self):
+        """Test list-like access matches the eager format."""
+        expected = format_paths(self.prices, self.start_time, self.time_increment)
+
+        assert len(self.result) == 2
+        assert self.result[0] == expected[0]
+        assert self.result[-1] == expected[-1]
+        assert self.result[0:1] == expected[0:1]
+        assert self.result[1][2] == {
+            'time': (self.start_time + timedelta(seconds=600)).isoformat(),
+            'price': 98.5
+        }
+
+        with pytest.raises(IndexError):
+            self.result[2]
+
+    def test_lazy_materialization(self):
+        """Test that dicts are only built when requested, and only once."""
+        assert self.result._formatted is None
+
+        # Indexing a single path does not materialize the whole result
+        self.result[0]
+        assert self.result._formatted is None
+
+        formatted = self.result.to_list()
+        assert formatted is self.result.to_list()
+        assert list(self.result) == formatted
+
+    def test_serialization(self):
+        """Test JSON output uses plain Python floats and ISO strings."""
+        data = json.loads(self.result.to_json())
+
+        assert data == format_paths(self.prices, self.start_time, self.time_increment)
+        assert all(isinstance(point['price'], float) for path in data for point in path)
+
+    def test_model_simulate_result(self):
+        """Test that models can return a SimulationResult directly."""
+        model = GeometricBrownianModel(drift=0.0, volatility=0.01)
+        result = model.simulate_result(50000.0, self.start_time, self.time_increment, 3600, 5)
+
+        assert isinstance(result, SimulationResult)
+        assert result.prices.shape == (5, 13)
+        assert result[0][0] == {'time': self.start_time.isoformat(), 'price': 50000.0}
+
+
+class TestTimeGrid:
+    """Test suite for the shared timestamp grid."""
+
+    def test_grid_matches_per_point_datetimes(self):
+        """Test epoch seconds and ISO strings against datetime arithmetic."""
+        start_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        grid = time_grid(start_time, 300, 3600)
+
+        assert len(grid) == 13
+        assert grid.iso[0] == start_time.isoformat()
+        assert grid.iso[-1] == (start_time + timedelta(hours=1)).isoformat()
+        assert grid.epoch[-1] == (start_time + timedelta(hours=1)).timestamp()
+        assert not grid.epoch.flags.writeable
+
+    def test_grid_is_shared(self):
+        """Test that models and results reuse one cached grid per window."""
+        start_time = datetime(2025, 1, 1, 12, 0, 0)
+        grid = time_grid(start_time, 300, 3600)
+        assert time_grid(start_time, 300, 3600) is grid
+
+        result = GeometricBrownianModel(rng=0).simulate_result(100.0, start_time, 300, 3600, 4)
+        assert result.timestamps is grid
+        assert [point['time'] for point in result[0]] == list(grid.iso)
@@ -0,0 +1,102 @@
+"""
+Tests for concurrent volatility fetching.
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import models.baseline.volatility_calculator as vc
+
+
+class TestGetAllVolatilities:
+    """Test suite for get_all_volatilities."""
+
+    def test_slow_ticker_does_not_block_others(self, monkeypatch):
+        """Test the per-ticker timeout with tickers fetched concurrently."""
+        def fetch(period, ticker):
+            time.sleep(2.0 if ticker == "GC=F" else 0.1)
+            return (0.002, 0.0)
+
+        monkeypatch.setattr(vc, "get_volatility", fetch)
+        monkeypatch.setattr(vc, "_last_volatilities", {})
+
+        started = time.monotonic()
+        vols = vc.get_all_volatilities(timeout=0.5)
+        assert time.monotonic() - started < 1.0
+        assert sorted(vols) == ["BTC", "ETH", "SOL"]
+
+    def test_failed_ticker_falls_back_to_previous_values(self, monkeypatch):
+        """Test that a failing ticker keeps its last good values."""
+        monkeypatch.setattr(vc, "_last_volatilities", {})
+        monkeypatch.setattr(vc, "get_volatility", lambda period, ticker: (0.002, 0.0001))
+        vc.get_all_volatilities()
+
+        monkeypatch.setattr(vc, "get_volatility",
+                            lambda period, ticker: None if ticker == "SOL-USD" else (0.003, 0.0))
+        vols = vc.get_all_volatilities()
+        assert vols["SOL"]["volatility"] == 0.002 and vols["SOL"]["drift"] == 0.0001
+        # The fallback is tagged with its original fetch time
+        assert vols["SOL"]["calibrated_at"] < datetime.now()
+        assert vols["BTC"] == {"volatility": 0.003, "drift": 0.0}
+
+    def test_raising_ticker_is_skipped(self, monkeypatch, capsys):
+        """Test that an exception from one ticker does not lose the others."""
+        def fetch(period, ticker):
+            if ticker == "ETH-USD":
+                raise ConnectionError("reset by peer")
+            return (0.002, 0.0)
+
+        monkeypatch.setattr(vc, "get_volatility", fetch)
+        monkeypatch.setattr(vc, "_last_volatilities", {})
+
+        vols = vc.get_all_volatilities()
+        assert sorted(vols) == ["BTC", "SOL", "XAU"]
+        assert "Error fetching ETH-USD: reset by peer" in capsys.readouterr().out
+
+    def test_all_returns_are_time_aligned(self, monkeypatch):
+        """Test that get_all_returns aligns tickers on time and skips failures."""
+        index = pd.date_range("2025-01-01", periods=4, freq="5min", tz="UTC")
+
+        def fetch(period, ticker):
+            if ticker == "SOL-USD":
+                return None
+            # Gold has no bar at the second timestamp
+            times = index.delete(1) if ticker == "GC=F" else index
+            return pd.Series(0.001, index=times)
+
+        monkeypatch.setattr(vc, "get_returns", fetch)
+        returns = vc.get_all_returns()
+
+        assert list(returns.columns) == ["BTC", "ETH", "XAU"]
+        assert returns.index.equals(index)
+        assert returns["XAU"].isna().sum() == 1
+        assert returns["BTC"].notna().all()
+
+
+class TestOnlineGetVolatility:
+    """Test suite for streaming estimation in get_volatility."""
+
+    def test_matches_full_frame_estimate(self, monkeypatch):
+        """Test that the streaming estimate equals the pandas one on the same bars."""
+        rng = np.random.default_rng(1)
+        index = pd.date_range("2025-01-01", periods=200, freq="5min", tz="UTC")
+        bars = pd.DataFrame({"Close": 100.0 * np.cumprod(1 + rng.normal(0, 0.002, 200))}, index=index)
+        monkeypatch.setattr(vc, "get_history", lambda time, ticker: bars)
+
+        vc.set_online_estimation(False)
+        # The streaming estimate leaves out the last, possibly still forming, bar
+        monkeypatch.setattr(vc, "get_history", lambda time, ticker: bars.iloc[:-1])
+        expected = vc.get_volatility("2d", "BTC-USD")
+        monkeypatch.setattr(vc, "get_history", lambda time, ticker: bars)
+
+        vc.set_online_estimation(window=576)
+        try:
+            vol, drift = vc.get_volatility("2d", "BTC-USD")
+            assert vol == pytest.approx(expected[0], rel=1e-10)
+            assert drift == pytest.approx(expected[1], rel=1e-10)
+        finally:
+            vc.set_online_estimation(False)
@@ -0,0 +1,85 @@
+"""
+Tests for the offline CRPS weight optimizer.
+"""
+
+import numpy as np
+import pytest
+
+from models.crps import CRPSCalculator
+from models.ensemble import weighted_combination
+from models.weight_optimizer import ComponentPathCache, simplex_grid, score_weights, optimize_weights
+from models.baseline.geometric_brownian import GeometricBrownianModel
+
+
+class TestWeightOptimizer:
+    """Test suite for the cached-path weight search."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        # A well-calibrated component and one that is far too volatile
+        self.models = {
+            "good": GeometricBrownianModel(drift=0.0, volatility=0.002),
+            "wide": GeometricBrownianModel(drift=0.0, volatility=0.02),
+        }
+        rng = np.random.default_rng(0)
+        self.prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.002, 97)))
+        self.cache = ComponentPathCache(self.models, num_simulations=50, seed=1)
+        self.cache.add_windows_from_prices(self.prices, num_points=25)
+
+    def test_simplex_grid(self):
+        """Test that grid rows are non-negative and sum to one."""
+        grid = simplex_grid(3, 0.25)
+        assert grid.shape == (15, 3)
+        np.testing.assert_allclose(grid.sum(axis=1), 1.0)
+        assert np.all(grid >= 0)
+
+    def test_scores_match_direct_crps(self):
+        """Test batched scoring against combining and scoring one window directly."""
+        assert len(self.cache) == 4
+        candidates = np.array([[0.3, 0.7], [1.0, 0.0]])
+        scores = score_weights(self.cache, candidates)
+
+        calculator = CRPSCalculator()
+        for candidate, score in zip(candidates, scores):
+            expected = np.mean([
+                calculator.calculate_crps_array(
+                    weighted_combination(dict(zip(self.cache.names, stack)), dict(zip(self.cache.names, candidate))),
+                    actual)
+                for stack, actual in self.cache.windows
+            ])
+            assert abs(score - expected) < 1e-9
+
+    def test_mixture_scores_pool_component_shares(self):
+        """Test that mixture candidates are scored on pooled paths, as served."""
+        candidates = np.array([[0.3, 0.7], [1.0, 0.0]])
+        scores = score_weights(self.cache, candidates, mode="mixture")
+
+        calculator = CRPSCalculator()
+        expected = np.mean([
+            calculator.calculate_crps_array(np.concatenate([stack[0, :15], stack[1, :35]]), actual)
+            for stack, actual in self.cache.windows
+        ])
+        assert abs(scores[0] - expected) < 1e-9
+        assert abs(scores[1] - score_weights(self.cache, candidates[1:])[0]) < 1e-9
+
+        with pytest.raises(ValueError):
+            score_weights(self.cache, candidates, mode="median")
+
+    @pytest.mark.parametrize("mode", ["average", "mixture"])
+    def test_optimizer_prefers_calibrated_component(self, mode):
+        """Test that the search puts most weight on the well-calibrated component."""
+        weights, score = optimize_weights(self.cache, step=0.1, refine_step=0.02, mode=mode)
+        assert abs(sum(weights.values()) - 1.0) < 1e-9
+        assert weights["good"] > weights["wide"]
+        assert score <= score_weights(self.cache, np.array([[0.5, 0.5]]), mode=mode)[0]
+
+    def test_save_and_load(self, tmp_path):
+        """Test that cached windows round-trip through npz."""
+        path = str(tmp_path / "windows.npz")
+        self.cache.save(path)
+
+        restored = ComponentPathCache(self.models)
+        assert restored.load(path) == 4
+        for (a, x), (b, y) in zip(self.cache.windows, restored.windows):
+            np.testing.assert_array_equal(a, b)
+            np.testing.assert_array_equal(x, y)